@@ -8,30 +8,63 @@ import sys
 import os
 import shutil
 
+def iter_dlls(folder):
+    """Yield .dll paths under a folder via os.scandir (no per-entry stat calls)"""
+    try:
+        entries = os.scandir(folder)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_dlls(entry.path)
+            elif entry.name.endswith('.dll'):
+                yield entry.path
+
+def _dll_cache_file():
+    return os.path.join("__pycache__", ".vgamepad_dll_path")
+
 def find_vgamepad_dlls():
-    """Find the vgamepad DLL files"""
+    """Find the vgamepad DLL files (cached across builds)"""
     try:
         import vgamepad
         vgamepad_path = os.path.dirname(vgamepad.__file__)
-        
+        cache_key = getattr(vgamepad, '__version__', 'unknown')
+
+        # Repeat builds skip the scan entirely
+        cache_file = _dll_cache_file()
+        try:
+            with open(cache_file, 'r') as f:
+                version, cached_path = f.read().split('\n', 1)
+            if version == cache_key and os.path.exists(cached_path.strip()):
+                print(f"[+] Using cached vgamepad path: {cached_path.strip()}")
+                return cached_path.strip()
+        except (OSError, ValueError):
+            pass
+
         # Find the DLL path
         dll_path = os.path.join(vgamepad_path, "win", "vigem", "client", "x64")
         dll_file = os.path.join(dll_path, "ViGEmClient.dll")
-        
+
         if os.path.exists(dll_file):
             print(f"[+] Found ViGEmClient.dll at: {dll_path}")
-            return vgamepad_path
         else:
             print(f"[!] DLL not found at expected path: {dll_file}")
-            
-            # Search for it
-            for root, dirs, files in os.walk(vgamepad_path):
-                for file in files:
-                    if file.endswith('.dll'):
-                        print(f"    Found: {os.path.join(root, file)}")
-            
-            return vgamepad_path
-            
+
+            # Search for it, stopping at the first hit
+            for path in iter_dlls(vgamepad_path):
+                print(f"    Found: {path}")
+                break
+
+        try:
+            os.makedirs("__pycache__", exist_ok=True)
+            with open(cache_file, 'w') as f:
+                f.write(f"{cache_key}\n{vgamepad_path}")
+        except OSError:
+            pass
+
+        return vgamepad_path
+
     except ImportError:
         print("[!] vgamepad not installed")
         return None
@@ -87,17 +120,27 @@ try:
 except:
     vgamepad_path = r"{vgamepad_path or ''}"
 
-# Collect vgamepad data files (DLLs)
+# Collect vgamepad data files (DLLs) via scandir, which avoids the extra
+# stat calls and list building that os.walk does on every build
+def _iter_dlls(folder):
+    try:
+        entries = os.scandir(folder)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_dlls(entry.path)
+            elif entry.name.endswith('.dll'):
+                yield entry.path
+
 vgamepad_datas = []
 if vgamepad_path and os.path.exists(vgamepad_path):
-    for root, dirs, files in os.walk(vgamepad_path):
-        for file in files:
-            if file.endswith('.dll'):
-                src = os.path.join(root, file)
-                # Get relative path from vgamepad folder
-                rel_dir = os.path.relpath(root, os.path.dirname(vgamepad_path))
-                vgamepad_datas.append((src, rel_dir))
-                print(f"Adding DLL: {{src}} -> {{rel_dir}}")
+    for src in _iter_dlls(vgamepad_path):
+        # Get relative path from vgamepad folder
+        rel_dir = os.path.relpath(os.path.dirname(src), os.path.dirname(vgamepad_path))
+        vgamepad_datas.append((src, rel_dir))
+        print(f"Adding DLL: {{src}} -> {{rel_dir}}")
 
 a = Analysis(
     ['run.py'],
@@ -106,46 +149,57 @@ a = Analysis(
     datas=[
         ('wizard101_bot', 'wizard101_bot'),
     ],
+    # Only modules PyInstaller cannot discover statically: vgamepad loads its
+    # win submodules dynamically, customtkinter ships theme assets. cv2/numpy/
+    # PIL/tkinter/ctypes are imported directly and found by analysis.
     hiddenimports=[
         'vgamepad',
         'vgamepad.win',
         'vgamepad.win.virtual_gamepad',
         'vgamepad.win.vigem_client',
-        'cv2',
-        'numpy',
-        'PIL',
-        'PIL.Image',
-        'PIL.ImageGrab',
         'customtkinter',
-        'tkinter',
-        'ctypes',
     ],
     hookspath=[],
     hooksconfig={{}},
     runtime_hooks=[],
-    excludes=[],
+    # Large transitive baggage the app never uses at runtime
+    excludes=[
+        'matplotlib',
+        'scipy',
+        'pandas',
+        'notebook',
+        'IPython',
+        'sqlite3',
+        'unittest',
+        'pydoc_data',
+        'lib2to3',
+        'xmlrpc',
+        'tkinter.test',
+        'numpy.distutils',
+        'numpy.tests',
+        'PIL.ImageQt',
+    ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
     noarchive=False,
+    optimize=2,
 )
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
+# One-dir build: no temp-dir extraction on every launch, so cold start is
+# bounded by DLL loads instead of unpacking the whole bundle
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='Wizard101BotSuite',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
     upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -155,6 +209,24 @@ exe = EXE(
     icon='wizard_bot.ico' if os.path.exists('wizard_bot.ico') else None,
     uac_admin=True,
 )
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx=True,
+    # Compressing these DLLs is known to cause AV false positives or
+    # flaky loads; ship them as-is
+    upx_exclude=[
+        'vcruntime140.dll',
+        'python3*.dll',
+        'Qt*Core.dll',
+        'ViGEmClient.dll',
+    ],
+    name='Wizard101BotSuite',
+)
 '''
     
     with open('Wizard101BotSuite.spec', 'w') as f:
@@ -189,22 +261,24 @@ def build_exe():
     result = subprocess.run(cmd)
     
     if result.returncode == 0:
+        app_dir = os.path.join("dist", "Wizard101BotSuite")
+
         print("\n" + "="*60)
         print("[+] BUILD SUCCESSFUL!")
-        print("[+] Executable: dist/Wizard101BotSuite.exe")
+        print(f"[+] Executable: {os.path.join(app_dir, 'Wizard101BotSuite.exe')}")
         print("="*60)
-        
+
         # Copy images folder if exists
         if os.path.exists("images"):
-            dist_images = os.path.join("dist", "images")
+            dist_images = os.path.join(app_dir, "images")
             if not os.path.exists(dist_images):
                 shutil.copytree("images", dist_images)
-                print("[+] Copied images folder to dist/")
-        
+                print("[+] Copied images folder to app dir")
+
         # Copy config if exists
         if os.path.exists("config.json"):
-            shutil.copy("config.json", os.path.join("dist", "config.json"))
-            print("[+] Copied config.json to dist/")
+            shutil.copy("config.json", os.path.join(app_dir, "config.json"))
+            print("[+] Copied config.json to app dir")
         
         return True
     else:
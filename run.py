@@ -16,27 +16,72 @@ required_packages = [
     'Pillow'
 ]
 
-missing = []
-for pkg in required_packages:
+
+def _dep_cache_path() -> str:
+    cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "wizard101_bot")
+    return os.path.join(cache_dir, "deps.ok")
+
+
+def _dep_cache_key() -> str:
+    # Re-probe when the interpreter or this launcher changes
+    mtime = int(os.path.getmtime(os.path.abspath(__file__)))
+    return f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}:{mtime}"
+
+
+def check_dependencies():
+    """Probe required packages, memoized across launches"""
+    # Frozen EXE bundles its dependencies; probing just pays their import cost
+    if getattr(sys, 'frozen', False):
+        return
+
+    cache_path = _dep_cache_path()
+    cache_key = _dep_cache_key()
+    try:
+        with open(cache_path, 'r') as f:
+            if f.read().strip() == cache_key:
+                return
+    except OSError:
+        pass
+
+    missing = []
+    for pkg in required_packages:
+        try:
+            pkg_name = pkg.replace('-', '_').split('[')[0]
+            if pkg_name == 'opencv_python':
+                pkg_name = 'cv2'
+            elif pkg_name == 'Pillow':
+                pkg_name = 'PIL'
+            __import__(pkg_name)
+        except ImportError:
+            missing.append(pkg)
+
+    if missing:
+        print("Missing required packages:")
+        for pkg in missing:
+            print(f"  - {pkg}")
+        print()
+        print("Install with:")
+        print(f"  pip install {' '.join(missing)}")
+        sys.exit(1)
+
     try:
-        pkg_name = pkg.replace('-', '_').split('[')[0]
-        if pkg_name == 'opencv_python':
-            pkg_name = 'cv2'
-        elif pkg_name == 'Pillow':
-            pkg_name = 'PIL'
-        __import__(pkg_name)
-    except ImportError:
-        missing.append(pkg)
-
-if missing:
-    print("Missing required packages:")
-    for pkg in missing:
-        print(f"  - {pkg}")
-    print()
-    print("Install with:")
-    print(f"  pip install {' '.join(missing)}")
-    sys.exit(1)
-
-# Run application
-from wizard101_bot.main import main
-main()
\ No newline at end of file
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'w') as f:
+            f.write(cache_key)
+    except OSError:
+        pass
+
+
+# The __main__ guard matters beyond convention: the updater extracts
+# large archives through a ProcessPoolExecutor, and on Windows spawned
+# workers re-import __main__ — without the guard each worker would
+# launch a whole new GUI instead of extracting
+if __name__ == "__main__":
+    import multiprocessing
+    multiprocessing.freeze_support()
+
+    check_dependencies()
+
+    # Run application
+    from wizard101_bot.main import main
+    main()
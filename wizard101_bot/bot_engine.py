@@ -3,17 +3,58 @@ Bot Engine - Core automation logic
 Fixed enchant detection and casting
 """
 
+from __future__ import annotations
+
+import logging
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Callable, Tuple, List
 from enum import Enum, auto
 
 from .config import config
-from .input_handler import input_handler
-from .image_recognition import image_recognition, CardType, CardMatch
-from .controller_emulator import controller
-from .mana_detection import mana_detector, ManaStatus
-from .mana_refill import mana_refill
+
+# The detection/input stack drags in cv2, numpy and PIL; importing it here
+# would make every GUI launch pay that cost before a window can show.
+# _import_heavy() loads it on first bot start instead.
+_heavy_imported = False
+
+
+def _import_heavy():
+    """Import the heavy detection/input modules on first use"""
+    global _heavy_imported
+    global input_handler, image_recognition, CardType, CardMatch
+    global controller, mana_detector, ManaStatus, mana_refill
+    global screen_capture, FrameWatcher
+
+    if _heavy_imported:
+        return
+
+    from .input_handler import input_handler
+    from .image_recognition import image_recognition, CardType, CardMatch
+    from .controller_emulator import controller
+    from .mana_detection import mana_detector, ManaStatus
+    from .mana_refill import mana_refill
+    from .screen_capture import screen_capture, FrameWatcher
+
+    _heavy_imported = True
+
+_LOG_FORMATTER = logging.Formatter("[%(asctime)s] %(message)s", datefmt="%H:%M:%S")
+
+
+class _CallbackHandler(logging.Handler):
+    """Feeds formatted log records to the GUI log callback"""
+
+    def __init__(self, callback: Callable[[str], None]):
+        super().__init__()
+        self._callback = callback
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self._callback(self.format(record))
+        except Exception:
+            self.handleError(record)
+
 
 class BotMode(Enum):
     SIMPLE = auto()
@@ -27,62 +68,133 @@ class BotState(Enum):
 
 class BotEngine:
     """Main bot automation engine"""
-    
+
+    __slots__ = (
+        'mode', 'state', 'movement_enabled', '_thread', '_cond', '_run_state',
+        '_logger', '_gui_handler', '_state_callback', 'cycle_count',
+        'successful_casts', '_current_slot', '_scan_cache', '_frame_watcher',
+        '_debug_mode', '_kp_duration', '_kp_delay', '_scan_interval',
+        '_detect_interval', '_post_cast_wait', '_confidence', '_ws_repeats',
+        '_hold_duration',
+    )
+
     def __init__(self):
         self.mode: BotMode = BotMode.SIMPLE
         self.state: BotState = BotState.STOPPED
         self.movement_enabled: bool = True
         
         self._thread: Optional[threading.Thread] = None
-        self._stop_event = threading.Event()
-        self._pause_event = threading.Event()
-        self._pause_event.set()
-        
-        self._log_callback: Optional[Callable[[str], None]] = None
+
+        # Single condition-guarded run state (RUNNING/PAUSED/STOPPED) instead
+        # of separate stop/pause events checked all over the helpers
+        self._cond = threading.Condition()
+        self._run_state = BotState.STOPPED
+        
+        # Lazy %-style logging: debug records cost nothing to skip while
+        # debug_mode is off, and the GUI attaches as a handler
+        self._logger = logging.getLogger("wizard101_bot.engine")
+        self._logger.propagate = False
+        if not self._logger.handlers:
+            console = logging.StreamHandler()
+            console.setFormatter(_LOG_FORMATTER)
+            self._logger.addHandler(console)
+        self._gui_handler: Optional[logging.Handler] = None
+
         self._state_callback: Optional[Callable[[BotState], None]] = None
         
         self.cycle_count: int = 0
         self.successful_casts: int = 0
         self._current_slot: int = 0
-        
-        # Debug mode
-        self.debug_mode: bool = True
-    
+
+        # Short-lived scan cache: (monotonic timestamp, frame hash, result tuple)
+        self._scan_cache: Optional[Tuple[float, int, tuple]] = None
+
+        # Signals changed frames so detection waits can block instead of poll;
+        # created on first start so __init__ stays import-light
+        self._frame_watcher = None
+
+        self._snapshot_config()
+
+        # Debug mode (the setter keeps the logger level in sync)
+        self._debug_mode = True
+        self.debug_mode = True
+
+    def _snapshot_config(self):
+        """
+        Bind the hot config fields to instance slots once per cycle.
+        Each dotted config access is a chain of attribute lookups in CPython,
+        and these are read on every key press and scan; the snapshot also
+        means config edits from the UI apply at a cycle boundary, not mid-cast.
+        """
+        timing = config.timing
+        self._kp_duration = timing.key_press_duration
+        self._kp_delay = timing.key_press_delay
+        self._scan_interval = timing.scan_interval
+        self._detect_interval = timing.early_detect_interval
+        self._post_cast_wait = timing.post_cast_wait
+        self._confidence = config.images.confidence
+        self._ws_repeats = config.movement.ws_repeats
+        self._hold_duration = config.movement.hold_duration
+
+    @property
+    def debug_mode(self) -> bool:
+        return self._debug_mode
+
+    @debug_mode.setter
+    def debug_mode(self, enabled: bool):
+        self._debug_mode = bool(enabled)
+        self._logger.setLevel(logging.DEBUG if self._debug_mode else logging.INFO)
+
     def set_log_callback(self, callback: Callable[[str], None]):
-        self._log_callback = callback
-    
+        if self._gui_handler is not None:
+            self._logger.removeHandler(self._gui_handler)
+        self._gui_handler = _CallbackHandler(callback)
+        self._gui_handler.setFormatter(_LOG_FORMATTER)
+        self._logger.addHandler(self._gui_handler)
+
     def set_state_callback(self, callback: Callable[[BotState], None]):
         self._state_callback = callback
-    
+
     def _log(self, message: str):
-        timestamp = time.strftime("%H:%M:%S")
-        full_message = f"[{timestamp}] {message}"
-        print(full_message)
-        if self._log_callback:
-            self._log_callback(full_message)
+        self._logger.info("%s", message)
     
     def _set_state(self, state: BotState):
         self.state = state
         if self._state_callback:
             self._state_callback(state)
     
-    def _wait_while_paused(self):
-        self._pause_event.wait()
-    
+    def _yield_control(self) -> bool:
+        """
+        Single pause/stop checkpoint: blocks while paused and returns False
+        once a stop was requested.
+        """
+        with self._cond:
+            while self._run_state == BotState.PAUSED:
+                self._cond.wait()
+            return self._run_state != BotState.STOPPED
+
     def _is_stopped(self) -> bool:
-        return self._stop_event.is_set()
+        return self._run_state == BotState.STOPPED
     
     def _check_mana(self) -> ManaStatus:
-        status = mana_detector.check_status()
-        
+        # The background poller keeps this slot fresh; reading it costs
+        # nothing, where check_status would block the cycle on a screen
+        # grab plus template matches
+        status = mana_detector.latest()
+
         if mana_refill.should_refill(status.is_zero, status.is_low):
             self._log("[!] Mana refill triggered")
             mana_refill.execute(stop_check=self._is_stopped)
-        
+            # The refill changed what is on screen; drop the memoized
+            # frame and the pre-refill status so its zero cannot
+            # immediately re-trigger
+            mana_detector.invalidate_capture()
+            mana_detector.reset_latest()
+
         return status
     
     def _check_still_there(self) -> bool:
-        if image_recognition.is_visible("still_there", config.images.confidence):
+        if image_recognition.is_visible("still_there", self._confidence):
             self._log("[!] 'Still there?' prompt detected")
             self._handle_still_there()
             return True
@@ -95,7 +207,7 @@ class BotEngine:
             controller.disconnect()
             time.sleep(0.5)
         
-        match = image_recognition.find_template("still_there", config.images.confidence)
+        match = image_recognition.find_template("still_there", self._confidence)
         if match:
             cx, cy = match.center
             input_handler.mouse_click('left', cx, cy + 50)
@@ -106,16 +218,15 @@ class BotEngine:
             controller.connect()
     
     def _press_key(self, key: str, hold_time: Optional[float] = None):
-        self._wait_while_paused()
-        if self._is_stopped():
+        if not self._yield_control():
             return
-        
+
         if hold_time:
             input_handler.hold_key(key, hold_time)
         else:
-            input_handler.press_key(key, config.timing.key_press_duration)
-        
-        time.sleep(config.timing.key_press_delay)
+            input_handler.press_key(key, self._kp_duration)
+
+        time.sleep(self._kp_delay)
     
     def _select_card(self):
         """Press the card selection key"""
@@ -129,15 +240,21 @@ class BotEngine:
     
     def _navigate_right(self, times: int = 1):
         """Navigate right in card hand"""
-        for _ in range(times):
-            self._press_key(config.bot_keys.navigate_right)
-            time.sleep(0.15)
-    
+        self._navigate_sequence(config.bot_keys.navigate_right, times)
+
     def _navigate_left(self, times: int = 1):
         """Navigate left in card hand"""
-        for _ in range(times):
-            self._press_key(config.bot_keys.navigate_left)
-            time.sleep(0.15)
+        self._navigate_sequence(config.bot_keys.navigate_left, times)
+
+    def _navigate_sequence(self, key: str, times: int):
+        """Send a whole navigation chain as one prebuilt key sequence"""
+        if not self._yield_control():
+            return
+        input_handler.press_keys_sequence(
+            [key] * times,
+            hold_time=self._kp_duration,
+            gap_time=self._kp_delay + 0.15
+        )
     
     def _navigate_to_slot(self, target_slot: int):
         if target_slot == self._current_slot:
@@ -153,34 +270,60 @@ class BotEngine:
         
         self._current_slot = target_slot
     
-    def _find_all_cards(self) -> Tuple[List[CardMatch], List[CardMatch], List[CardMatch]]:
+    def _find_all_cards(self, screen=None) -> Tuple[List[CardMatch], List[CardMatch], List[CardMatch]]:
         """
         Find all cards and categorize them.
+        Results are memoized for slightly under one early_detect_interval so the
+        polling loops don't re-run template matching on an unchanged frame.
         Returns: (enchant_cards, spell_cards, enchanted_cards)
         """
-        all_cards = image_recognition.find_cards(config.images.confidence)
-        
-        enchant_cards = []
-        spell_cards = []
-        enchanted_cards = []
-        
+        if screen is None:
+            screen = image_recognition.capture_screen()
+        frame_hash = image_recognition.frame_hash(screen)
+        now = time.monotonic()
+        ttl = self._detect_interval * 0.9
+
+        if self._scan_cache is not None:
+            cached_time, cached_hash, cached_result = self._scan_cache
+            if now - cached_time < ttl and cached_hash == frame_hash:
+                return cached_result
+
+        all_cards = image_recognition.find_cards(self._confidence, screen=screen)
+
+        # One dict lookup + append per card instead of a chain of enum
+        # comparisons; UNKNOWN cards fall through to no bucket
+        buckets: dict = {
+            CardType.ENCHANT: [],
+            CardType.SPELL: [],
+            CardType.ENCHANTED_SPELL: [],
+        }
         for card in all_cards:
-            if card.card_type == CardType.ENCHANT:
-                enchant_cards.append(card)
-            elif card.card_type == CardType.SPELL:
-                spell_cards.append(card)
-            elif card.card_type == CardType.ENCHANTED_SPELL:
-                enchanted_cards.append(card)
-        
-        if self.debug_mode:
-            self._log(f"[DEBUG] Found {len(all_cards)} total cards:")
-            self._log(f"    Enchants: {len(enchant_cards)}")
-            self._log(f"    Spells: {len(spell_cards)}")
-            self._log(f"    Enchanted: {len(enchanted_cards)}")
-            for card in all_cards:
-                self._log(f"    - {card.name} ({card.card_type.name}) x={card.x} conf={card.confidence:.2f}")
-        
-        return enchant_cards, spell_cards, enchanted_cards
+            bucket = buckets.get(card.card_type)
+            if bucket is not None:
+                bucket.append(card)
+
+        enchant_cards = buckets[CardType.ENCHANT]
+        spell_cards = buckets[CardType.SPELL]
+        enchanted_cards = buckets[CardType.ENCHANTED_SPELL]
+
+        if self._logger.isEnabledFor(logging.DEBUG):
+            # Single joined message: one timestamp/print/callback instead of
+            # one per card
+            lines = [
+                f"[DEBUG] Found {len(all_cards)} total cards:",
+                f"    Enchants: {len(enchant_cards)}",
+                f"    Spells: {len(spell_cards)}",
+                f"    Enchanted: {len(enchanted_cards)}",
+            ]
+            lines.extend(
+                f"    - {card.name} ({card.card_type.name}) x={card.x} conf={card.confidence:.2f}"
+                for card in all_cards
+            )
+            self._logger.debug("%s", "\n".join(lines))
+
+        result = (enchant_cards, spell_cards, enchanted_cards)
+        self._scan_cache = (now, frame_hash, result)
+        return result
     
     def _click_card_by_position(self, card: CardMatch):
         """Click directly on a card by its screen position"""
@@ -191,49 +334,74 @@ class BotEngine:
     
     def _wait_with_detection(self, seconds: float, message: str) -> Tuple[bool, bool]:
         self._log(f"{message} for {seconds}s...")
-        
-        elapsed = 0
-        interval = config.timing.early_detect_interval
-        
-        while elapsed < seconds:
-            if self._is_stopped():
+
+        deadline = time.monotonic() + seconds
+        interval = self._detect_interval
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return True, False
+
+            if not self._yield_control():
                 return False, False
-            
-            self._wait_while_paused()
+
+            # Block until the screen changes; a static frame has nothing new
+            frame = self._frame_watcher.wait_for_frame(min(interval, remaining))
+            if frame is None:
+                continue
+
             self._check_still_there()
-            
-            # Check for any cards
-            enchant_cards, spell_cards, enchanted_cards = self._find_all_cards()
+
+            # Check for any cards on the changed frame
+            enchant_cards, spell_cards, enchanted_cards = self._find_all_cards(screen=frame)
             if spell_cards or enchanted_cards:
+                elapsed = seconds - max(deadline - time.monotonic(), 0)
                 self._log(f"[!] Card detected early at {elapsed:.1f}s!")
                 return True, True
-            
-            time.sleep(interval)
-            elapsed += interval
-        
-        return True, False
     
+    def _wait_until(self, predicate, timeout: float, interval: float = 0.05) -> bool:
+        """
+        Block until predicate(frame) is true or the timeout expires.
+        Only evaluates the predicate on actual frame changes, so a static
+        screen costs nothing while a fast game lets us move on early.
+        """
+        deadline = time.monotonic() + timeout
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+
+            if not self._yield_control():
+                return False
+
+            frame = self._frame_watcher.wait_for_frame(min(interval, remaining))
+            if frame is None:
+                continue
+
+            if predicate(frame):
+                return True
+
     def _do_movement(self) -> bool:
         if not self.movement_enabled:
             return False
         
-        self._log(f"[~] W/S movement ({config.movement.ws_repeats}x)")
-        
-        for i in range(config.movement.ws_repeats):
-            if self._is_stopped():
+        self._log(f"[~] W/S movement ({self._ws_repeats}x)")
+
+        for i in range(self._ws_repeats):
+            if not self._yield_control():
                 return False
-            
-            self._wait_while_paused()
-            
+
             # Check for cards
             enchant_cards, spell_cards, enchanted_cards = self._find_all_cards()
             if spell_cards or enchanted_cards or enchant_cards:
                 self._log("[!] Card detected during movement")
                 return True
             
-            input_handler.hold_key('w', config.movement.hold_duration)
+            input_handler.hold_key('w', self._hold_duration)
             time.sleep(0.1)
-            input_handler.hold_key('s', config.movement.hold_duration)
+            input_handler.hold_key('s', self._hold_duration)
             time.sleep(0.2)
         
         return False
@@ -241,9 +409,8 @@ class BotEngine:
     def _run_simple_mode(self):
         """Simple mode: Just cast spell cards"""
         self._log("[*] Simple mode: Looking for spell cards...")
-        
-        while not self._is_stopped():
-            self._wait_while_paused()
+
+        while self._yield_control():
             self._check_mana()
             
             if self._check_still_there():
@@ -271,7 +438,7 @@ class BotEngine:
                 mana_refill.update_action_time()
                 
                 completed, early = self._wait_with_detection(
-                    config.timing.post_cast_wait,
+                    self._post_cast_wait,
                     "[*] Waiting for animation"
                 )
                 
@@ -283,7 +450,7 @@ class BotEngine:
                 
                 continue
             
-            time.sleep(config.timing.scan_interval)
+            time.sleep(self._scan_interval)
     
     def _run_advanced_mode(self):
         """
@@ -295,9 +462,8 @@ class BotEngine:
         3. If only spell exists -> cast it (no enchant available)
         """
         self._log("[*] Advanced mode: Looking for enchant + spell...")
-        
-        while not self._is_stopped():
-            self._wait_while_paused()
+
+        while self._yield_control():
             self._check_mana()
             
             if self._check_still_there():
@@ -326,7 +492,7 @@ class BotEngine:
                 
                 # Wait for battle animation
                 completed, early = self._wait_with_detection(
-                    config.timing.post_cast_wait,
+                    self._post_cast_wait,
                     "[*] Waiting for animation"
                 )
                 
@@ -352,19 +518,29 @@ class BotEngine:
                 # Step 1: Click the enchant card (Colossal)
                 self._log(f"    Step 1: Clicking enchant at ({enchant.center[0]}, {enchant.center[1]})")
                 self._click_card_by_position(enchant)
-                
-                # Wait for enchant mode to activate
-                time.sleep(0.8)
-                
+
+                # Wait for enchant mode to activate: the hand re-renders, so
+                # block until a changed frame shows a targetable spell instead
+                # of sleeping a fixed 0.8s
+                self._wait_until(
+                    lambda frame: bool(self._find_all_cards(screen=frame)[1]),
+                    0.8
+                )
+
                 # Step 2: Re-scan for the spell card (position may have changed)
                 self._log("    Step 2: Re-scanning for spell card...")
                 _, new_spell_cards, _ = self._find_all_cards()
-                
+
                 if new_spell_cards:
                     spell = new_spell_cards[0]
                     self._log(f"    Step 3: Clicking spell at ({spell.center[0]}, {spell.center[1]})")
                     self._click_card_by_position(spell)
-                    time.sleep(0.5)
+
+                    def _enchant_applied(frame) -> bool:
+                        _, spells, enchanted = self._find_all_cards(screen=frame)
+                        return bool(enchanted) or not spells
+
+                    self._wait_until(_enchant_applied, 0.5)
                     self._log("[+] Enchant applied! Waiting for next turn...")
                 else:
                     self._log("[!] Lost spell card after enchant selection, retrying...")
@@ -391,7 +567,7 @@ class BotEngine:
                 mana_refill.update_action_time()
                 
                 completed, early = self._wait_with_detection(
-                    config.timing.post_cast_wait,
+                    self._post_cast_wait,
                     "[*] Waiting for animation"
                 )
                 
@@ -404,39 +580,54 @@ class BotEngine:
                 continue
             
             # Nothing found, wait and scan again
-            if self.debug_mode and not (enchant_cards or spell_cards or enchanted_cards):
-                self._log("[*] No cards detected, waiting...")
+            if not (enchant_cards or spell_cards or enchanted_cards):
+                self._logger.debug("[*] No cards detected, waiting...")
             
-            time.sleep(config.timing.scan_interval)
+            time.sleep(self._scan_interval)
     
     def _run_loop(self):
+        _import_heavy()
+        if self._frame_watcher is None:
+            self._frame_watcher = FrameWatcher(screen_capture)
+
         self._set_state(BotState.RUNNING)
         self.cycle_count = 0
         self._current_slot = 0
         
         # Load templates
         self._log("[*] Loading card templates...")
-        
-        # Load card templates with their types
-        loaded = 0
-        if image_recognition.load_card_template("tempest", config.images.tempest_image, CardType.SPELL):
-            loaded += 1
-        if image_recognition.load_card_template("colossal", config.images.colossal_image, CardType.ENCHANT):
-            loaded += 1
-        if image_recognition.load_card_template("tempest_enchanted", config.images.tempest_enchanted_image, CardType.ENCHANTED_SPELL):
-            loaded += 1
-        
-        # Load UI templates
-        image_recognition.load_template("still_there", config.images.still_there_prompt)
-        mana_detector.load_templates()
+
+        # The loads are independent disk reads + cv2.imread decodes (both
+        # release the GIL), so run them concurrently instead of serially
+        card_jobs = [
+            ("tempest", config.images.tempest_image, CardType.SPELL),
+            ("colossal", config.images.colossal_image, CardType.ENCHANT),
+            ("tempest_enchanted", config.images.tempest_enchanted_image, CardType.ENCHANTED_SPELL),
+        ]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            card_futures = [
+                pool.submit(image_recognition.load_card_template, name, filename, card_type)
+                for name, filename, card_type in card_jobs
+            ]
+            ui_future = pool.submit(image_recognition.load_template,
+                                    "still_there", config.images.still_there_prompt)
+            mana_future = pool.submit(mana_detector.load_templates)
+
+            loaded = sum(1 for f in card_futures if f.result())
+            ui_future.result()
+            mana_future.result()
         
         self._log(f"[*] Loaded {loaded} card templates")
         
         if loaded == 0:
             self._log("[!] WARNING: No card templates loaded! Check your images folder.")
-        
+
+        self._frame_watcher.start()
+        mana_detector.start_background()
+
         try:
-            while not self._is_stopped():
+            while self._yield_control():
+                self._snapshot_config()
                 self.cycle_count += 1
                 self._log(f"\n===== CYCLE {self.cycle_count} =====")
                 
@@ -449,38 +640,46 @@ class BotEngine:
             self._log(f"[X] Error: {e}")
             import traceback
             traceback.print_exc()
-        
+
+        mana_detector.stop_background()
+        self._frame_watcher.stop()
         self._set_state(BotState.STOPPED)
         self._log("[*] Bot stopped")
     
     def start(self, mode: BotMode = BotMode.SIMPLE):
         if self.state == BotState.RUNNING:
             return
-        
+
         self.mode = mode
-        self._stop_event.clear()
-        self._pause_event.set()
-        
+        with self._cond:
+            self._run_state = BotState.RUNNING
+
         self._log(f"[*] Starting bot in {mode.name} mode")
-        
+
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
         self._thread.start()
-    
+
     def stop(self):
         self._log("[X] Stopping bot...")
-        self._stop_event.set()
-        self._pause_event.set()
-        
+        with self._cond:
+            self._run_state = BotState.STOPPED
+            self._cond.notify_all()
+
         if self._thread:
             self._thread.join(timeout=2)
-    
+
     def pause(self):
-        self._pause_event.clear()
+        with self._cond:
+            if self._run_state == BotState.RUNNING:
+                self._run_state = BotState.PAUSED
         self._set_state(BotState.PAUSED)
         self._log("[||] Paused")
-    
+
     def resume(self):
-        self._pause_event.set()
+        with self._cond:
+            if self._run_state == BotState.PAUSED:
+                self._run_state = BotState.RUNNING
+            self._cond.notify_all()
         self._set_state(BotState.RUNNING)
         self._log("[>] Resumed")
     
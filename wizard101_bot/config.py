@@ -4,11 +4,43 @@ Configuration management for the Wizard101 Bot Suite
 
 import json
 import os
-from dataclasses import dataclass, field, asdict
+import threading
+from array import array
+from dataclasses import dataclass, field, fields, asdict, is_dataclass
+from functools import cached_property, lru_cache
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 CONFIG_FILE = "config.json"
 
+
+@lru_cache(maxsize=None)
+def _dataclass_fields(cls):
+    """Field reflection is paid once per class, not once per load"""
+    return fields(cls)
+
+
+def _from_dict(cls, data: dict):
+    """
+    Build a dataclass from a plain dict, recursing into dataclass-typed
+    fields. Unknown keys are ignored and missing keys keep their defaults,
+    so old config.json files keep loading as the schema grows.
+    """
+    kwargs = {}
+    for f in _dataclass_fields(cls):
+        if f.name not in data:
+            continue
+        value = data[f.name]
+        if is_dataclass(f.type) and isinstance(value, dict):
+            value = _from_dict(f.type, value)
+        kwargs[f.name] = value
+    return cls(**kwargs)
+
 @dataclass
 class TimingConfig:
     """Timing settings"""
@@ -60,6 +92,10 @@ class ImageConfig:
     folder: str = "images"
     confidence: float = 0.8
     high_confidence: float = 0.95
+
+    # Optional card-hand region of interest as [left, top, width, height].
+    # None searches the full screen.
+    card_roi: Optional[List[int]] = None
     
     # Card images
     tempest_image: str = "tempest.png"
@@ -198,10 +234,52 @@ class AppConfig:
         {"action": "stick_forward", "value": "", "duration": 2.0, "repeat": 1},
     ])
     
+    # Monotonic edit counter, bumped whenever a save writes changes. Not a
+    # dataclass field, so it never lands in config.json. Consumers cache
+    # derived views keyed on this and refresh only when it moves.
+    version = 0
+
+    @cached_property
+    def combo_soa(self):
+        """
+        mana_refill_combo flattened into parallel sequences (struct-of-
+        arrays): (actions, values, durations, repeats). Executors index by
+        position instead of doing four dict lookups per step, and the numeric
+        columns sit in compact C arrays. Built once; save() invalidates it.
+        Stdlib array keeps this module free of heavy imports.
+        """
+        steps = self.mana_refill_combo
+        actions = tuple(step.get('action', '') for step in steps)
+        values = tuple(step.get('value', '') for step in steps)
+        durations = array('f', (float(step.get('duration', 0.1)) for step in steps))
+        repeats = array('i', (int(step.get('repeat', 1)) for step in steps))
+        return actions, values, durations, repeats
+
     def save(self, filepath: str = CONFIG_FILE):
-        """Save configuration to JSON file"""
-        with open(filepath, 'w') as f:
-            json.dump(asdict(self), f, indent=2)
+        """Save configuration to JSON file (skipped when nothing changed)"""
+        # The combo may have been edited in place; rebuild its SoA view on
+        # next access
+        self.__dict__.pop('combo_soa', None)
+        data = asdict(self)
+        if ORJSON_AVAILABLE:
+            # C-native encoder: markedly faster for the big combo list
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2).encode()
+
+        # "Open settings, hit save" with no edits shouldn't touch the disk
+        digest = hash(payload)
+        if digest == self.__dict__.get('_saved_digest'):
+            return
+
+        self.version += 1
+
+        # Temp name + os.replace so a crash never truncates config.json
+        tmp = filepath + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp, filepath)
+        self.__dict__['_saved_digest'] = digest
     
     @classmethod
     def load(cls, filepath: str = CONFIG_FILE) -> 'AppConfig':
@@ -212,25 +290,31 @@ class AppConfig:
             return config
         
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-            
-            return cls(
-                timing=TimingConfig(**data.get('timing', {})),
-                movement=MovementConfig(**data.get('movement', {})),
-                mana_refill=ManaRefillConfig(**data.get('mana_refill', {})),
-                images=ImageConfig(**data.get('images', {})),
-                controller=ControllerBindings(**data.get('controller', {})),
-                bot_keys=BotKeysConfig(**data.get('bot_keys', {})),
-                hotkeys=HotkeyConfig(**data.get('hotkeys', {})),
-                window=WindowConfig(**data.get('window', {})),
-                mode=data.get('mode', 'simple'),
-                use_coordinate_detection=data.get('use_coordinate_detection', False),
-                mana_refill_combo=data.get('mana_refill_combo', cls().mana_refill_combo)
-            )
+            if ORJSON_AVAILABLE:
+                with open(filepath, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(filepath, 'r') as f:
+                    data = json.load(f)
+
+            return _from_dict(cls, data)
         except Exception as e:
             print(f"[!] Error loading config: {e}, using defaults")
             return cls()
 
-# Global config instance
-config = AppConfig.load()
\ No newline at end of file
+# Global config instance, loaded on a background thread so the disk read and
+# JSON parse overlap the rest of package import; the first access to
+# `config` joins the thread (PEP 562 module __getattr__) and caches the
+# instance as a plain module global.
+_config_holder: List[AppConfig] = []
+_config_thread = threading.Thread(
+    target=lambda: _config_holder.append(AppConfig.load()), daemon=True)
+_config_thread.start()
+
+
+def __getattr__(name):
+    if name == 'config':
+        _config_thread.join()
+        globals()['config'] = _config_holder[0]
+        return _config_holder[0]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
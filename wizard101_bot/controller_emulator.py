@@ -3,16 +3,53 @@ Xbox Controller Emulation using ViGEmBus + vgamepad library
 With rapid step movement for consistency
 """
 
+import ctypes
+import heapq
 import threading
 import time
 from typing import Optional, Dict, Callable
 from enum import IntFlag
 
+# vgamepad is imported lazily: loading it pulls the ViGEmClient DLL in,
+# which is slow and only needed once a controller actually connects
+vg = None
+
+
+def _import_vgamepad() -> bool:
+    """Import vgamepad on first use. Returns True when available."""
+    global vg
+    if vg is None:
+        try:
+            import vgamepad
+            vg = vgamepad
+        except ImportError:
+            vg = False
+    return vg is not False
+
+# GetAsyncKeyState bound once with explicit signatures: the poll loop calls
+# it on every wakeup, and going through ctypes.windll plus per-call type
+# inference costs real time at that rate
 try:
-    import vgamepad as vg
-    VGAMEPAD_AVAILABLE = True
-except ImportError:
-    VGAMEPAD_AVAILABLE = False
+    _GetAsyncKeyState = ctypes.WinDLL('user32', use_last_error=True).GetAsyncKeyState
+    _GetAsyncKeyState.argtypes = [ctypes.c_int]
+    _GetAsyncKeyState.restype = ctypes.c_short
+except Exception:
+    _GetAsyncKeyState = None
+
+
+def precise_sleep(duration: float):
+    """
+    Sleep with sub-millisecond accuracy. time.sleep alone has ~0.5-1ms
+    jitter on Windows, which is visible against the 50ms step duration;
+    sleep coarsely until just before the deadline, then spin on
+    perf_counter for the remainder.
+    """
+    end = time.perf_counter() + duration
+    if duration > 2e-3:
+        time.sleep(duration - 1.5e-3)
+    while time.perf_counter() < end:
+        pass
+
 
 class XboxButton(IntFlag):
     """Xbox controller button flags"""
@@ -51,28 +88,150 @@ BUTTON_MAP = {
     'GUIDE': XboxButton.GUIDE,
 }
 
-class ControllerState:
-    def __init__(self):
-        self.buttons: int = 0
-        self.left_trigger: int = 0
-        self.right_trigger: int = 0
-        self.left_stick_x: int = 0
-        self.left_stick_y: int = 0
-        self.right_stick_x: int = 0
-        self.right_stick_y: int = 0
-    
+# (XboxButton mask, vg.XUSB_BUTTON) pairs used by _apply_state. Built once
+# on first use - vg itself is imported lazily - instead of reallocating the
+# 15-entry list and re-resolving the enum attributes on every apply (~200/s
+# while polling).
+_BUTTON_APPLY_MAP = None
+
+
+def _button_apply_map():
+    global _BUTTON_APPLY_MAP
+    if _BUTTON_APPLY_MAP is None:
+        _BUTTON_APPLY_MAP = (
+            (XboxButton.A, vg.XUSB_BUTTON.XUSB_GAMEPAD_A),
+            (XboxButton.B, vg.XUSB_BUTTON.XUSB_GAMEPAD_B),
+            (XboxButton.X, vg.XUSB_BUTTON.XUSB_GAMEPAD_X),
+            (XboxButton.Y, vg.XUSB_BUTTON.XUSB_GAMEPAD_Y),
+            (XboxButton.DPAD_UP, vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_UP),
+            (XboxButton.DPAD_DOWN, vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_DOWN),
+            (XboxButton.DPAD_LEFT, vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_LEFT),
+            (XboxButton.DPAD_RIGHT, vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_RIGHT),
+            (XboxButton.START, vg.XUSB_BUTTON.XUSB_GAMEPAD_START),
+            (XboxButton.BACK, vg.XUSB_BUTTON.XUSB_GAMEPAD_BACK),
+            (XboxButton.LEFT_THUMB, vg.XUSB_BUTTON.XUSB_GAMEPAD_LEFT_THUMB),
+            (XboxButton.RIGHT_THUMB, vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_THUMB),
+            (XboxButton.LEFT_SHOULDER, vg.XUSB_BUTTON.XUSB_GAMEPAD_LEFT_SHOULDER),
+            (XboxButton.RIGHT_SHOULDER, vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_SHOULDER),
+            (XboxButton.GUIDE, vg.XUSB_BUTTON.XUSB_GAMEPAD_GUIDE),
+        )
+    return _BUTTON_APPLY_MAP
+
+
+class ControllerState(ctypes.Structure):
+    """
+    Controller state packed into 12 contiguous bytes. The attribute names
+    are unchanged, but "did anything change" in _apply_state is now a
+    single bytes compare and reset/copy are memset/memmove instead of
+    seven attribute assignments.
+    """
+    __slots__ = ()  # all state lives in the packed _fields_
+    _fields_ = [
+        ('buttons', ctypes.c_uint16),
+        ('left_trigger', ctypes.c_uint8),
+        ('right_trigger', ctypes.c_uint8),
+        ('left_stick_x', ctypes.c_int16),
+        ('left_stick_y', ctypes.c_int16),
+        ('right_stick_x', ctypes.c_int16),
+        ('right_stick_y', ctypes.c_int16),
+    ]
+
     def reset(self):
-        self.buttons = 0
-        self.left_trigger = 0
-        self.right_trigger = 0
-        self.left_stick_x = 0
-        self.left_stick_y = 0
-        self.right_stick_x = 0
-        self.right_stick_y = 0
+        ctypes.memset(ctypes.byref(self), 0, ctypes.sizeof(self))
+
+    def copy_from(self, other: 'ControllerState'):
+        ctypes.memmove(ctypes.byref(self), ctypes.byref(other), ctypes.sizeof(self))
+
+class _InputHookThread(threading.Thread):
+    """
+    Low-level keyboard/mouse hooks (SetWindowsHookExW) that set an Event on
+    key transitions and mouse button clicks. Lets the poll loop sleep until
+    something actually happens instead of waking every 5ms. Mouse movement
+    is deliberately not hooked - only the button messages the triggers use.
+    """
+
+    _MOUSE_BUTTON_MSGS = (0x0201, 0x0202, 0x0204, 0x0205)  # L/R down+up
+
+    def __init__(self, dirty: threading.Event):
+        super().__init__(daemon=True)
+        self._dirty = dirty
+        self._thread_id = None
+        self.installed = False
+
+    def run(self):
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            user32 = ctypes.windll.user32
+            kernel32 = ctypes.windll.kernel32
+            self._thread_id = kernel32.GetCurrentThreadId()
+
+            HOOKPROC = ctypes.WINFUNCTYPE(
+                ctypes.c_long, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM)
+
+            def _key_proc(n_code, w_param, l_param):
+                if n_code >= 0:
+                    self._dirty.set()
+                return user32.CallNextHookEx(None, n_code, w_param, l_param)
+
+            def _mouse_proc(n_code, w_param, l_param):
+                if n_code >= 0 and w_param in self._MOUSE_BUTTON_MSGS:
+                    self._dirty.set()
+                return user32.CallNextHookEx(None, n_code, w_param, l_param)
+
+            # References must outlive the hooks or ctypes frees the thunks
+            self._procs = (HOOKPROC(_key_proc), HOOKPROC(_mouse_proc))
+
+            hooks = []
+            for hook_id, proc in ((13, self._procs[0]),   # WH_KEYBOARD_LL
+                                  (14, self._procs[1])):  # WH_MOUSE_LL
+                handle = user32.SetWindowsHookExW(hook_id, proc, None, 0)
+                if handle:
+                    hooks.append(handle)
+
+            if not hooks:
+                return
+
+            self.installed = True
+
+            # LL hooks only fire while this thread pumps messages
+            msg = wintypes.MSG()
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
+
+            for handle in hooks:
+                user32.UnhookWindowsHookEx(handle)
+        except Exception:
+            self.installed = False
+
+    def stop(self):
+        if self._thread_id:
+            try:
+                import ctypes
+                # WM_QUIT breaks the GetMessageW loop
+                ctypes.windll.user32.PostThreadMessageW(self._thread_id, 0x0012, 0, 0)
+            except Exception:
+                pass
+
 
 class ControllerEmulator:
     """Virtual Xbox Controller with rapid step movement"""
-    
+
+    # Rapid-step directions: (binding attribute, step-timer slot, axis slot,
+    # axis value). Axis slots: 0=left_x, 1=left_y, 2=right_x, 3=right_y
+    _STEP_DIRS = (
+        ('left_stick_up',     0, 1,  32767),
+        ('left_stick_down',   1, 1, -32768),
+        ('left_stick_left',   2, 0, -32768),
+        ('left_stick_right',  3, 0,  32767),
+        ('right_stick_up',    4, 3,  32767),
+        ('right_stick_down',  5, 3, -32768),
+        ('right_stick_left',  6, 2, -32768),
+        ('right_stick_right', 7, 2,  32767),
+    )
+
     def __init__(self):
         self.state = ControllerState()
         self._gamepad = None
@@ -80,6 +239,11 @@ class ControllerEmulator:
         self._polling = False
         self._poll_thread: Optional[threading.Thread] = None
         self._log_callback: Optional[Callable] = None
+        self._dirty = threading.Event()
+        self._hook_thread: Optional[_InputHookThread] = None
+        # Last state actually sent to ViGEm, for diffing in _apply_state
+        self._last_sent = ControllerState()
+        self._available_cache: Optional[bool] = None
         
         # Movement settings - rapid steps mode
         self.step_duration: float = 0.05  # How long each step lasts
@@ -95,21 +259,33 @@ class ControllerEmulator:
     
     @property
     def is_available(self) -> bool:
-        if not VGAMEPAD_AVAILABLE:
+        # Probed once: creating a VX360Gamepad allocates a kernel device
+        # handle through ViGEmBus, too expensive for UI code that polls this
+        if self._available_cache is None:
+            self._available_cache = self._probe_availability()
+        return self._available_cache
+
+    def _probe_availability(self) -> bool:
+        if not _import_vgamepad():
             return False
         try:
             test = vg.VX360Gamepad()
             del test
             return True
-        except:
+        except Exception:
             return False
+
+    def refresh_availability(self) -> bool:
+        """Re-probe the driver (e.g. after the user installs ViGEmBus)"""
+        self._available_cache = self._probe_availability()
+        return self._available_cache
     
     @property
     def is_enabled(self) -> bool:
         return self._enabled
     
     def connect(self) -> bool:
-        if not VGAMEPAD_AVAILABLE:
+        if not _import_vgamepad():
             print("[!] vgamepad not installed: pip install vgamepad")
             return False
         
@@ -117,7 +293,15 @@ class ControllerEmulator:
             self._gamepad = vg.VX360Gamepad()
             self._enabled = True
             self.state.reset()
+            self._last_sent.reset()  # Fresh pad starts neutral
             self._apply_state()
+            # 1ms OS timer resolution so the coarse part of precise_sleep
+            # lands close to its deadline
+            try:
+                import ctypes
+                ctypes.windll.winmm.timeBeginPeriod(1)
+            except Exception:
+                pass
             print("[+] Virtual Xbox controller connected!")
             return True
         except Exception as e:
@@ -132,10 +316,16 @@ class ControllerEmulator:
                 self._gamepad.reset()
                 self._gamepad.update()
                 del self._gamepad
-            except:
+            except Exception:
                 pass
             self._gamepad = None
-        
+
+        try:
+            import ctypes
+            ctypes.windll.winmm.timeEndPeriod(1)
+        except Exception:
+            pass
+
         self._enabled = False
         print("[+] Controller disconnected")
     
@@ -144,38 +334,50 @@ class ControllerEmulator:
             return
         
         try:
-            self._gamepad.reset()
-            
-            button_map = [
-                (XboxButton.A, vg.XUSB_BUTTON.XUSB_GAMEPAD_A),
-                (XboxButton.B, vg.XUSB_BUTTON.XUSB_GAMEPAD_B),
-                (XboxButton.X, vg.XUSB_BUTTON.XUSB_GAMEPAD_X),
-                (XboxButton.Y, vg.XUSB_BUTTON.XUSB_GAMEPAD_Y),
-                (XboxButton.DPAD_UP, vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_UP),
-                (XboxButton.DPAD_DOWN, vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_DOWN),
-                (XboxButton.DPAD_LEFT, vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_LEFT),
-                (XboxButton.DPAD_RIGHT, vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_RIGHT),
-                (XboxButton.START, vg.XUSB_BUTTON.XUSB_GAMEPAD_START),
-                (XboxButton.BACK, vg.XUSB_BUTTON.XUSB_GAMEPAD_BACK),
-                (XboxButton.LEFT_THUMB, vg.XUSB_BUTTON.XUSB_GAMEPAD_LEFT_THUMB),
-                (XboxButton.RIGHT_THUMB, vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_THUMB),
-                (XboxButton.LEFT_SHOULDER, vg.XUSB_BUTTON.XUSB_GAMEPAD_LEFT_SHOULDER),
-                (XboxButton.RIGHT_SHOULDER, vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_SHOULDER),
-                (XboxButton.GUIDE, vg.XUSB_BUTTON.XUSB_GAMEPAD_GUIDE),
-            ]
-            
-            for our_btn, vg_btn in button_map:
-                if self.state.buttons & our_btn:
-                    self._gamepad.press_button(button=vg_btn)
-            
-            self._gamepad.left_trigger(value=self.state.left_trigger)
-            self._gamepad.right_trigger(value=self.state.right_trigger)
-            self._gamepad.left_joystick(x_value=self.state.left_stick_x, y_value=self.state.left_stick_y)
-            self._gamepad.right_joystick(x_value=self.state.right_stick_x, y_value=self.state.right_stick_y)
-            
-            self._gamepad.update()
-        except:
-            pass
+            gamepad = self._gamepad
+            new = self.state
+            last = self._last_sent
+
+            # Diff against what ViGEm last saw: a full reset + re-press of
+            # every held button would mutate the HID report hundreds of
+            # times a second even when nothing changed. The packed layout
+            # makes the common nothing-changed case one memcmp.
+            if bytes(new) == bytes(last):
+                return
+
+            changed_buttons = new.buttons ^ last.buttons
+            left_stick_moved = (new.left_stick_x != last.left_stick_x or
+                                new.left_stick_y != last.left_stick_y)
+            right_stick_moved = (new.right_stick_x != last.right_stick_x or
+                                 new.right_stick_y != last.right_stick_y)
+
+            if changed_buttons:
+                press = gamepad.press_button
+                release = gamepad.release_button
+                buttons = new.buttons
+                for mask, vg_btn in _button_apply_map():
+                    if changed_buttons & mask:
+                        if buttons & mask:
+                            press(button=vg_btn)
+                        else:
+                            release(button=vg_btn)
+
+            if new.left_trigger != last.left_trigger:
+                gamepad.left_trigger(value=new.left_trigger)
+            if new.right_trigger != last.right_trigger:
+                gamepad.right_trigger(value=new.right_trigger)
+            if left_stick_moved:
+                gamepad.left_joystick(x_value=new.left_stick_x, y_value=new.left_stick_y)
+            if right_stick_moved:
+                gamepad.right_joystick(x_value=new.right_stick_x, y_value=new.right_stick_y)
+
+            gamepad.update()
+
+            last.copy_from(new)
+        except Exception as e:
+            # ViGEmBus device errors (pad unplugged, driver gone); log
+            # instead of silently dropping input
+            print(f"[!] Controller update failed: {e}")
     
     def update(self):
         self._apply_state()
@@ -193,9 +395,9 @@ class ControllerEmulator:
     
     def press_button(self, button: XboxButton, duration: float = 0.1):
         self.set_button(button, True)
-        time.sleep(duration)
+        precise_sleep(duration)
         self.set_button(button, False)
-        time.sleep(0.05)
+        precise_sleep(0.05)
     
     def press_button_by_name(self, name: str, duration: float = 0.1):
         if name.upper() in BUTTON_MAP:
@@ -231,7 +433,7 @@ class ControllerEmulator:
         if direction.lower() in directions:
             x, y = directions[direction.lower()]
             self.set_stick(left, x, y)
-            time.sleep(duration)
+            precise_sleep(duration)
             self.set_stick(left, 0, 0)
     
     def reset(self):
@@ -239,43 +441,68 @@ class ControllerEmulator:
         self.update()
     
     def start_polling(self, log_callback=None):
+        # Polling stays on its own thread rather than an asyncio task: the
+        # app's main thread runs the tkinter mainloop, and the loop body
+        # blocks on an Event with heap-derived timeouts (O(changes) wakeups),
+        # which would stall a shared asyncio loop.
         if self._polling:
             return
         
         self._polling = True
         self._log_callback = log_callback
+        self._dirty.clear()
+        self._hook_thread = _InputHookThread(self._dirty)
+        self._hook_thread.start()
         self._poll_thread = threading.Thread(target=self._poll_loop_rapid_steps, daemon=True)
         self._poll_thread.start()
         print("[+] Controller polling started (rapid steps mode)")
-    
+
     def stop_polling(self):
         self._polling = False
+        self._dirty.set()  # Wake the loop if it is blocked on the event
         if self._poll_thread:
             self._poll_thread.join(timeout=1)
             self._poll_thread = None
+        if self._hook_thread:
+            self._hook_thread.stop()
+            self._hook_thread = None
     
     def _poll_loop_rapid_steps(self):
         """
         Rapid steps polling - sends repeated short inputs for consistent movement
         This mimics tapping the stick rapidly rather than holding it
+
+        The loop is event-driven: it blocks on the dirty Event (set by the
+        input hooks on key/mouse transitions) with a timeout equal to the
+        next pending step boundary, kept in a heap. When the hooks could
+        not be installed it degrades to the old fixed 5ms poll.
         """
         from .input_handler import input_handler
         from .config import config
-        
+
         bindings = config.controller
-        
-        # Track when each direction was last sent
-        last_step_time = {
-            'up': 0, 'down': 0, 'left': 0, 'right': 0,
-            'r_up': 0, 'r_down': 0, 'r_left': 0, 'r_right': 0,
-        }
-        
+
+        # Track when each direction was last sent, indexed by _STEP_DIRS
+        # slot; -inf so the first press always starts a step immediately
+        # (perf_counter has an arbitrary epoch)
+        step_last = [float('-inf')] * 8
+
         step_interval = self.step_duration + self.step_gap  # Total time per step
-        
+
+        step_heap = []  # (wake_time, direction) pending step boundaries
+        last_applied = None
+
         while self._polling and self._enabled:
             try:
-                current_time = time.time()
-                
+                # perf_counter: time.time() ticks at the 15.6ms scheduler
+                # granularity on Windows, which is coarse against 50ms steps
+                current_time = time.perf_counter()
+
+                # Boundaries that already passed have done their job
+                # (waking us up); drop them
+                while step_heap and step_heap[0][0] <= current_time:
+                    heapq.heappop(step_heap)
+
                 # === BUTTONS (always immediate) ===
                 new_buttons = 0
                 
@@ -310,100 +537,71 @@ class ControllerEmulator:
                     right_trigger = 255
                 
                 # Mouse triggers
-                import ctypes
-                user32 = ctypes.windll.user32
-                
-                if bindings.mouse_left_trigger:
-                    if user32.GetAsyncKeyState(0x01) & 0x8000:
-                        if bindings.mouse_left_is_right_trigger:
-                            right_trigger = 255
-                        else:
-                            left_trigger = 255
-                
-                if bindings.mouse_right_trigger:
-                    if user32.GetAsyncKeyState(0x02) & 0x8000:
-                        if bindings.mouse_left_is_right_trigger:
-                            left_trigger = 255
-                        else:
-                            right_trigger = 255
-                
-                # === LEFT STICK - RAPID STEPS ===
-                left_x, left_y = 0, 0
-                
-                # Check each direction and send rapid steps
-                if bindings.left_stick_up and input_handler.is_key_pressed(bindings.left_stick_up):
-                    if current_time - last_step_time['up'] >= step_interval:
-                        left_y = 32767
-                        last_step_time['up'] = current_time
-                    elif current_time - last_step_time['up'] < self.step_duration:
-                        left_y = 32767  # Still in step duration
-                
-                if bindings.left_stick_down and input_handler.is_key_pressed(bindings.left_stick_down):
-                    if current_time - last_step_time['down'] >= step_interval:
-                        left_y = -32768
-                        last_step_time['down'] = current_time
-                    elif current_time - last_step_time['down'] < self.step_duration:
-                        left_y = -32768
-                
-                if bindings.left_stick_left and input_handler.is_key_pressed(bindings.left_stick_left):
-                    if current_time - last_step_time['left'] >= step_interval:
-                        left_x = -32768
-                        last_step_time['left'] = current_time
-                    elif current_time - last_step_time['left'] < self.step_duration:
-                        left_x = -32768
-                
-                if bindings.left_stick_right and input_handler.is_key_pressed(bindings.left_stick_right):
-                    if current_time - last_step_time['right'] >= step_interval:
-                        left_x = 32767
-                        last_step_time['right'] = current_time
-                    elif current_time - last_step_time['right'] < self.step_duration:
-                        left_x = 32767
-                
-                # === RIGHT STICK - RAPID STEPS ===
-                right_x, right_y = 0, 0
-                
-                if bindings.right_stick_up and input_handler.is_key_pressed(bindings.right_stick_up):
-                    if current_time - last_step_time['r_up'] >= step_interval:
-                        right_y = 32767
-                        last_step_time['r_up'] = current_time
-                    elif current_time - last_step_time['r_up'] < self.step_duration:
-                        right_y = 32767
-                
-                if bindings.right_stick_down and input_handler.is_key_pressed(bindings.right_stick_down):
-                    if current_time - last_step_time['r_down'] >= step_interval:
-                        right_y = -32768
-                        last_step_time['r_down'] = current_time
-                    elif current_time - last_step_time['r_down'] < self.step_duration:
-                        right_y = -32768
-                
-                if bindings.right_stick_left and input_handler.is_key_pressed(bindings.right_stick_left):
-                    if current_time - last_step_time['r_left'] >= step_interval:
-                        right_x = -32768
-                        last_step_time['r_left'] = current_time
-                    elif current_time - last_step_time['r_left'] < self.step_duration:
-                        right_x = -32768
-                
-                if bindings.right_stick_right and input_handler.is_key_pressed(bindings.right_stick_right):
-                    if current_time - last_step_time['r_right'] >= step_interval:
-                        right_x = 32767
-                        last_step_time['r_right'] = current_time
-                    elif current_time - last_step_time['r_right'] < self.step_duration:
-                        right_x = 32767
-                
-                # === APPLY STATE ===
-                self.state.buttons = new_buttons
-                self.state.left_stick_x = left_x
-                self.state.left_stick_y = left_y
-                self.state.right_stick_x = right_x
-                self.state.right_stick_y = right_y
-                self.state.left_trigger = left_trigger
-                self.state.right_trigger = right_trigger
-                
-                self.update()
-                
-                # Fast poll rate
-                time.sleep(0.005)
+                if _GetAsyncKeyState is not None:
+                    if bindings.mouse_left_trigger:
+                        if _GetAsyncKeyState(0x01) & 0x8000:
+                            if bindings.mouse_left_is_right_trigger:
+                                right_trigger = 255
+                            else:
+                                left_trigger = 255
+
+                    if bindings.mouse_right_trigger:
+                        if _GetAsyncKeyState(0x02) & 0x8000:
+                            if bindings.mouse_left_is_right_trigger:
+                                left_trigger = 255
+                            else:
+                                right_trigger = 255
                 
+                # === STICKS - RAPID STEPS (table-driven) ===
+                # Axis slots: left_x, left_y, right_x, right_y
+                axes = [0, 0, 0, 0]
+
+                # Keys resolved fresh each tick, like the button and
+                # trigger bindings above — the Bindings tab writes
+                # config.controller live, so a hoisted snapshot would
+                # ignore stick rebinds until the controller reconnects
+                for attr, idx, axis, value in self._STEP_DIRS:
+                    key = getattr(bindings, attr)
+                    if not key or not input_handler.is_key_pressed(key):
+                        continue
+                    dt = current_time - step_last[idx]
+                    if dt >= step_interval:
+                        axes[axis] = value
+                        step_last[idx] = current_time
+                        heapq.heappush(step_heap, (current_time + self.step_duration, idx))
+                        heapq.heappush(step_heap, (current_time + step_interval, idx))
+                    elif dt < self.step_duration:
+                        axes[axis] = value  # Still in step duration
+
+                left_x, left_y = axes[0], axes[1]
+                right_x, right_y = axes[2], axes[3]
+
+                # === APPLY STATE (only when it actually changed) ===
+                computed = (new_buttons, left_x, left_y, right_x, right_y,
+                            left_trigger, right_trigger)
+                if computed != last_applied:
+                    self.state.buttons = new_buttons
+                    self.state.left_stick_x = left_x
+                    self.state.left_stick_y = left_y
+                    self.state.right_stick_x = right_x
+                    self.state.right_stick_y = right_y
+                    self.state.left_trigger = left_trigger
+                    self.state.right_trigger = right_trigger
+
+                    self.update()
+                    last_applied = computed
+
+                # === SLEEP until the next step boundary or input event ===
+                if step_heap:
+                    timeout = max(step_heap[0][0] - time.perf_counter(), 0)
+                elif self._hook_thread and self._hook_thread.installed:
+                    timeout = None  # Purely event-driven while idle
+                else:
+                    timeout = 0.005  # No hooks: old fast poll rate
+
+                if self._dirty.wait(timeout):
+                    self._dirty.clear()
+
             except Exception as e:
                 time.sleep(0.01)
 
@@ -6,12 +6,79 @@ Supports image-only card detection without coordinates
 
 import cv2
 import numpy as np
-from PIL import ImageGrab
 import os
-from typing import List, Tuple, Optional, Dict
+import time
+from itertools import repeat
+from typing import Iterator, List, Tuple, Optional, Dict
 from dataclasses import dataclass
 from enum import Enum, auto
 
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    from scipy import fft as scipy_fft
+    SCIPY_FFT_AVAILABLE = True
+except ImportError:
+    SCIPY_FFT_AVAILABLE = False
+
+# Templates at least this many pixels go through the cached-FFT match path
+FFT_MIN_TEMPLATE_AREA = 4096
+
+# Captures and scan results younger than one ~30fps frame are reused, so
+# back-to-back queries (enchants, spells, enchanted) share one grab and scan
+CAPTURE_TTL = 0.033
+
+
+def _rfft2(arr: np.ndarray, s=None) -> np.ndarray:
+    if SCIPY_FFT_AVAILABLE:
+        return scipy_fft.rfft2(arr, s=s, workers=-1)
+    return np.fft.rfft2(arr, s=s)
+
+
+def _irfft2(arr: np.ndarray, s) -> np.ndarray:
+    if SCIPY_FFT_AVAILABLE:
+        return scipy_fft.irfft2(arr, s=s, workers=-1)
+    return np.fft.irfft2(arr, s=s)
+
+from .config import config
+from .screen_capture import screen_capture
+
+# Let OpenCV use its SIMD-optimized code paths and all cores for matchTemplate
+cv2.setUseOptimized(True)
+cv2.setNumThreads(os.cpu_count() or 1)
+
+def _nms_hits(result: np.ndarray, confidence: float, w: int, h: int,
+              factor: float = 0.5) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Peak-pick a matchTemplate response map: repeatedly take the global
+    maximum with cv2.minMaxLoc (SIMD) and blank a factor*(w, h) rectangle
+    around it until the best remaining score drops below the threshold.
+    Returns (xs, ys, scores), strongest first. Runs one OpenCV sweep per
+    surviving card with no per-pixel Python work - a plateau of thousands
+    of above-threshold pixels never gets materialized. Mutates `result`.
+    """
+    xs: List[int] = []
+    ys: List[int] = []
+    scores: List[float] = []
+    wx, hy = max(int(w * factor), 1), max(int(h * factor), 1)
+    while True:
+        _, max_val, _, max_loc = cv2.minMaxLoc(result)
+        if max_val < confidence:
+            break
+        x, y = max_loc
+        xs.append(x)
+        ys.append(y)
+        scores.append(max_val)
+        # Suppress |dx| < wx and |dy| < hy around the peak (inclusive bounds)
+        cv2.rectangle(result, (x - wx + 1, y - hy + 1), (x + wx - 1, y + hy - 1), -1.0, -1)
+    return (np.asarray(xs, dtype=np.intp), np.asarray(ys, dtype=np.intp),
+            np.asarray(scores, dtype=np.float32))
+
+
 class CardType(Enum):
     """Types of cards we can detect"""
     SPELL = auto()
@@ -19,7 +86,7 @@ class CardType(Enum):
     ENCHANTED_SPELL = auto()
     UNKNOWN = auto()
 
-@dataclass
+@dataclass(slots=True)
 class CardMatch:
     """Represents a detected card"""
     x: int
@@ -34,7 +101,7 @@ class CardMatch:
     def center(self) -> Tuple[int, int]:
         return (self.x + self.width // 2, self.y + self.height // 2)
 
-@dataclass
+@dataclass(slots=True)
 class Match:
     """Represents a detected image match"""
     x: int
@@ -54,7 +121,66 @@ class ImageRecognition:
         self.images_folder = images_folder
         self._templates: Dict[str, np.ndarray] = {}
         self._card_templates: Dict[str, Tuple[np.ndarray, CardType]] = {}
-        
+        self._small_card_templates: Dict[str, np.ndarray] = {}
+        # Flat (name, template, type, type_code, height, width) tuples that
+        # find_cards streams through instead of walking the dict per frame;
+        # rebuilt lazily after loads. Templates themselves stay contiguous
+        # standalone arrays: OpenCV wants a dense single template per call,
+        # so a padded (N, H, W) stack would just force a copy of each slice.
+        self._card_template_seq: Optional[tuple] = None
+
+        # Reused grayscale buffer so card scans don't allocate per frame
+        self._gray_buffer: Optional[np.ndarray] = None
+
+        # (timestamp, region, frame) / (timestamp, confidence, cards) memos,
+        # valid for CAPTURE_TTL
+        self._capture_cache: Tuple[float, Optional[tuple], Optional[np.ndarray]] = (0.0, None, None)
+        self._cards_cache: Tuple[float, float, Optional[List[CardMatch]]] = (0.0, -1.0, None)
+
+        # Struct-of-arrays candidate buffer reused across find_cards calls so
+        # idle scanning doesn't allocate per raw match; grown by doubling
+        self._cand: Dict[str, np.ndarray] = {
+            'x': np.empty(64, np.int32),
+            'y': np.empty(64, np.int32),
+            'w': np.empty(64, np.int32),
+            'h': np.empty(64, np.int32),
+            'conf': np.empty(64, np.float32),
+            'type': np.empty(64, np.int8),
+            'name_id': np.empty(64, np.int32),
+        }
+        self._cand_n = 0
+
+        # FFT matching state: per-scan frame transform plus cached template FFTs
+        self._fft_frame: Optional[np.ndarray] = None
+        self._fft_integrals: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._fft_template_cache: Dict[tuple, Tuple[np.ndarray, float]] = {}
+
+        # GPU backends for matchTemplate: CUDA first, OpenCL (UMat) second
+        try:
+            self._cuda_enabled = cv2.cuda.getCudaEnabledDeviceCount() > 0
+        except Exception:
+            self._cuda_enabled = False
+
+        self._cuda_matcher = None
+        self._gpu_card_templates: Dict[str, 'cv2.cuda_GpuMat'] = {}
+        # OpenCL path: (name, size) -> UMat of the resized template, so each
+        # scale uploads to the GPU once instead of per frame
+        self._umat_card_templates: Dict[Tuple[str, Tuple[int, int]], 'cv2.UMat'] = {}
+        if self._cuda_enabled:
+            try:
+                self._cuda_matcher = cv2.cuda.createTemplateMatching(
+                    cv2.CV_8UC1, cv2.TM_CCOEFF_NORMED)
+                print("[+] CUDA template matching enabled")
+            except Exception:
+                self._cuda_enabled = False
+
+        try:
+            self._opencl_enabled = not self._cuda_enabled and cv2.ocl.haveOpenCL()
+        except Exception:
+            self._opencl_enabled = False
+        if self._opencl_enabled:
+            print("[+] OpenCL template matching enabled")
+
         if not os.path.exists(images_folder):
             os.makedirs(images_folder)
     
@@ -69,8 +195,10 @@ class ImageRecognition:
         if template is None:
             print(f"[!] Could not load template: {path}")
             return False
-        
-        self._templates[name] = template
+
+        # Single-channel matching: one correlation pass instead of three
+        self._templates[name] = np.ascontiguousarray(
+            cv2.cvtColor(template, cv2.COLOR_BGR2GRAY))
         print(f"[+] Loaded template: {name}")
         return True
     
@@ -85,16 +213,228 @@ class ImageRecognition:
         if template is None:
             print(f"[!] Could not load card template: {path}")
             return False
-        
+
+        # Card matching runs in grayscale uint8; convert once at load time and
+        # keep the buffer contiguous for OpenCV's 8-bit SIMD kernels
+        template = np.ascontiguousarray(cv2.cvtColor(template, cv2.COLOR_BGR2GRAY))
         self._card_templates[name] = (template, card_type)
+        self._card_template_seq = None  # rebuilt on next scan
+
+        # Quarter-resolution copy for the coarse pyramid prefilter, built with
+        # the same Gaussian pyramid the frame goes through so the two blur
+        # kernels agree
+        self._small_card_templates[name] = cv2.pyrDown(cv2.pyrDown(template))
+
+        # Keep a GPU-resident copy so per-frame matching never re-uploads it
+        if self._cuda_enabled:
+            try:
+                gpu_template = cv2.cuda_GpuMat()
+                gpu_template.upload(template)
+                self._gpu_card_templates[name] = gpu_template
+            except Exception:
+                pass
         print(f"[+] Loaded card template: {name} ({card_type.name})")
         return True
     
-    def capture_screen(self) -> np.ndarray:
-        """Capture the current screen"""
-        screenshot = ImageGrab.grab()
-        screenshot_np = np.array(screenshot)
-        return cv2.cvtColor(screenshot_np, cv2.COLOR_RGB2BGR)
+    def capture_screen(self, region: Optional[Tuple[int, int, int, int]] = None) -> np.ndarray:
+        """
+        Capture the current screen, or just a (left, top, width, height)
+        region - the capture backends grab only those pixels. Grabs younger
+        than CAPTURE_TTL are reused, so batched queries within one tick pay
+        for one capture.
+        """
+        now = time.perf_counter()
+        taken, cached_region, frame = self._capture_cache
+        if frame is not None and cached_region == region and now - taken < CAPTURE_TTL:
+            return frame
+        frame = screen_capture.grab(region)
+        self._capture_cache = (now, region, frame)
+        return frame
+
+    def frame_hash(self, screen: np.ndarray) -> int:
+        """
+        Cheap fingerprint of a captured frame.
+        Downsamples to 32x32 grayscale so tiny noise doesn't change the hash,
+        then hashes the raw bytes (xxhash when installed, else Python's hash).
+        """
+        small = cv2.resize(screen, (32, 32), interpolation=cv2.INTER_AREA)
+        if small.ndim == 3:
+            small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        data = small.tobytes()
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh3_64_intdigest(data)
+        return hash(data)
+
+    def _to_gray(self, frame: np.ndarray) -> np.ndarray:
+        """Convert a frame to grayscale, reusing one output buffer across calls"""
+        if self._gray_buffer is None or self._gray_buffer.shape != frame.shape[:2]:
+            self._gray_buffer = np.empty(frame.shape[:2], dtype=np.uint8)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray_buffer)
+        return self._gray_buffer
+
+    def _coarse_candidates(self, small_frame: np.ndarray, name: str,
+                           size: Tuple[int, int], confidence: float):
+        """
+        Quarter-resolution prefilter. Returns None when the prefilter cannot
+        run (no small template, or the scale is too coarse to be
+        meaningful), otherwise (xs, ys) of plausible coarse hits - empty
+        arrays reject the scale after scanning ~1/16th of the pixels, which
+        is the common case on idle frames.
+        """
+        tpl_small = self._small_card_templates.get(name)
+        if tpl_small is None:
+            return None
+
+        small_w, small_h = max(size[0] // 4, 1), max(size[1] // 4, 1)
+        if small_w < 8 or small_h < 8:
+            return None
+        if small_w > small_frame.shape[1] or small_h > small_frame.shape[0]:
+            return None
+
+        if (small_w, small_h) != (tpl_small.shape[1], tpl_small.shape[0]):
+            tpl_small = cv2.resize(tpl_small, (small_w, small_h), interpolation=cv2.INTER_AREA)
+        result = cv2.matchTemplate(small_frame, tpl_small, cv2.TM_CCOEFF_NORMED)
+        # Looser threshold: downsampling blurs genuine matches
+        xs, ys, _ = _nms_hits(result, confidence - 0.1, small_w, small_h)
+        return xs, ys
+
+    def _match_hits(self, src, gray: np.ndarray, small_frame: np.ndarray,
+                    name: str, size: Tuple[int, int], confidence: float):
+        """
+        Hits for one template at one size, as (xs, ys, scores) in ROI space.
+
+        The CPU path refines coarse pyramid candidates: the quarter-res
+        match locates plausible card positions and the full-res correlation
+        runs only on small padded windows around them, cutting the work per
+        template by roughly the frame-to-window area ratio. GPU and
+        cached-FFT paths still match the whole frame - the full map is
+        cheap there - with the coarse pass gating obvious misses.
+        """
+        w, h = size
+        coarse = self._coarse_candidates(small_frame, name, size, confidence)
+        if coarse is not None and len(coarse[0]) == 0:
+            empty = np.empty(0, np.intp)
+            return empty, empty, np.empty(0, np.float32)
+
+        window_path = (coarse is not None
+                       and not self._cuda_enabled and not self._opencl_enabled
+                       and w * h < FFT_MIN_TEMPLATE_AREA)
+        if not window_path:
+            result = self._match_card_template(src, name, size)
+            return _nms_hits(result, confidence, w, h, factor=0.4)
+
+        template, _ = self._card_templates[name]
+        resized = cv2.resize(template, size, interpolation=cv2.INTER_AREA)
+        height, width = gray.shape
+        pad = 16  # covers the 4x downsample quantization plus pyramid blur
+        all_x, all_y, all_s = [], [], []
+        for cx, cy in zip(*coarse):
+            x0 = max(int(cx) * 4 - pad, 0)
+            y0 = max(int(cy) * 4 - pad, 0)
+            x1 = min(int(cx) * 4 + w + pad, width)
+            y1 = min(int(cy) * 4 + h + pad, height)
+            if x1 - x0 < w or y1 - y0 < h:
+                continue
+            local = cv2.matchTemplate(gray[y0:y1, x0:x1], resized, cv2.TM_CCOEFF_NORMED)
+            lx, ly, ls = _nms_hits(local, confidence, w, h, factor=0.4)
+            if len(lx):
+                all_x.append(lx + x0)
+                all_y.append(ly + y0)
+                all_s.append(ls)
+
+        if not all_x:
+            empty = np.empty(0, np.intp)
+            return empty, empty, np.empty(0, np.float32)
+        # Overlapping windows can double-report a card; the cross-scale
+        # dedup in find_cards collapses those
+        return np.concatenate(all_x), np.concatenate(all_y), np.concatenate(all_s)
+
+    def _upload_frame(self, gray: np.ndarray):
+        """Move the grayscale frame to the active matching backend (once per scan)"""
+        if self._cuda_enabled:
+            gpu_frame = cv2.cuda_GpuMat()
+            gpu_frame.upload(gray)
+            return gpu_frame
+        if self._opencl_enabled:
+            return cv2.UMat(gray)
+        return gray
+
+    def _match_card_template(self, src, name: str, size: Tuple[int, int]) -> np.ndarray:
+        """
+        Match one card template at the given (width, height) against a frame
+        already uploaded via _upload_frame. Only the small response map comes
+        back from the GPU.
+        """
+        if self._cuda_enabled and name in self._gpu_card_templates:
+            gpu_template = cv2.cuda.resize(self._gpu_card_templates[name], size,
+                                           interpolation=cv2.INTER_AREA)
+            return self._cuda_matcher.match(src, gpu_template).download()
+
+        template, _ = self._card_templates[name]
+        if self._opencl_enabled:
+            key = (name, size)
+            tpl_umat = self._umat_card_templates.get(key)
+            if tpl_umat is None:
+                resized = cv2.resize(template, size, interpolation=cv2.INTER_AREA)
+                tpl_umat = cv2.UMat(resized)
+                self._umat_card_templates[key] = tpl_umat
+            result = cv2.matchTemplate(src, tpl_umat, cv2.TM_CCOEFF_NORMED)
+            return result.get()
+
+        # CPU path: card-sized templates are cheaper in the frequency domain
+        # because the template FFT is cached across frames
+        if size[0] * size[1] >= FFT_MIN_TEMPLATE_AREA:
+            return self._match_fft(src, name, size)
+
+        # Small templates: uint8 grayscale in, OpenCV's 8-bit SIMD kernels do
+        # the heavy lifting. TM_SQDIFF_NORMED was evaluated here but its score
+        # scale is not compatible with the configured confidence thresholds
+        # (random content already scores ~0.97 after 1-x flipping).
+        resized = cv2.resize(template, size, interpolation=cv2.INTER_AREA)
+        return cv2.matchTemplate(src, resized, cv2.TM_CCOEFF_NORMED)
+
+    def _match_fft(self, gray: np.ndarray, name: str, size: Tuple[int, int]) -> np.ndarray:
+        """
+        TM_CCOEFF_NORMED equivalent via FFT cross-correlation (Lewis NCC).
+        The zero-mean template FFT and its energy are cached per (template,
+        size, frame shape); per frame we pay one forward FFT plus integral
+        images, then one inverse FFT per template.
+        """
+        height, width = gray.shape
+        w, h = size
+
+        if self._fft_frame is None:
+            self._fft_frame = _rfft2(gray.astype(np.float32))
+            # float64 sums: int32 window sums overflow when squared below
+            sums, sqsums = cv2.integral2(gray, sdepth=cv2.CV_64F)
+            self._fft_integrals = (sums, sqsums)
+
+        key = (name, size, (height, width))
+        cached = self._fft_template_cache.get(key)
+        if cached is None:
+            template, _ = self._card_templates[name]
+            t = cv2.resize(template, size, interpolation=cv2.INTER_AREA).astype(np.float32)
+            t -= t.mean()
+            tpl_norm = float(np.sqrt((t * t).sum()))
+            tpl_fft_conj = np.conj(_rfft2(t, s=(height, width)))
+            cached = (tpl_fft_conj, tpl_norm)
+            self._fft_template_cache[key] = cached
+        tpl_fft_conj, tpl_norm = cached
+
+        # Zero-mean template makes the raw correlation the NCC numerator
+        cross = _irfft2(self._fft_frame * tpl_fft_conj, s=(height, width))
+        numerator = cross[:height - h + 1, :width - w + 1]
+
+        # Window sums from integral images give the denominator
+        sums, sqsums = self._fft_integrals
+        win_sum = sums[h:, w:] - sums[:-h, w:] - sums[h:, :-w] + sums[:-h, :-w]
+        win_sq = sqsums[h:, w:] - sqsums[:-h, w:] - sqsums[h:, :-w] + sqsums[:-h, :-w]
+        variance = np.maximum(win_sq - win_sum * win_sum / (h * w), 0.0)
+        denom = np.sqrt(variance) * tpl_norm
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result = np.where(denom > 1e-6, numerator / denom, 0.0)
+        return result.astype(np.float32)
     
     def find_template(self, name: str, confidence: float = 0.8) -> Optional[Match]:
         """Find a single instance of a template on screen"""
@@ -102,24 +442,26 @@ class ImageRecognition:
             return None
         
         template = self._templates[name]
-        screen = self.capture_screen()
-        
-        try:
-            result = cv2.matchTemplate(screen, template, cv2.TM_CCOEFF_NORMED)
-            min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
-            
-            if max_val >= confidence:
-                h, w = template.shape[:2]
-                return Match(
-                    x=max_loc[0],
-                    y=max_loc[1],
-                    width=w,
-                    height=h,
-                    confidence=max_val
-                )
-        except Exception:
-            pass
-        
+        gray = self._to_gray(self.capture_screen())
+
+        # Oversized template (e.g. windowed game smaller than the asset)
+        # cannot match; cheaper to check than to catch the OpenCV error
+        h, w = template.shape[:2]
+        if h > gray.shape[0] or w > gray.shape[1]:
+            return None
+
+        result = cv2.matchTemplate(gray, template, cv2.TM_CCOEFF_NORMED)
+        min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
+
+        if max_val >= confidence:
+            return Match(
+                x=max_loc[0],
+                y=max_loc[1],
+                width=w,
+                height=h,
+                confidence=max_val
+            )
+
         return None
     
     def find_all_templates(self, name: str, confidence: float = 0.8) -> List[Match]:
@@ -128,106 +470,163 @@ class ImageRecognition:
             return []
         
         template = self._templates[name]
-        screen = self.capture_screen()
-        
-        try:
-            result = cv2.matchTemplate(screen, template, cv2.TM_CCOEFF_NORMED)
-            locations = np.where(result >= confidence)
-            
-            h, w = template.shape[:2]
-            matches = []
-            
-            for pt in zip(*locations[::-1]):
-                x, y = pt
-                
-                # Check for duplicates
-                is_duplicate = False
-                for existing in matches:
-                    if abs(x - existing.x) < w * 0.5 and abs(y - existing.y) < h * 0.5:
-                        is_duplicate = True
-                        break
-                
-                if not is_duplicate:
-                    matches.append(Match(
-                        x=x, y=y, width=w, height=h,
-                        confidence=result[y, x]
-                    ))
-            
-            matches.sort(key=lambda m: m.x)
-            return matches
-        except Exception:
+        gray = self._to_gray(self.capture_screen())
+
+        h, w = template.shape[:2]
+        if h > gray.shape[0] or w > gray.shape[1]:
             return []
+
+        result = cv2.matchTemplate(gray, template, cv2.TM_CCOEFF_NORMED)
+        xs, ys, scores = _nms_hits(result, confidence, w, h)
+        matches = [
+            Match(x=int(x), y=int(y), width=w, height=h, confidence=float(s))
+            for x, y, s in zip(xs, ys, scores)
+        ]
+        matches.sort(key=lambda m: m.x)
+        return matches
     
-   def find_cards(self, confidence: float = 0.8) -> List[CardMatch]:
-    """
-    Find all cards on screen using multi-scale template matching.
-    This detects both enlarged (selected) cards and smaller (unselected) cards.
-    Returns cards sorted by x position (left to right).
-    """
-    screen = self.capture_screen()
-    all_cards: List[CardMatch] = []
-    
-    # Scale factors to search - covers both smaller unselected cards and larger selected cards
-    scales = [0.5, 0.6, 0.7, 0.8, 0.9, 1.0, 1.1, 1.2, 1.3]
-    
-    for name, (template, card_type) in self._card_templates.items():
-        try:
-            original_h, original_w = template.shape[:2]
-            
-            for scale in scales:
-                # Resize template to current scale
-                new_w = int(original_w * scale)
-                new_h = int(original_h * scale)
-                
-                # Skip if template would be too small
-                if new_w < 20 or new_h < 20:
-                    continue
-                
-                # Skip if template is larger than screen
-                if new_w > screen.shape[1] or new_h > screen.shape[0]:
-                    continue
-                
-                resized_template = cv2.resize(template, (new_w, new_h), interpolation=cv2.INTER_AREA)
-                
-                result = cv2.matchTemplate(screen, resized_template, cv2.TM_CCOEFF_NORMED)
-                locations = np.where(result >= confidence)
-                
-                for pt in zip(*locations[::-1]):
-                    x, y = pt
-                    
-                    # Check for duplicates (cards detected at multiple scales)
-                    is_duplicate = False
-                    for existing in all_cards:
-                        # Use a more generous overlap threshold for multi-scale matching
-                        x_overlap = abs(x - existing.x) < max(new_w, existing.width) * 0.4
-                        y_overlap = abs(y - existing.y) < max(new_h, existing.height) * 0.4
-                        same_type = existing.card_type == card_type
-                        
-                        if x_overlap and y_overlap and same_type:
-                            # Keep the higher confidence match
-                            if result[y, x] > existing.confidence:
-                                all_cards.remove(existing)
-                            else:
-                                is_duplicate = True
-                            break
-                    
-                    if not is_duplicate:
-                        all_cards.append(CardMatch(
-                            x=x, y=y, 
-                            width=new_w, 
-                            height=new_h,
-                            confidence=result[y, x],
-                            card_type=card_type,
-                            name=name
-                        ))
-        except Exception as e:
-            print(f"[!] Error matching template {name} at scale: {e}")
-            continue
-    
-    # Sort by x position (left to right)
-    all_cards.sort(key=lambda c: c.x)
-    return all_cards
-       
+    def find_cards(self, confidence: float = 0.8,
+                   screen: Optional[np.ndarray] = None) -> List[CardMatch]:
+        """
+        Find all cards on screen using multi-scale template matching.
+        This detects both enlarged (selected) cards and smaller (unselected) cards.
+        Accepts an already-captured frame to avoid double-grabbing.
+        Returns cards sorted by x position (left to right).
+        """
+        # Self-captured scans are memoized for one tick so the card-type
+        # helpers called back-to-back run the template search once. Scans on
+        # caller-supplied frames are not cached (the caller controls reuse).
+        memoize = screen is None
+        if memoize:
+            now = time.perf_counter()
+            taken, conf_key, cached = self._cards_cache
+            if cached is not None and conf_key == confidence and now - taken < CAPTURE_TTL:
+                return cached
+
+        # Restrict to the card-hand ROI when configured. Self-captured scans
+        # grab only those pixels from the backend; caller-supplied frames are
+        # cropped instead. Grayscale conversion happens once so every
+        # template reuses the same source buffer.
+        roi_x, roi_y = 0, 0
+        roi_cfg = config.images.card_roi
+        if screen is None:
+            if roi_cfg:
+                roi_x, roi_y = roi_cfg[0], roi_cfg[1]
+                search = self.capture_screen(region=tuple(roi_cfg))
+            else:
+                search = self.capture_screen()
+        else:
+            search = screen
+            if roi_cfg:
+                roi_x, roi_y, roi_w, roi_h = roi_cfg
+                search = screen[roi_y:roi_y + roi_h, roi_x:roi_x + roi_w]
+
+        # Raw matches land in the reused SoA buffer; CardMatch objects are
+        # only materialized for the deduplicated survivors at the end
+        cand = self._cand
+        n = 0
+        name_table: List[str] = []
+        type_table: List[CardType] = []
+        gray = self._to_gray(search)
+        src = self._upload_frame(gray)
+        self._fft_frame = None  # frame changed; FFT path recomputes lazily
+        small_frame = cv2.pyrDown(cv2.pyrDown(gray))
+
+        # Scale factors to search - covers both smaller unselected cards and larger selected cards
+        scales = [0.5, 0.6, 0.7, 0.8, 0.9, 1.0, 1.1, 1.2, 1.3]
+
+        if self._card_template_seq is None:
+            self._card_template_seq = tuple(
+                (name, template, card_type, card_type.value,
+                 template.shape[0], template.shape[1])
+                for name, (template, card_type) in self._card_templates.items())
+
+        for name, template, card_type, type_code, original_h, original_w in self._card_template_seq:
+            name_id = len(name_table)
+            name_table.append(name)
+            type_table.append(card_type)
+            try:
+                for scale in scales:
+                    # Resize template to current scale
+                    new_w = int(original_w * scale)
+                    new_h = int(original_h * scale)
+
+                    # Skip if template would be too small
+                    if new_w < 20 or new_h < 20:
+                        continue
+
+                    # Skip if template is larger than the search region
+                    if new_w > gray.shape[1] or new_h > gray.shape[0]:
+                        continue
+
+                    # Coarse-to-fine: the quarter-res pyramid gates the scale
+                    # and, on the CPU path, localizes the full-res match to
+                    # windows around its candidates
+                    hit_xs, hit_ys, hit_scores = self._match_hits(
+                        src, gray, small_frame, name, (new_w, new_h), confidence)
+
+                    for rx, ry, conf in zip(hit_xs, hit_ys, hit_scores):
+                        # Screen coordinates; result is indexed in ROI space
+                        x, y = int(rx) + roi_x, int(ry) + roi_y
+                        conf = float(conf)
+
+                        # Check for duplicates (cards detected at multiple
+                        # scales); a better rescan overwrites its slot in place
+                        matched = False
+                        for j in range(n):
+                            # Use a more generous overlap threshold for multi-scale matching
+                            if (cand['type'][j] == type_code
+                                    and abs(x - cand['x'][j]) < max(new_w, cand['w'][j]) * 0.4
+                                    and abs(y - cand['y'][j]) < max(new_h, cand['h'][j]) * 0.4):
+                                if conf > cand['conf'][j]:
+                                    cand['x'][j] = x
+                                    cand['y'][j] = y
+                                    cand['w'][j] = new_w
+                                    cand['h'][j] = new_h
+                                    cand['conf'][j] = conf
+                                    cand['name_id'][j] = name_id
+                                matched = True
+                                break
+                        if matched:
+                            continue
+
+                        if n == len(cand['x']):
+                            for key, arr in cand.items():
+                                cand[key] = np.concatenate((arr, np.empty_like(arr)))
+
+                        cand['x'][n] = x
+                        cand['y'][n] = y
+                        cand['w'][n] = new_w
+                        cand['h'][n] = new_h
+                        cand['conf'][n] = conf
+                        cand['type'][n] = type_code
+                        cand['name_id'][n] = name_id
+                        n += 1
+            except Exception as e:
+                print(f"[!] Error matching template {name} at scale: {e}")
+                continue
+
+        self._cand_n = n
+
+        # Sort by x position (left to right) and materialize the survivors
+        order = np.argsort(cand['x'][:n], kind='stable')
+        cards = [
+            CardMatch(
+                x=int(cand['x'][j]),
+                y=int(cand['y'][j]),
+                width=int(cand['w'][j]),
+                height=int(cand['h'][j]),
+                confidence=float(cand['conf'][j]),
+                card_type=type_table[cand['name_id'][j]],
+                name=name_table[cand['name_id'][j]],
+            )
+            for j in order
+        ]
+
+        if memoize:
+            self._cards_cache = (now, confidence, cards)
+        return cards
+
     def find_card_by_type(self, card_type: CardType, confidence: float = 0.8) -> List[CardMatch]:
         """Find all cards of a specific type"""
         all_cards = self.find_cards(confidence)
@@ -253,14 +652,15 @@ class ImageRecognition:
                 return i
         return 0
     
-    def get_navigation_keys(self, from_slot: int, to_slot: int) -> List[str]:
-        """Get key presses needed to navigate between slots"""
+    def get_navigation_keys(self, from_slot: int, to_slot: int) -> Iterator[str]:
+        """
+        Key presses needed to navigate between slots, as a lazy iterator -
+        callers press them in order, so there is no reason to build a list.
+        """
         diff = to_slot - from_slot
-        if diff > 0:
-            return ['right'] * diff
-        elif diff < 0:
-            return ['left'] * abs(diff)
-        return []
+        if diff == 0:
+            return iter(())
+        return repeat('right' if diff > 0 else 'left', abs(diff))
     
     def is_visible(self, name: str, confidence: float = 0.8) -> bool:
         """Check if a template is visible on screen"""
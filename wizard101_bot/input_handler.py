@@ -8,11 +8,28 @@ from ctypes import wintypes, Structure, Union, POINTER, sizeof
 import time
 import threading
 from typing import Optional, Callable, Dict
-from enum import IntEnum, IntFlag
 
 # ============== WINDOWS API SETUP ==============
 
 user32 = ctypes.WinDLL('user32', use_last_error=True)
+kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+
+kernel32.CreateWaitableTimerExW.argtypes = (ctypes.c_void_p, wintypes.LPCWSTR,
+                                            wintypes.DWORD, wintypes.DWORD)
+kernel32.CreateWaitableTimerExW.restype = ctypes.c_void_p
+kernel32.SetWaitableTimer.argtypes = (ctypes.c_void_p,
+                                      POINTER(ctypes.c_longlong),
+                                      ctypes.c_long, ctypes.c_void_p,
+                                      ctypes.c_void_p, wintypes.BOOL)
+kernel32.SetWaitableTimer.restype = wintypes.BOOL
+kernel32.WaitForSingleObject.argtypes = (ctypes.c_void_p, wintypes.DWORD)
+kernel32.WaitForSingleObject.restype = wintypes.DWORD
+kernel32.CloseHandle.argtypes = (ctypes.c_void_p,)
+
+# High-resolution waitable timer (Windows 10 1803+)
+CREATE_WAITABLE_TIMER_HIGH_RESOLUTION = 0x0002
+TIMER_ALL_ACCESS = 0x1F0003
+INFINITE = 0xFFFFFFFF
 
 # Input type constants
 INPUT_MOUSE = 0
@@ -35,160 +52,88 @@ MOUSEEVENTF_ABSOLUTE = 0x8000
 
 # ============== SCAN CODES ==============
 
-class ScanCode(IntEnum):
-    """DirectInput Scan Codes"""
-    # Letters
-    A = 0x1E
-    B = 0x30
-    C = 0x2E
-    D = 0x20
-    E = 0x12
-    F = 0x21
-    G = 0x22
-    H = 0x23
-    I = 0x17
-    J = 0x24
-    K = 0x25
-    L = 0x26
-    M = 0x32
-    N = 0x31
-    O = 0x18
-    P = 0x19
-    Q = 0x10
-    R = 0x13
-    S = 0x1F
-    T = 0x14
-    U = 0x16
-    V = 0x2F
-    W = 0x11
-    X = 0x2D
-    Y = 0x15
-    Z = 0x2C
-    
-    # Numbers
-    N0 = 0x0B
-    N1 = 0x02
-    N2 = 0x03
-    N3 = 0x04
-    N4 = 0x05
-    N5 = 0x06
-    N6 = 0x07
-    N7 = 0x08
-    N8 = 0x09
-    N9 = 0x0A
-    
-    # Function keys
-    F1 = 0x3B
-    F2 = 0x3C
-    F3 = 0x3D
-    F4 = 0x3E
-    F5 = 0x3F
-    F6 = 0x40
-    F7 = 0x41
-    F8 = 0x42
-    F9 = 0x43
-    F10 = 0x44
-    F11 = 0x57
-    F12 = 0x58
-    
-    # Special keys
-    ESCAPE = 0x01
-    ENTER = 0x1C
-    SPACE = 0x39
-    BACKSPACE = 0x0E
-    TAB = 0x0F
-    LSHIFT = 0x2A
-    RSHIFT = 0x36
-    LCTRL = 0x1D
-    RCTRL = 0x1D  # Extended
-    LALT = 0x38
-    RALT = 0x38   # Extended
-    CAPSLOCK = 0x3A
-    TILDE = 0x29
-    
-    # Arrow keys (Extended)
-    UP = 0x48
-    DOWN = 0x50
-    LEFT = 0x4B
-    RIGHT = 0x4D
-    
-    # Numpad
-    NUMPAD0 = 0x52
-    NUMPAD1 = 0x4F
-    NUMPAD2 = 0x50
-    NUMPAD3 = 0x51
-    NUMPAD4 = 0x4B
-    NUMPAD5 = 0x4C
-    NUMPAD6 = 0x4D
-    NUMPAD7 = 0x47
-    NUMPAD8 = 0x48
-    NUMPAD9 = 0x49
-
-# Extended keys that need special flag
-EXTENDED_KEYS = {
-    ScanCode.UP, ScanCode.DOWN, ScanCode.LEFT, ScanCode.RIGHT,
-    ScanCode.RCTRL, ScanCode.RALT
-}
-
-# String to scan code mapping
-KEY_MAP: Dict[str, ScanCode] = {
-    # Letters (lowercase)
-    'a': ScanCode.A, 'b': ScanCode.B, 'c': ScanCode.C, 'd': ScanCode.D,
-    'e': ScanCode.E, 'f': ScanCode.F, 'g': ScanCode.G, 'h': ScanCode.H,
-    'i': ScanCode.I, 'j': ScanCode.J, 'k': ScanCode.K, 'l': ScanCode.L,
-    'm': ScanCode.M, 'n': ScanCode.N, 'o': ScanCode.O, 'p': ScanCode.P,
-    'q': ScanCode.Q, 'r': ScanCode.R, 's': ScanCode.S, 't': ScanCode.T,
-    'u': ScanCode.U, 'v': ScanCode.V, 'w': ScanCode.W, 'x': ScanCode.X,
-    'y': ScanCode.Y, 'z': ScanCode.Z,
-    
-    # Numbers
-    '0': ScanCode.N0, '1': ScanCode.N1, '2': ScanCode.N2, '3': ScanCode.N3,
-    '4': ScanCode.N4, '5': ScanCode.N5, '6': ScanCode.N6, '7': ScanCode.N7,
-    '8': ScanCode.N8, '9': ScanCode.N9,
-    
-    # Special keys
-    'enter': ScanCode.ENTER, 'return': ScanCode.ENTER,
-    'space': ScanCode.SPACE, 'escape': ScanCode.ESCAPE, 'esc': ScanCode.ESCAPE,
-    'tab': ScanCode.TAB, 'backspace': ScanCode.BACKSPACE,
-    'lshift': ScanCode.LSHIFT, 'rshift': ScanCode.RSHIFT, 'shift': ScanCode.LSHIFT,
-    'lctrl': ScanCode.LCTRL, 'rctrl': ScanCode.RCTRL, 'ctrl': ScanCode.LCTRL,
-    'lalt': ScanCode.LALT, 'ralt': ScanCode.RALT, 'alt': ScanCode.LALT,
-    'tilde': ScanCode.TILDE, '`': ScanCode.TILDE,
-    
-    # Arrows
-    'up': ScanCode.UP, 'down': ScanCode.DOWN,
-    'left': ScanCode.LEFT, 'right': ScanCode.RIGHT,
-    
-    # Function keys
-    'f1': ScanCode.F1, 'f2': ScanCode.F2, 'f3': ScanCode.F3, 'f4': ScanCode.F4,
-    'f5': ScanCode.F5, 'f6': ScanCode.F6, 'f7': ScanCode.F7, 'f8': ScanCode.F8,
-    'f9': ScanCode.F9, 'f10': ScanCode.F10, 'f11': ScanCode.F11, 'f12': ScanCode.F12,
-    
-    # Numpad
-    'numpad0': ScanCode.NUMPAD0, 'numpad1': ScanCode.NUMPAD1,
-    'numpad2': ScanCode.NUMPAD2, 'numpad3': ScanCode.NUMPAD3,
-    'numpad4': ScanCode.NUMPAD4, 'numpad5': ScanCode.NUMPAD5,
-    'numpad6': ScanCode.NUMPAD6, 'numpad7': ScanCode.NUMPAD7,
-    'numpad8': ScanCode.NUMPAD8, 'numpad9': ScanCode.NUMPAD9,
-}
-
-# Virtual key codes (for GetAsyncKeyState)
-VK_CODES = {
-    'numpad0': 0x60, 'numpad1': 0x61, 'numpad2': 0x62, 'numpad3': 0x63,
-    'numpad4': 0x64, 'numpad5': 0x65, 'numpad6': 0x66, 'numpad7': 0x67,
-    'numpad8': 0x68, 'numpad9': 0x69,
-    'f1': 0x70, 'f2': 0x71, 'f3': 0x72, 'f4': 0x73,
-    'f5': 0x74, 'f6': 0x75, 'f7': 0x76, 'f8': 0x77,
-    'f9': 0x78, 'f10': 0x79, 'f11': 0x7A, 'f12': 0x7B,
-    'a': 0x41, 'b': 0x42, 'c': 0x43, 'd': 0x44, 'e': 0x45,
-    'f': 0x46, 'g': 0x47, 'h': 0x48, 'i': 0x49, 'j': 0x4A,
-    'k': 0x4B, 'l': 0x4C, 'm': 0x4D, 'n': 0x4E, 'o': 0x4F,
-    'p': 0x50, 'q': 0x51, 'r': 0x52, 's': 0x53, 't': 0x54,
-    'u': 0x55, 'v': 0x56, 'w': 0x57, 'x': 0x58, 'y': 0x59, 'z': 0x5A,
-    'space': 0x20, 'enter': 0x0D, 'escape': 0x1B, 'tab': 0x09,
-    'up': 0x26, 'down': 0x28, 'left': 0x25, 'right': 0x27,
-    'lshift': 0xA0, 'rshift': 0xA1, 'lctrl': 0xA2, 'rctrl': 0xA3,
-}
+# Scan-code and virtual-key tables are built lazily on first use: a
+# mouse-only caller importing this module never pays for them, and key
+# users pay once. Codes are plain ints — an IntEnum member per key is a
+# full Python object and buys nothing here since nothing outside this
+# module addresses codes by name.
+
+# Scan codes whose keys need KEYEVENTF_EXTENDEDKEY (arrows, right-hand
+# modifiers; matched by code value, so keys sharing a code inherit it)
+_EXTENDED_SCANS = frozenset((0x48, 0x50, 0x4B, 0x4D, 0x1D, 0x38))
+
+# key name -> (scan code, flags), built by _ensure_key_tables()
+_KEY_DOWN_FLAGS: Optional[Dict[str, tuple]] = None
+_KEY_UP_FLAGS: Optional[Dict[str, tuple]] = None
+
+# key name -> virtual-key code (for GetAsyncKeyState), built on first use
+_VK_CODES: Optional[Dict[str, int]] = None
+
+
+def _build_scan_map() -> Dict[str, int]:
+    """DirectInput scan codes keyed by lowercase key name"""
+    scan = dict(zip('abcdefghijklmnopqrstuvwxyz',
+                    (0x1E, 0x30, 0x2E, 0x20, 0x12, 0x21, 0x22, 0x23,
+                     0x17, 0x24, 0x25, 0x26, 0x32, 0x31, 0x18, 0x19,
+                     0x10, 0x13, 0x1F, 0x14, 0x16, 0x2F, 0x11, 0x2D,
+                     0x15, 0x2C)))
+    for i, ch in enumerate('1234567890'):
+        scan[ch] = 0x02 + i
+
+    scan.update({
+        'enter': 0x1C, 'return': 0x1C,
+        'space': 0x39, 'escape': 0x01, 'esc': 0x01,
+        'tab': 0x0F, 'backspace': 0x0E,
+        'lshift': 0x2A, 'rshift': 0x36, 'shift': 0x2A,
+        'lctrl': 0x1D, 'rctrl': 0x1D, 'ctrl': 0x1D,
+        'lalt': 0x38, 'ralt': 0x38, 'alt': 0x38,
+        'tilde': 0x29, '`': 0x29,
+        'capslock': 0x3A,
+        'up': 0x48, 'down': 0x50, 'left': 0x4B, 'right': 0x4D,
+    })
+
+    for i in range(10):
+        scan[f'f{i + 1}'] = 0x3B + i
+    scan['f11'] = 0x57
+    scan['f12'] = 0x58
+
+    for i, code in enumerate((0x52, 0x4F, 0x50, 0x51, 0x4B,
+                              0x4C, 0x4D, 0x47, 0x48, 0x49)):
+        scan[f'numpad{i}'] = code
+    return scan
+
+
+def _ensure_key_tables():
+    """Build the key -> (scan code, flags) tables on first key event"""
+    global _KEY_DOWN_FLAGS, _KEY_UP_FLAGS
+    if _KEY_DOWN_FLAGS is None:
+        down = {}
+        for key, scan_code in _build_scan_map().items():
+            flags = KEYEVENTF_SCANCODE
+            if scan_code in _EXTENDED_SCANS:
+                flags |= KEYEVENTF_EXTENDEDKEY
+            down[key] = (scan_code, flags)
+        _KEY_DOWN_FLAGS = down
+        _KEY_UP_FLAGS = {k: (sc, fl | KEYEVENTF_KEYUP)
+                         for k, (sc, fl) in down.items()}
+    return _KEY_DOWN_FLAGS, _KEY_UP_FLAGS
+
+
+def _ensure_vk_codes() -> Dict[str, int]:
+    """Build the key -> virtual-key table on first key-state query"""
+    global _VK_CODES
+    if _VK_CODES is None:
+        vk = {f'numpad{i}': 0x60 + i for i in range(10)}
+        vk.update({f'f{i + 1}': 0x70 + i for i in range(12)})
+        vk.update({ch: 0x41 + i
+                   for i, ch in enumerate('abcdefghijklmnopqrstuvwxyz')})
+        vk.update({
+            'space': 0x20, 'enter': 0x0D, 'escape': 0x1B, 'tab': 0x09,
+            'up': 0x26, 'down': 0x28, 'left': 0x25, 'right': 0x27,
+            'lshift': 0xA0, 'rshift': 0xA1, 'lctrl': 0xA2, 'rctrl': 0xA3,
+        })
+        _VK_CODES = vk
+    return _VK_CODES
 
 # ============== INPUT STRUCTURES ==============
 
@@ -226,133 +171,320 @@ class _INPUTunion(Union):
     ]
 
 class INPUT(Structure):
+    # Anonymous union: inp.ki / inp.mi resolve directly, skipping one
+    # ctypes attribute hop per field access in the hot send paths
+    _anonymous_ = ('u',)
     _fields_ = [
         ('type', wintypes.DWORD),
-        ('union', _INPUTunion)
+        ('u', _INPUTunion)
     ]
 
+# Explicit signatures: without them ctypes re-infers argument coercion on
+# every call, which dominates the cost of these short syscalls
+user32.SendInput.argtypes = (wintypes.UINT, POINTER(INPUT), ctypes.c_int)
+user32.SendInput.restype = wintypes.UINT
+user32.GetAsyncKeyState.argtypes = (ctypes.c_int,)
+user32.GetAsyncKeyState.restype = ctypes.c_short
+user32.GetSystemMetrics.argtypes = (ctypes.c_int,)
+user32.GetSystemMetrics.restype = ctypes.c_int
+user32.GetCursorPos.argtypes = (POINTER(wintypes.POINT),)
+user32.GetCursorPos.restype = wintypes.BOOL
+
 # ============== INPUT HANDLER CLASS ==============
 
 class InputHandler:
     """Handles all keyboard and mouse input at hardware level"""
-    
+
     def __init__(self):
-        self._extra = ctypes.pointer(ctypes.c_ulong(0))
-    
+        # dwExtraInfo needs a real POINTER(c_ulong) for the struct fields;
+        # cast byref once here instead of building pointer objects per event
+        self._extra_val = ctypes.c_ulong(0)
+        self._extra = ctypes.cast(
+            ctypes.byref(self._extra_val), POINTER(ctypes.c_ulong))
+
+        # Reused single-event buffers: key and mouse events fire hundreds of
+        # times a second, and allocating a fresh INPUT plus a one-element
+        # array per call costs more than the SendInput itself. Constant
+        # fields are filled once; the hot path only mutates scan code/flags.
+        self._key_arr = (INPUT * 1)()
+        key_inp = self._key_arr[0]
+        key_inp.type = INPUT_KEYBOARD
+        key_inp.ki.wVk = 0
+        key_inp.ki.time = 0
+        key_inp.ki.dwExtraInfo = self._extra
+
+        self._mouse_arr = (INPUT * 1)()
+        mouse_inp = self._mouse_arr[0]
+        mouse_inp.type = INPUT_MOUSE
+        mouse_inp.mi.mouseData = 0
+        mouse_inp.mi.time = 0
+        mouse_inp.mi.dwExtraInfo = self._extra
+
+        # Batch buffers for _send_input, keyed by event count
+        self._batch_arrs: Dict[int, object] = {}
+
+        # Down+up pair buffer for instant presses (one SendInput call)
+        self._press_arr = (INPUT * 2)()
+        for inp in self._press_arr:
+            inp.type = INPUT_KEYBOARD
+            inp.ki.wVk = 0
+            inp.ki.time = 0
+            inp.ki.dwExtraInfo = self._extra
+
+        # Screen metrics cached once so absolute mouse moves skip two
+        # GetSystemMetrics syscalls per call. DPI awareness first, or the
+        # metrics come back virtualized on scaled displays.
+        try:
+            user32.SetProcessDPIAware()
+        except Exception:
+            pass
+        self._x_scale = 1.0
+        self._y_scale = 1.0
+        self.refresh_screen_metrics()
+
+        # High-resolution timer for short holds: time.sleep rides the
+        # ~15 ms system tick, which dwarfs an 80 ms key press budget
+        self._timer = None
+        self._timer_due = ctypes.c_longlong(0)
+        try:
+            self._timer = kernel32.CreateWaitableTimerExW(
+                None, None, CREATE_WAITABLE_TIMER_HIGH_RESOLUTION,
+                TIMER_ALL_ACCESS) or None
+        except Exception:
+            self._timer = None
+
+    def __del__(self):
+        try:
+            if self._timer:
+                kernel32.CloseHandle(self._timer)
+                self._timer = None
+        except Exception:
+            pass
+
+    def _precise_sleep(self, seconds: float):
+        """Sleep on the high-resolution timer; time.sleep as fallback"""
+        if seconds <= 0:
+            return
+        timer = self._timer
+        if timer:
+            # Negative due time = relative, in 100 ns units
+            self._timer_due.value = -int(seconds * 1e7)
+            if kernel32.SetWaitableTimer(timer, ctypes.byref(self._timer_due),
+                                         0, None, None, 0):
+                kernel32.WaitForSingleObject(timer, INFINITE)
+                return
+        time.sleep(seconds)
+
+    def refresh_screen_metrics(self):
+        """Re-read screen dimensions (call after a resolution/DPI change)"""
+        width = user32.GetSystemMetrics(0)
+        height = user32.GetSystemMetrics(1)
+        if width and height:
+            self._x_scale = 65535.0 / width
+            self._y_scale = 65535.0 / height
+
+    def _send_key(self, scan_code: int, flags: int):
+        """Send one key event through the reused keyboard buffer"""
+        ki = self._key_arr[0].ki
+        ki.wScan = scan_code
+        ki.dwFlags = flags
+        return user32.SendInput(1, self._key_arr, sizeof(INPUT))
+
     def _send_input(self, *inputs):
-        """Send multiple input events"""
+        """Send multiple input events (reuses a cached array per batch size)"""
         n = len(inputs)
-        arr = (INPUT * n)(*inputs)
+        arr = self._batch_arrs.get(n)
+        if arr is None:
+            arr = self._batch_arrs[n] = (INPUT * n)()
+        for i, inp in enumerate(inputs):
+            arr[i] = inp
         return user32.SendInput(n, arr, sizeof(INPUT))
     
     def _create_key_input(self, scan_code: int, flags: int) -> INPUT:
         """Create keyboard input structure"""
         inp = INPUT()
         inp.type = INPUT_KEYBOARD
-        inp.union.ki.wVk = 0
-        inp.union.ki.wScan = scan_code
-        inp.union.ki.dwFlags = flags
-        inp.union.ki.time = 0
-        inp.union.ki.dwExtraInfo = self._extra
+        inp.ki.wVk = 0
+        inp.ki.wScan = scan_code
+        inp.ki.dwFlags = flags
+        inp.ki.time = 0
+        inp.ki.dwExtraInfo = self._extra
         return inp
     
     def key_down(self, key: str):
         """Press a key down"""
-        key_lower = key.lower()
-        if key_lower not in KEY_MAP:
+        down = _KEY_DOWN_FLAGS
+        if down is None:
+            down = _ensure_key_tables()[0]
+        entry = down.get(key) or down.get(key.lower())
+        if entry is None:
             return False
-        
-        scan_code = KEY_MAP[key_lower]
-        flags = KEYEVENTF_SCANCODE
-        if scan_code in EXTENDED_KEYS or key_lower in ['up', 'down', 'left', 'right']:
-            flags |= KEYEVENTF_EXTENDEDKEY
-        
-        inp = self._create_key_input(scan_code, flags)
-        self._send_input(inp)
+        self._send_key(entry[0], entry[1])
         return True
-    
+
     def key_up(self, key: str):
         """Release a key"""
-        key_lower = key.lower()
-        if key_lower not in KEY_MAP:
+        up = _KEY_UP_FLAGS
+        if up is None:
+            up = _ensure_key_tables()[1]
+        entry = up.get(key) or up.get(key.lower())
+        if entry is None:
             return False
-        
-        scan_code = KEY_MAP[key_lower]
-        flags = KEYEVENTF_SCANCODE | KEYEVENTF_KEYUP
-        if scan_code in EXTENDED_KEYS or key_lower in ['up', 'down', 'left', 'right']:
-            flags |= KEYEVENTF_EXTENDEDKEY
-        
-        inp = self._create_key_input(scan_code, flags)
-        self._send_input(inp)
+        self._send_key(entry[0], entry[1])
         return True
     
+    def _send_press(self, scan_code: int, flags: int):
+        """Send a down+up pair as a single SendInput call"""
+        down = self._press_arr[0].ki
+        down.wScan = scan_code
+        down.dwFlags = flags
+        up = self._press_arr[1].ki
+        up.wScan = scan_code
+        up.dwFlags = flags | KEYEVENTF_KEYUP
+        return user32.SendInput(2, self._press_arr, sizeof(INPUT))
+
     def press_key(self, key: str, duration: float = 0.08):
         """Press and release a key"""
-        self.key_down(key)
-        time.sleep(duration)
-        self.key_up(key)
+        down = _KEY_DOWN_FLAGS
+        if down is None:
+            down = _ensure_key_tables()[0]
+        entry = down.get(key) or down.get(key.lower())
+        if entry is None:
+            return False
+
+        scan_code, flags = entry
+        if duration <= 0.001:
+            # Sub-millisecond holds are effectively discrete presses: one
+            # kernel transition instead of down/sleep/up
+            self._send_press(scan_code, flags)
+        else:
+            self._send_key(scan_code, flags)
+            self._precise_sleep(duration)
+            self._send_key(scan_code, flags | KEYEVENTF_KEYUP)
+        return True
+
+    def press_key_instant(self, key: str):
+        """Press and release a key with no hold, in a single SendInput call"""
+        return self.press_key(key, duration=0.0)
+
+    def press_keys(self, keys):
+        """
+        Fire down+up pairs for several keys in one SendInput call. Use for
+        scripted combos where the game accepts back-to-back events; unmapped
+        keys are skipped.
+        """
+        down = _KEY_DOWN_FLAGS
+        if down is None:
+            down = _ensure_key_tables()[0]
+        entries = [e for e in
+                   (down.get(k) or down.get(k.lower()) for k in keys) if e]
+        if not entries:
+            return 0
+
+        n = len(entries) * 2
+        arr = self._batch_arrs.get(n)
+        if arr is None:
+            arr = self._batch_arrs[n] = (INPUT * n)()
+        for i, (scan_code, flags) in enumerate(entries):
+            for inp, fl in ((arr[2 * i], flags),
+                            (arr[2 * i + 1], flags | KEYEVENTF_KEYUP)):
+                inp.type = INPUT_KEYBOARD
+                ki = inp.ki
+                ki.wVk = 0
+                ki.wScan = scan_code
+                ki.dwFlags = fl
+                ki.time = 0
+                ki.dwExtraInfo = self._extra
+        return user32.SendInput(n, arr, sizeof(INPUT))
+
+    def _key_input_pair(self, key: str) -> Optional[tuple]:
+        """Build the (keydown, keyup) INPUT pair for a key, or None if unmapped"""
+        down = _KEY_DOWN_FLAGS
+        if down is None:
+            down = _ensure_key_tables()[0]
+        entry = down.get(key) or down.get(key.lower())
+        if entry is None:
+            return None
+
+        scan_code, flags = entry
+        return (self._create_key_input(scan_code, flags),
+                self._create_key_input(scan_code, flags | KEYEVENTF_KEYUP))
+
+    def press_keys_sequence(self, keys, hold_time: float = 0.08, gap_time: float = 0.05):
+        """
+        Press a sequence of keys with the given hold and gap times.
+        All SendInput structures are prebuilt up front so the timing loop does
+        no per-key dict lookups or struct construction. With hold_time <= 0 a
+        key's down+up events go out in a single SendInput call.
+        """
+        events = [pair for pair in (self._key_input_pair(k) for k in keys) if pair]
+
+        for down, up in events:
+            if hold_time > 0:
+                self._send_input(down)
+                self._precise_sleep(hold_time)
+                self._send_input(up)
+            else:
+                self._send_input(down, up)
+            self._precise_sleep(gap_time)
     
     def hold_key(self, key: str, duration: float):
         """Hold a key for specified duration"""
         self.key_down(key)
-        time.sleep(duration)
+        self._precise_sleep(duration)
         self.key_up(key)
     
     def is_key_pressed(self, key: str) -> bool:
         """Check if a key is currently pressed"""
-        key_lower = key.lower()
-        if key_lower not in VK_CODES:
+        vk_codes = _VK_CODES
+        if vk_codes is None:
+            vk_codes = _ensure_vk_codes()
+        code = vk_codes.get(key) or vk_codes.get(key.lower())
+        if code is None:
             return False
-        return bool(user32.GetAsyncKeyState(VK_CODES[key_lower]) & 0x8000)
+        return bool(user32.GetAsyncKeyState(code) & 0x8000)
     
     def mouse_move(self, x: int, y: int, absolute: bool = True):
         """Move the mouse cursor"""
-        inp = INPUT()
-        inp.type = INPUT_MOUSE
-        
+        mi = self._mouse_arr[0].mi
+
         if absolute:
             # Convert to normalized coordinates (0-65535)
-            screen_width = user32.GetSystemMetrics(0)
-            screen_height = user32.GetSystemMetrics(1)
-            inp.union.mi.dx = int(x * 65535 / screen_width)
-            inp.union.mi.dy = int(y * 65535 / screen_height)
-            inp.union.mi.dwFlags = MOUSEEVENTF_MOVE | MOUSEEVENTF_ABSOLUTE
+            mi.dx = int(x * self._x_scale)
+            mi.dy = int(y * self._y_scale)
+            mi.dwFlags = MOUSEEVENTF_MOVE | MOUSEEVENTF_ABSOLUTE
         else:
-            inp.union.mi.dx = x
-            inp.union.mi.dy = y
-            inp.union.mi.dwFlags = MOUSEEVENTF_MOVE
-        
-        inp.union.mi.mouseData = 0
-        inp.union.mi.time = 0
-        inp.union.mi.dwExtraInfo = self._extra
-        
-        self._send_input(inp)
-    
+            mi.dx = x
+            mi.dy = y
+            mi.dwFlags = MOUSEEVENTF_MOVE
+
+        user32.SendInput(1, self._mouse_arr, sizeof(INPUT))
+
     def mouse_click(self, button: str = 'left', x: Optional[int] = None, y: Optional[int] = None):
         """Click the mouse"""
         if x is not None and y is not None:
             self.mouse_move(x, y)
-            time.sleep(0.05)
-        
+            self._precise_sleep(0.05)
+
         if button == 'left':
             down_flag = MOUSEEVENTF_LEFTDOWN
             up_flag = MOUSEEVENTF_LEFTUP
         else:
             down_flag = MOUSEEVENTF_RIGHTDOWN
             up_flag = MOUSEEVENTF_RIGHTUP
-        
+
+        # dx/dy are ignored without MOUSEEVENTF_MOVE, so only flags change
+        mi = self._mouse_arr[0].mi
+
         # Mouse down
-        inp = INPUT()
-        inp.type = INPUT_MOUSE
-        inp.union.mi.dwFlags = down_flag
-        inp.union.mi.dwExtraInfo = self._extra
-        self._send_input(inp)
-        
-        time.sleep(0.05)
-        
+        mi.dwFlags = down_flag
+        user32.SendInput(1, self._mouse_arr, sizeof(INPUT))
+
+        self._precise_sleep(0.05)
+
         # Mouse up
-        inp.union.mi.dwFlags = up_flag
-        self._send_input(inp)
+        mi.dwFlags = up_flag
+        user32.SendInput(1, self._mouse_arr, sizeof(INPUT))
     
     def get_cursor_pos(self) -> tuple:
         """Get current cursor position"""
@@ -3,13 +3,173 @@ Mana Detection System
 Detects mana zero (exact) and mana low (approximate)
 """
 
+import ctypes
 import cv2
+import json
 import numpy as np
 from PIL import ImageGrab
 import os
+import threading
+import time
 from typing import Optional, Tuple
 from dataclasses import dataclass
 
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    from ctypes import wintypes
+    _user32 = ctypes.WinDLL('user32', use_last_error=True)
+    _gdi32 = ctypes.WinDLL('gdi32', use_last_error=True)
+    GDI_CAPTURE_AVAILABLE = True
+except (OSError, AttributeError):
+    GDI_CAPTURE_AVAILABLE = False
+
+if GDI_CAPTURE_AVAILABLE:
+    # Handles are pointer-sized; explicit signatures stop ctypes from
+    # truncating them to c_int on 64-bit
+    _user32.GetDC.argtypes = (ctypes.c_void_p,)
+    _user32.GetDC.restype = ctypes.c_void_p
+    _user32.ReleaseDC.argtypes = (ctypes.c_void_p, ctypes.c_void_p)
+    _user32.GetSystemMetrics.argtypes = (ctypes.c_int,)
+    _user32.GetSystemMetrics.restype = ctypes.c_int
+    _gdi32.CreateCompatibleDC.argtypes = (ctypes.c_void_p,)
+    _gdi32.CreateCompatibleDC.restype = ctypes.c_void_p
+    _gdi32.CreateCompatibleBitmap.argtypes = (ctypes.c_void_p, ctypes.c_int,
+                                              ctypes.c_int)
+    _gdi32.CreateCompatibleBitmap.restype = ctypes.c_void_p
+    _gdi32.SelectObject.argtypes = (ctypes.c_void_p, ctypes.c_void_p)
+    _gdi32.SelectObject.restype = ctypes.c_void_p
+    _gdi32.DeleteObject.argtypes = (ctypes.c_void_p,)
+    _gdi32.DeleteDC.argtypes = (ctypes.c_void_p,)
+    _gdi32.BitBlt.argtypes = (ctypes.c_void_p, ctypes.c_int, ctypes.c_int,
+                              ctypes.c_int, ctypes.c_int, ctypes.c_void_p,
+                              ctypes.c_int, ctypes.c_int, wintypes.DWORD)
+    _gdi32.GetDIBits.argtypes = (ctypes.c_void_p, ctypes.c_void_p,
+                                 wintypes.UINT, wintypes.UINT, ctypes.c_void_p,
+                                 ctypes.c_void_p, wintypes.UINT)
+
+    _SRCCOPY = 0x00CC0020
+    _DIB_RGB_COLORS = 0
+
+    class _BITMAPINFOHEADER(ctypes.Structure):
+        _fields_ = [
+            ('biSize', wintypes.DWORD),
+            ('biWidth', ctypes.c_long),
+            ('biHeight', ctypes.c_long),
+            ('biPlanes', wintypes.WORD),
+            ('biBitCount', wintypes.WORD),
+            ('biCompression', wintypes.DWORD),
+            ('biSizeImage', wintypes.DWORD),
+            ('biXPelsPerMeter', ctypes.c_long),
+            ('biYPelsPerMeter', ctypes.c_long),
+            ('biClrUsed', wintypes.DWORD),
+            ('biClrImportant', wintypes.DWORD),
+        ]
+
+    class _BITMAPINFO(ctypes.Structure):
+        _fields_ = [
+            ('bmiHeader', _BITMAPINFOHEADER),
+            ('bmiColors', wintypes.DWORD * 3),
+        ]
+
+    class _GdiCapture:
+        """
+        Reusable GDI BitBlt screen capture. PIL's ImageGrab allocates a
+        fresh image per grab and costs two extra framebuffer copies on the
+        way to a numpy array; this blits straight into a preallocated BGRA
+        buffer that is reused until the capture size changes.
+        """
+
+        def __init__(self):
+            self._screen_dc = _user32.GetDC(None)
+            self._mem_dc = _gdi32.CreateCompatibleDC(self._screen_dc)
+            self._bitmap = None
+            self._size = None
+            self._buf = None
+            self._bmi = None
+
+        def _ensure(self, width: int, height: int):
+            if self._size == (width, height):
+                return
+            if self._bitmap is not None:
+                _gdi32.DeleteObject(self._bitmap)
+            self._bitmap = _gdi32.CreateCompatibleBitmap(
+                self._screen_dc, width, height)
+            _gdi32.SelectObject(self._mem_dc, self._bitmap)
+            self._buf = np.empty((height, width, 4), dtype=np.uint8)
+            bmi = _BITMAPINFO()
+            bmi.bmiHeader.biSize = ctypes.sizeof(_BITMAPINFOHEADER)
+            bmi.bmiHeader.biWidth = width
+            bmi.bmiHeader.biHeight = -height  # negative = top-down rows
+            bmi.bmiHeader.biPlanes = 1
+            bmi.bmiHeader.biBitCount = 32
+            bmi.bmiHeader.biCompression = 0  # BI_RGB
+            self._bmi = bmi
+            self._size = (width, height)
+
+        def grab(self, bbox=None) -> np.ndarray:
+            """Capture `bbox` (left, top, right, bottom) or the full screen
+            into the shared BGRA buffer. The returned array is reused —
+            callers must not hold onto it across grabs."""
+            if bbox is None:
+                x = y = 0
+                width = _user32.GetSystemMetrics(0)
+                height = _user32.GetSystemMetrics(1)
+            else:
+                x, y, right, bottom = bbox
+                width, height = right - x, bottom - y
+            self._ensure(width, height)
+            _gdi32.BitBlt(self._mem_dc, 0, 0, width, height,
+                          self._screen_dc, x, y, _SRCCOPY)
+            _gdi32.GetDIBits(self._mem_dc, self._bitmap, 0, height,
+                             self._buf.ctypes.data_as(ctypes.c_void_p),
+                             ctypes.byref(self._bmi), _DIB_RGB_COLORS)
+            return self._buf
+
+        def close(self):
+            try:
+                if self._bitmap is not None:
+                    _gdi32.DeleteObject(self._bitmap)
+                    self._bitmap = None
+                if self._mem_dc is not None:
+                    _gdi32.DeleteDC(self._mem_dc)
+                    self._mem_dc = None
+                if self._screen_dc is not None:
+                    _user32.ReleaseDC(None, self._screen_dc)
+                    self._screen_dc = None
+            except Exception:
+                pass
+
+        def __del__(self):
+            self.close()
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True)
+    def _numba_best_match(results, thresholds):
+        """Best above-threshold maximum across a stack of equally sized
+        correlation result maps. Returns (map index, x, y), index -1 if
+        none clears its threshold."""
+        best_i, best_x, best_y = -1, -1, -1
+        best_v = -np.inf
+        for i in range(results.shape[0]):
+            for y in range(results.shape[1]):
+                for x in range(results.shape[2]):
+                    v = results[i, y, x]
+                    if v >= thresholds[i] and v > best_v:
+                        best_v = v
+                        best_i, best_x, best_y = i, x, y
+        return best_i, best_x, best_y
+
+# Learned search region persisted between runs
+BBOX_FILE = "mana_bbox.json"
+
+# Padding around a successful match when learning the search region
+BBOX_PAD = 100
+
 @dataclass
 class ManaStatus:
     """Current mana status"""
@@ -30,84 +190,219 @@ class ManaDetector:
     
     def __init__(self, images_folder: str = "images"):
         self.images_folder = images_folder
-        
-        # Templates
+
+        # OpenCV runtime knob: keep SIMD dispatch on. No setNumThreads here
+        # — the pool is process-global and image_recognition sizes it for
+        # the much larger card matchTemplate calls; capping it from this
+        # module would silently throttle that path too. The mana templates
+        # are tiny, so they barely use the pool either way.
+        try:
+            cv2.setUseOptimized(True)
+        except Exception:
+            pass
+
+
+        # Templates (grayscale — matching cost scales with channel count,
+        # and the zero/digit/orb shapes are all luminance-distinguishable)
         self._zero_template = None
         self._empty_orb_template = None
         self._full_orb_template = None
         self._digit_templates = {}
-        
+
+        # BGR orb templates for the optional color fullness comparison
+        self._empty_orb_bgr = None
+        self._full_orb_bgr = None
+
         # Detection settings
         self.zero_confidence = 0.93
         self.low_confidence = 0.80
         self.low_threshold = 50
+
+        # Match orb fullness in color instead of luminance (slower; only
+        # needed if the gray orbs prove ambiguous on some UI themes)
+        self.color_orb_matching = False
         
         # Region cache
         self.mana_region = None
+
+        # Where the mana digits live (screen coords, learned from a zero
+        # match) and which low digit hit last, tried first on later checks
+        self.digit_bbox: Optional[Tuple[int, int, int, int]] = None
+        self._last_digit_hit: Optional[int] = None
+
+        # Learned screen region (PIL bbox: left, top, right, bottom) that
+        # contains the mana UI. Full-screen matching is O(W*H*tw*th); once a
+        # match pins down where the orb lives, all later checks grab and
+        # scan only this small crop.
+        self.search_bbox: Optional[Tuple[int, int, int, int]] = None
+        self._load_bbox()
+
+        # Reused matchTemplate output buffers keyed by result shape, so the
+        # poll loop stops allocating a fresh float32 map per match
+        self._result_bufs: dict = {}
+
+        # Short-TTL frame memo: quick helpers like is_mana_zero and
+        # is_mana_low each capture on their own, and back-to-back polls
+        # within one frame interval can share a grab
+        self._frame_cache: Tuple[float, Optional[tuple], Optional[np.ndarray]] = (0.0, None, None)
+        self._frame_ttl = 0.03
+
+        # Background polling: a daemon thread refreshes _latest_status so
+        # consumers read mana state without paying capture+match latency
+        self._latest_status = ManaStatus()
+        self._bg_thread: Optional[threading.Thread] = None
+        self._bg_stop = threading.Event()
+
+        # Set once load_templates finishes, so code that needs templates
+        # can tell "not loaded yet" apart from "missing on disk"
+        self.templates_ready = threading.Event()
+
+        # Fast BitBlt capture where available; ImageGrab otherwise
+        self._gdi = None
+        if GDI_CAPTURE_AVAILABLE:
+            try:
+                self._gdi = _GdiCapture()
+            except Exception as e:
+                print(f"[!] GDI capture unavailable: {e}")
+
+    def _load_bbox(self):
+        """Restore the learned search region from a previous run"""
+        try:
+            if os.path.exists(BBOX_FILE):
+                with open(BBOX_FILE, 'r') as f:
+                    bbox = json.load(f)
+                if isinstance(bbox, list) and len(bbox) == 4:
+                    self.search_bbox = tuple(int(v) for v in bbox)
+        except Exception:
+            self.search_bbox = None
+
+    def _save_bbox(self):
+        """Persist the learned search region"""
+        try:
+            if self.search_bbox is not None:
+                with open(BBOX_FILE, 'w') as f:
+                    json.dump(list(self.search_bbox), f)
+        except Exception:
+            pass
+
+    def _learn_bbox(self, x: int, y: int, w: int, h: int):
+        """Cache a padded search region around a successful full-screen match"""
+        self.search_bbox = (max(x - BBOX_PAD, 0), max(y - BBOX_PAD, 0),
+                            x + w + BBOX_PAD, y + h + BBOX_PAD)
+        self._save_bbox()
     
     def load_templates(self) -> bool:
         """Load mana detection templates"""
         loaded = 0
+        self._result_bufs.clear()
+        self.templates_ready.clear()
         
         # Zero template (required)
         zero_path = os.path.join(self.images_folder, "mana_zero.png")
         if os.path.exists(zero_path):
-            self._zero_template = cv2.imread(zero_path)
+            self._zero_template = cv2.imread(zero_path, cv2.IMREAD_GRAYSCALE)
             if self._zero_template is not None:
                 print("[+] Loaded mana_zero.png")
                 loaded += 1
         else:
             print("[!] mana_zero.png not found")
-        
+
         # Empty orb template (recommended)
         empty_path = os.path.join(self.images_folder, "mana_orb_empty.png")
         if os.path.exists(empty_path):
-            self._empty_orb_template = cv2.imread(empty_path)
+            self._empty_orb_template = cv2.imread(empty_path, cv2.IMREAD_GRAYSCALE)
+            self._empty_orb_bgr = cv2.imread(empty_path)
             if self._empty_orb_template is not None:
                 print("[+] Loaded mana_orb_empty.png")
                 loaded += 1
-        
+
         # Full orb template (optional)
         full_path = os.path.join(self.images_folder, "mana_orb_full.png")
         if os.path.exists(full_path):
-            self._full_orb_template = cv2.imread(full_path)
+            self._full_orb_template = cv2.imread(full_path, cv2.IMREAD_GRAYSCALE)
+            self._full_orb_bgr = cv2.imread(full_path)
             if self._full_orb_template is not None:
                 print("[+] Loaded mana_orb_full.png")
                 loaded += 1
-        
+
         # Load digit templates if available (0-9)
         for digit in range(10):
             digit_path = os.path.join(self.images_folder, f"mana_digit_{digit}.png")
             if os.path.exists(digit_path):
-                template = cv2.imread(digit_path)
+                template = cv2.imread(digit_path, cv2.IMREAD_GRAYSCALE)
                 if template is not None:
                     self._digit_templates[digit] = template
         
         if self._digit_templates:
             print(f"[+] Loaded {len(self._digit_templates)} digit templates")
-        
+
+        self.templates_ready.set()
         return loaded > 0
     
-    def capture_screen(self) -> np.ndarray:
-        """Capture current screen"""
-        screenshot = ImageGrab.grab()
-        return cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
+    def invalidate_capture(self):
+        """Drop the memoized frame (call after inputs change the screen)"""
+        self._frame_cache = (0.0, None, None)
+
+    def capture_screen(self, color: bool = False,
+                       bbox: Optional[Tuple[int, int, int, int]] = None) -> np.ndarray:
+        """Capture the screen, or just `bbox` (grayscale by default).
+        Captures are memoized for a ~30 ms window per (color, bbox)."""
+        now = time.monotonic()
+        cached_at, cached_key, cached_frame = self._frame_cache
+        key = (color, bbox)
+        if cached_frame is not None and key == cached_key \
+                and now - cached_at < self._frame_ttl:
+            return cached_frame
+
+        frame = self._grab(color, bbox)
+        self._frame_cache = (now, key, frame)
+        return frame
+
+    def _grab(self, color: bool, bbox) -> np.ndarray:
+        if self._gdi is not None:
+            try:
+                frame = self._gdi.grab(bbox)
+                code = cv2.COLOR_BGRA2BGR if color else cv2.COLOR_BGRA2GRAY
+                return cv2.cvtColor(frame, code)
+            except Exception as e:
+                print(f"[!] GDI capture failed, falling back to PIL: {e}")
+                self._gdi = None
+        screenshot = ImageGrab.grab(bbox=bbox)
+        # np.asarray wraps the PIL buffer without copying; cvtColor then
+        # writes its own output, so the read-only view is fine
+        code = cv2.COLOR_RGB2BGR if color else cv2.COLOR_RGB2GRAY
+        return cv2.cvtColor(np.asarray(screenshot), code)
     
     def find_template(self, screen: np.ndarray, template: np.ndarray, 
                       confidence: float = 0.8) -> Optional[Tuple[int, int, float]]:
         """Find template in screen, return (x, y, confidence) or None"""
         if template is None:
             return None
-        
+
         try:
-            result = cv2.matchTemplate(screen, template, cv2.TM_CCOEFF_NORMED)
+            screen_h, screen_w = screen.shape[:2]
+            tpl_h, tpl_w = template.shape[:2]
+            if tpl_h > screen_h or tpl_w > screen_w:
+                return None
+
+            shape = (screen_h - tpl_h + 1, screen_w - tpl_w + 1)
+            buf = self._result_bufs.get(shape)
+            if buf is None:
+                buf = self._result_bufs[shape] = np.empty(shape, dtype=np.float32)
+
+            # CCOEFF on purpose: SQDIFF skips the mean-subtraction pass but
+            # its normalized scale scores near-flat regions and unrelated
+            # content far too high (~0.99 / ~0.81 after rescaling), blowing
+            # straight past thresholds that were tuned on this scale
+            result = cv2.matchTemplate(screen, template, cv2.TM_CCOEFF_NORMED,
+                                       result=buf)
             min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
-            
+
             if max_val >= confidence:
                 return (max_loc[0], max_loc[1], max_val)
         except Exception:
             pass
-        
+
         return None
     
     def detect_zero(self, screen: Optional[np.ndarray] = None) -> Tuple[bool, float]:
@@ -145,28 +440,74 @@ class ManaDetector:
             screen = self.capture_screen()
         
         result = self.find_template(screen, self._empty_orb_template, self.low_confidence)
-        
+
         if result:
-            return True, result[2]
-        
+            x, y, conf = result
+            h, w = self._empty_orb_template.shape[:2]
+            self.mana_region = (x, y, w, h)
+            return True, conf
+
         return False, 0.0
     
-    def detect_low_digit(self, screen: np.ndarray) -> Tuple[bool, Optional[int]]:
+    def detect_low_digit(self, screen: np.ndarray,
+                         offset: Tuple[int, int] = (0, 0)) -> Tuple[bool, Optional[int]]:
         """
         Detect if a low digit (0-5) is showing, indicating low mana.
-        
+
+        `offset` is the screen position of the capture's top-left corner,
+        used to map the learned digit region into capture coordinates.
+
         Returns: (is_low_digit, detected_digit)
         """
         if not self._digit_templates:
             return False, None
-        
-        # Check for digits 0-5 (low mana indicators)
-        for digit in range(6):
+
+        # Matching the whole capture per digit is wasteful — the digits sit
+        # in a tiny fixed box learned from the last zero match
+        region = screen
+        if self.digit_bbox is not None:
+            x, y, w, h = self.digit_bbox
+            x -= offset[0]
+            y -= offset[1]
+            x0, y0 = max(x, 0), max(y, 0)
+            x1 = min(x + w, screen.shape[1])
+            y1 = min(y + h, screen.shape[0])
+            if x1 > x0 and y1 > y0:
+                region = screen[y0:y1, x0:x1]
+
+        # With numba present and uniformly sized digit templates, match all
+        # digits and let one compiled kernel pick the best sub-threshold
+        # minimum across the stacked result maps
+        digits = [d for d in range(6) if d in self._digit_templates]
+        if NUMBA_AVAILABLE and digits:
+            shapes = {self._digit_templates[d].shape for d in digits}
+            if len(shapes) == 1:
+                tpl_h, tpl_w = next(iter(shapes))
+                if tpl_h <= region.shape[0] and tpl_w <= region.shape[1]:
+                    maps = np.stack([
+                        cv2.matchTemplate(region, self._digit_templates[d],
+                                          cv2.TM_CCOEFF_NORMED)
+                        for d in digits])
+                    # Same 0.88 threshold the sequential path passes below
+                    thresholds = np.full(len(digits), 0.88, dtype=np.float32)
+                    idx, x, y = _numba_best_match(maps, thresholds)
+                    if idx >= 0:
+                        self._last_digit_hit = digits[idx]
+                        return True, digits[idx]
+                    return False, None
+
+        # Check for digits 0-5 (low mana indicators), last hit first
+        order = range(6)
+        if self._last_digit_hit is not None:
+            last = self._last_digit_hit
+            order = [last] + [d for d in range(6) if d != last]
+        for digit in order:
             if digit in self._digit_templates:
-                result = self.find_template(screen, self._digit_templates[digit], 0.88)
+                result = self.find_template(region, self._digit_templates[digit], 0.88)
                 if result:
+                    self._last_digit_hit = digit
                     return True, digit
-        
+
         return False, None
     
     def compare_orb_fullness(self, screen: np.ndarray) -> Optional[float]:
@@ -177,9 +518,15 @@ class ManaDetector:
         """
         if self._full_orb_template is None or self._empty_orb_template is None:
             return None
-        
-        full_result = self.find_template(screen, self._full_orb_template, 0.6)
-        empty_result = self.find_template(screen, self._empty_orb_template, 0.6)
+
+        full_tpl, empty_tpl = self._full_orb_template, self._empty_orb_template
+        if self.color_orb_matching and self._full_orb_bgr is not None \
+                and self._empty_orb_bgr is not None:
+            screen = self.capture_screen(color=True)
+            full_tpl, empty_tpl = self._full_orb_bgr, self._empty_orb_bgr
+
+        full_result = self.find_template(screen, full_tpl, 0.6)
+        empty_result = self.find_template(screen, empty_tpl, 0.6)
         
         if full_result and empty_result:
             full_conf = full_result[2]
@@ -194,49 +541,144 @@ class ManaDetector:
         
         return None
     
-    def check_status(self) -> ManaStatus:
+    def _orb_visible(self, screen: np.ndarray) -> bool:
+        """Whether either orb template can be found in the capture at all"""
+        if self._full_orb_template is None and self._empty_orb_template is None:
+            # Nothing to validate against; assume the region is still good
+            return True
+        for template in (self._full_orb_template, self._empty_orb_template):
+            if self.find_template(screen, template, 0.6):
+                return True
+        return False
+
+    def _expanded_bbox(self, bbox, factor: int = 2):
+        """A copy of `bbox` widened by factor * BBOX_PAD on every side"""
+        if bbox is None:
+            return None
+        left, top, right, bottom = bbox
+        pad = BBOX_PAD * factor
+        return (max(left - pad, 0), max(top - pad, 0), right + pad, bottom + pad)
+
+    def _scan_region(self, bbox) -> Optional[ManaStatus]:
         """
-        Check current mana status.
-        
-        Returns ManaStatus with:
-        - is_zero: True if mana is exactly 0
-        - is_low: True if mana is low but not zero
-        - confidence: Detection confidence
+        Run the detection ladder over one capture of `bbox` (None = full
+        screen). Returns None when a learned region no longer shows the mana
+        orb at all, signalling the caller to widen or drop it.
         """
-        screen = self.capture_screen()
+        screen = self.capture_screen(bbox=bbox)
+        offset_x, offset_y = (bbox[0], bbox[1]) if bbox else (0, 0)
         status = ManaStatus()
-        
+
         # Check for zero first (highest priority)
         is_zero, zero_conf = self.detect_zero(screen)
         if is_zero:
+            x, y, w, h = self.mana_region
+            self.mana_region = (x + offset_x, y + offset_y, w, h)
+            if bbox is None:
+                self._learn_bbox(*self.mana_region)
+            # Digits render where the zero did; remember a padded box wide
+            # enough for two-digit values
+            gx, gy = self.mana_region[:2]
+            self.digit_bbox = (max(gx - w, 0), max(gy - h // 2, 0), 3 * w, 2 * h)
             status.is_zero = True
             status.is_low = True
             status.confidence = zero_conf
             status.detected_region = self.mana_region
             return status
-        
+
         # Check for low mana by orb appearance
         is_low_orb, orb_conf = self.detect_low_by_orb(screen)
         if is_low_orb:
+            x, y, w, h = self.mana_region
+            self.mana_region = (x + offset_x, y + offset_y, w, h)
+            if bbox is None:
+                self._learn_bbox(*self.mana_region)
             status.is_low = True
             status.confidence = orb_conf
             return status
-        
+
         # Check for low digits
-        is_low_digit, digit = self.detect_low_digit(screen)
+        is_low_digit, digit = self.detect_low_digit(screen, offset=(offset_x, offset_y))
         if is_low_digit:
             status.is_low = True
             status.confidence = 0.85
             return status
-        
+
         # Compare orb fullness as fallback
         fullness = self.compare_orb_fullness(screen)
         if fullness is not None and fullness < 0.3:
             status.is_low = True
             status.confidence = 0.7
-        
+
+        if bbox is not None and not status.is_low and not self._orb_visible(screen):
+            return None
         return status
+
+    def check_status(self) -> ManaStatus:
+        """
+        Check current mana status.
+
+        Returns ManaStatus with:
+        - is_zero: True if mana is exactly 0
+        - is_low: True if mana is low but not zero
+        - confidence: Detection confidence
+        """
+        bbox = self.search_bbox
+        status = self._scan_region(bbox)
+        if status is not None:
+            return status
+
+        # The learned region no longer shows the orb (HUD moved or was
+        # resized) — widen once, then fall back to a full-screen scan
+        self.search_bbox = self._expanded_bbox(bbox)
+        status = self._scan_region(self.search_bbox)
+        if status is not None:
+            self._save_bbox()
+            return status
+
+        self.search_bbox = None
+        return self._scan_region(None) or ManaStatus()
     
+    def start_background(self, poll_hz: float = 20.0):
+        """Poll mana status on a daemon thread; read it via latest()"""
+        if self._bg_thread is not None and self._bg_thread.is_alive():
+            return
+        self._bg_stop.clear()
+        self._bg_thread = threading.Thread(
+            target=self._bg_loop, args=(poll_hz,),
+            name='mana-detector', daemon=True)
+        self._bg_thread.start()
+        print(f"[+] Mana detection polling in background at {poll_hz:g} Hz")
+
+    def stop_background(self):
+        """Stop the background polling thread"""
+        self._bg_stop.set()
+        if self._bg_thread is not None:
+            self._bg_thread.join(timeout=1.0)
+            self._bg_thread = None
+
+    def _bg_loop(self, poll_hz: float):
+        interval = 1.0 / poll_hz if poll_hz > 0 else 0.05
+        while not self._bg_stop.is_set():
+            started = time.monotonic()
+            try:
+                # Single reference assignment, so readers never see a
+                # half-written status
+                self._latest_status = self.check_status()
+            except Exception as e:
+                print(f"[!] Background mana check failed: {e}")
+            elapsed = time.monotonic() - started
+            self._bg_stop.wait(max(interval - elapsed, 0.0))
+
+    def latest(self) -> ManaStatus:
+        """Most recent background status (never blocks on a capture)"""
+        return self._latest_status
+
+    def reset_latest(self):
+        """Drop the last background status after the screen changed under
+        it (e.g. a refill just ran), so a stale zero cannot re-trigger"""
+        self._latest_status = ManaStatus()
+
     def is_mana_zero(self) -> bool:
         """Quick check if mana is zero"""
         is_zero, _ = self.detect_zero()
@@ -3,18 +3,76 @@ Mana Refill Sequence Handler
 Executes customizable combo sequences
 """
 
+import threading
 import time
+from dataclasses import dataclass
 from typing import Callable, Optional, List, Dict
 from .config import config
 from .controller_emulator import controller, XboxButton, BUTTON_MAP
 
+
+@dataclass(slots=True)
+class CompiledStep:
+    """A combo step pre-parsed from its config dict, bound to its handler"""
+    action: str
+    handler: Optional[Callable[[str, float], None]]
+    value: str
+    duration: float
+    repeat: int
+
+# Stick vectors by direction name
+_STICK_VECTORS = {
+    'left': (-32768, 0),
+    'right': (32767, 0),
+    'up': (0, 32767),
+    'forward': (0, 32767),
+    'down': (0, -32768),
+    'back': (0, -32768),
+}
+
+# Timed stick-pulse actions: (x, y, log label)
+_PULSE_VECTORS = {
+    'stick_forward': (0, 32767, 'Forward'),
+    'stick_back': (0, -32768, 'Back'),
+    'stick_left': (-32768, 0, 'Left'),
+    'stick_right': (32767, 0, 'Right'),
+}
+
+
 class ComboExecutor:
     """Executes customizable combo sequences from config"""
-    
+
     def __init__(self):
         self._running = False
         self._log_callback: Optional[Callable[[str], None]] = None
         self._last_action_time = time.time()
+
+        # Abort signal for a running combo. The hot repeat loops read this
+        # attribute directly — far cheaper than calling a stop_check
+        # function tens of times per step
+        self._stop_flag = False
+
+        # Config values cached against config.version, so the poll loop
+        # stops chasing attribute chains on every should_refill call
+        self._cfg_version = -1
+        self._enabled = True
+        self._idle_timeout = 180.0
+        self._compiled: List[CompiledStep] = []
+
+        # Step dispatch: one dict probe instead of walking an if/elif
+        # ladder for every repeat of every step
+        self._actions: Dict[str, Callable[[str, float], None]] = {
+            'button': self._do_button,
+            'wait': self._do_wait,
+            'stick_forward': self._do_stick_forward,
+            'stick_back': self._do_stick_back,
+            'stick_left': self._do_stick_left,
+            'stick_right': self._do_stick_right,
+            'stick_hold': self._do_stick_hold,
+            'stick_release': self._do_stick_release,
+            'trigger_hold': self._do_trigger_hold,
+            'trigger_release': self._do_trigger_release,
+        }
     
     def set_log_callback(self, callback: Callable[[str], None]):
         self._log_callback = callback
@@ -30,110 +88,175 @@ class ComboExecutor:
     def get_idle_time(self) -> float:
         return time.time() - self._last_action_time
     
+    def _refresh_config(self):
+        """Re-cache config-derived values when the config has changed"""
+        if self._cfg_version != config.version:
+            self._enabled = config.mana_refill.enabled
+            self._idle_timeout = config.mana_refill.idle_timeout_seconds
+            # config.combo_soa already did the per-step dict parsing (and
+            # save() invalidates it), so compiling is just zipping the
+            # columns onto handlers
+            actions, values, durations, repeats = config.combo_soa
+            self._compiled = [
+                CompiledStep(action, self._actions.get(action),
+                             value, duration, repeat)
+                for action, value, duration, repeat
+                in zip(actions, values, durations, repeats)
+            ]
+            self._fuse_steps(self._compiled)
+            self._cfg_version = config.version
+
+    def _fuse_steps(self, compiled: List[CompiledStep]):
+        """
+        Peephole pass over the compiled steps: a stick pulse immediately
+        followed by a shorter button press collapses into one handler that
+        carries the stick push and the button press in a single
+        controller.update(), presses the button while the stick is still
+        held, and recenters on one final update. Three state flushes
+        instead of the five the two separate steps would cost.
+        """
+        i = 0
+        while i < len(compiled) - 1:
+            step, nxt = compiled[i], compiled[i + 1]
+            if (step.action in _PULSE_VECTORS and step.repeat == 1
+                    and nxt.action == 'button' and nxt.repeat == 1
+                    and nxt.value.upper() in BUTTON_MAP
+                    and nxt.duration < step.duration):
+                x, y, label = _PULSE_VECTORS[step.action]
+                button = BUTTON_MAP[nxt.value.upper()]
+                compiled[i:i + 2] = [CompiledStep(
+                    f"{step.action}+button",
+                    self._make_fused_stick_button(
+                        x, y, label, button, nxt.value, nxt.duration),
+                    step.value,
+                    step.duration,
+                    1,
+                )]
+            i += 1
+
+    def _make_fused_stick_button(self, x: int, y: int, label: str,
+                                 button, button_name: str,
+                                 press_duration: float):
+        """Build a handler running a stick pulse and button press fused"""
+        def handler(value: str, duration: float):
+            self._log(f"    Stick {label} + Button {button_name}: {duration}s")
+            controller.set_stick(True, x, y)
+            controller.set_button(button, True)
+            controller.update()
+            time.sleep(press_duration)
+            controller.set_button(button, False)
+            controller.update()
+            remaining = duration - press_duration
+            if remaining > 0:
+                time.sleep(remaining)
+            controller.set_stick(True, 0, 0)
+            controller.update()
+        return handler
+
     def should_refill(self, mana_is_zero: bool, mana_is_low: bool) -> bool:
-        if not config.mana_refill.enabled:
+        self._refresh_config()
+        if not self._enabled:
             return False
-        
+
         if mana_is_zero:
             return True
-        
+
         if mana_is_low:
             idle_time = self.get_idle_time()
-            if idle_time >= config.mana_refill.idle_timeout_seconds:
+            if idle_time >= self._idle_timeout:
                 self._log(f"[!] Low mana and idle for {idle_time:.0f}s, triggering refill")
                 return True
         
         return False
     
-    def _execute_step(self, step: Dict, stop_check: Optional[Callable[[], bool]] = None) -> bool:
-        """Execute a single combo step"""
-        action = step.get('action', '')
-        value = step.get('value', '')
-        duration = step.get('duration', 0.1)
-        repeat = step.get('repeat', 1)
-        
-        for i in range(repeat):
-            if stop_check and stop_check():
+    # ---- step handlers (all take the step's value and duration) ----
+
+    def _do_button(self, value: str, duration: float):
+        # Press a button
+        if value.upper() in BUTTON_MAP:
+            self._log(f"    Button: {value}")
+            controller.press_button(BUTTON_MAP[value.upper()], duration)
+            time.sleep(0.1)
+
+    def _do_wait(self, value: str, duration: float):
+        self._log(f"    Wait: {duration}s")
+        time.sleep(duration)
+
+    def _stick_pulse(self, x: int, y: int, duration: float, label: str):
+        """Push the left stick for `duration`, then recenter"""
+        self._log(f"    Stick {label}: {duration}s")
+        controller.set_stick(True, x, y)
+        controller.update()
+        time.sleep(duration)
+        controller.set_stick(True, 0, 0)
+        controller.update()
+
+    def _do_stick_forward(self, value: str, duration: float):
+        self._stick_pulse(0, 32767, duration, "Forward")
+
+    def _do_stick_back(self, value: str, duration: float):
+        self._stick_pulse(0, -32768, duration, "Back")
+
+    def _do_stick_left(self, value: str, duration: float):
+        self._stick_pulse(-32768, 0, duration, "Left")
+
+    def _do_stick_right(self, value: str, duration: float):
+        self._stick_pulse(32767, 0, duration, "Right")
+
+    def _do_stick_hold(self, value: str, duration: float):
+        # Hold stick without releasing
+        direction = value.lower()
+        self._log(f"    Stick Hold: {direction}")
+        vector = _STICK_VECTORS.get(direction)
+        if vector:
+            controller.set_stick(True, vector[0], vector[1])
+        controller.update()
+        if duration > 0:
+            time.sleep(duration)
+
+    def _do_stick_release(self, value: str, duration: float):
+        self._log(f"    Stick Release")
+        controller.set_stick(True, 0, 0)
+        controller.update()
+
+    def _do_trigger_hold(self, value: str, duration: float):
+        is_left = value.lower() == 'left'
+        self._log(f"    Trigger Hold: {'Left' if is_left else 'Right'}")
+        controller.set_trigger(is_left, 255)
+        controller.update()
+        if duration > 0:
+            time.sleep(duration)
+
+    def _do_trigger_release(self, value: str, duration: float):
+        is_left = value.lower() == 'left'
+        self._log(f"    Trigger Release: {'Left' if is_left else 'Right'}")
+        controller.set_trigger(is_left, 0)
+        controller.update()
+
+    def stop(self):
+        """Abort the combo currently executing, if any"""
+        self._stop_flag = True
+
+    def _poll_stop(self, stop_check: Callable[[], bool]):
+        """Mirror a legacy stop_check callable onto the stop flag"""
+        while self._running and not self._stop_flag:
+            try:
+                if stop_check():
+                    self._stop_flag = True
+                    break
+            except Exception:
+                break
+            time.sleep(0.05)
+
+    def _execute_step(self, step: CompiledStep) -> bool:
+        """Execute a single compiled combo step"""
+        handler = step.handler
+        for i in range(step.repeat):
+            if self._stop_flag:
                 return False
-            
-            if action == 'button':
-                # Press a button
-                if value.upper() in BUTTON_MAP:
-                    self._log(f"    Button: {value}")
-                    controller.press_button(BUTTON_MAP[value.upper()], duration)
-                    time.sleep(0.1)
-            
-            elif action == 'wait':
-                self._log(f"    Wait: {duration}s")
-                time.sleep(duration)
-            
-            elif action == 'stick_forward':
-                self._log(f"    Stick Forward: {duration}s")
-                controller.set_stick(True, 0, 32767)
-                controller.update()
-                time.sleep(duration)
-                controller.set_stick(True, 0, 0)
-                controller.update()
-            
-            elif action == 'stick_back':
-                self._log(f"    Stick Back: {duration}s")
-                controller.set_stick(True, 0, -32768)
-                controller.update()
-                time.sleep(duration)
-                controller.set_stick(True, 0, 0)
-                controller.update()
-            
-            elif action == 'stick_left':
-                self._log(f"    Stick Left: {duration}s")
-                controller.set_stick(True, -32768, 0)
-                controller.update()
-                time.sleep(duration)
-                controller.set_stick(True, 0, 0)
-                controller.update()
-            
-            elif action == 'stick_right':
-                self._log(f"    Stick Right: {duration}s")
-                controller.set_stick(True, 32767, 0)
-                controller.update()
-                time.sleep(duration)
-                controller.set_stick(True, 0, 0)
-                controller.update()
-            
-            elif action == 'stick_hold':
-                # Hold stick without releasing
-                direction = value.lower()
-                self._log(f"    Stick Hold: {direction}")
-                if direction == 'left':
-                    controller.set_stick(True, -32768, 0)
-                elif direction == 'right':
-                    controller.set_stick(True, 32767, 0)
-                elif direction in ['up', 'forward']:
-                    controller.set_stick(True, 0, 32767)
-                elif direction in ['down', 'back']:
-                    controller.set_stick(True, 0, -32768)
-                controller.update()
-                if duration > 0:
-                    time.sleep(duration)
-            
-            elif action == 'stick_release':
-                self._log(f"    Stick Release")
-                controller.set_stick(True, 0, 0)
-                controller.update()
-            
-            elif action == 'trigger_hold':
-                is_left = value.lower() == 'left'
-                self._log(f"    Trigger Hold: {'Left' if is_left else 'Right'}")
-                controller.set_trigger(is_left, 255)
-                controller.update()
-                if duration > 0:
-                    time.sleep(duration)
-            
-            elif action == 'trigger_release':
-                is_left = value.lower() == 'left'
-                self._log(f"    Trigger Release: {'Left' if is_left else 'Right'}")
-                controller.set_trigger(is_left, 0)
-                controller.update()
-        
+            if handler is not None:
+                handler(step.value, step.duration)
+
         return True
     
     def execute(self, stop_check: Callable[[], bool] = None) -> bool:
@@ -142,20 +265,28 @@ class ComboExecutor:
             return False
         
         self._running = True
-        combo = config.mana_refill_combo
-        
+        self._stop_flag = False
+        self._refresh_config()
+        combo = self._compiled
+
+        # Callers that still hand in a stop_check get it polled onto the
+        # flag from a side thread; new callers can just call stop()
+        if stop_check is not None:
+            threading.Thread(target=self._poll_stop, args=(stop_check,),
+                             name='combo-stop-poll', daemon=True).start()
+
         try:
             self._log("[*] === STARTING COMBO SEQUENCE ===")
             self._log(f"[*] {len(combo)} steps to execute")
-            
+
             for i, step in enumerate(combo):
-                if stop_check and stop_check():
+                if self._stop_flag:
                     self._log("[X] Combo aborted")
                     return False
-                
-                self._log(f"[{i+1}/{len(combo)}] {step.get('action', 'unknown')}")
-                
-                if not self._execute_step(step, stop_check):
+
+                self._log(f"[{i+1}/{len(combo)}] {step.action or 'unknown'}")
+
+                if not self._execute_step(step):
                     return False
             
             self._log("[*] === COMBO SEQUENCE COMPLETE ===")
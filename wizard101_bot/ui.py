@@ -6,20 +6,55 @@ With Auto-Updater Integration
 
 import customtkinter as ctk
 from tkinter import messagebox, filedialog
+import sys
 import threading
 import time
+from collections import deque
+from queue import SimpleQueue, Empty
 from typing import Optional, Dict, Tuple
 import os
 import json
 
+try:
+    import orjson
+
+    def _json_loads(text: str):
+        return orjson.loads(text)
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+try:
+    import keyboard
+    KEYBOARD_AVAILABLE = True
+except ImportError:
+    KEYBOARD_AVAILABLE = False
+
 from .config import config, AppConfig
 from .bot_engine import bot_engine, BotMode, BotState
 from .controller_emulator import controller, XboxButton
 from .input_handler import input_handler
 from .mana_refill import mana_refill
-from .mana_detection import mana_detector
 from .updater import updater
 
+# image_recognition drags cv2 in, which is too heavy for GUI launch
+# (bot_engine defers it the same way); resolved once on first use
+_image_recognition = None
+
+
+def _irec():
+    """One-shot lazy import of (image_recognition, CardType)"""
+    global _image_recognition
+    if _image_recognition is None:
+        from .image_recognition import image_recognition, CardType
+        _image_recognition = (image_recognition, CardType)
+    return _image_recognition
+
 # Custom colors - Dark Grey + Lavender
 COLORS = {
     'bg_dark': '#1a1a2e',
@@ -35,65 +70,113 @@ COLORS = {
     'error': '#f56c6c',
 }
 
+# Interned once: these hex strings are passed to configure() constantly,
+# and interning lets identity checks short-circuit the string hashing
+COLORS = {k: sys.intern(v) for k, v in COLORS.items()}
+
+# Frequently-used colors resolved to module constants at import, so widget
+# construction and configure() calls skip the dict lookup
+BG_DARK = COLORS['bg_dark']
+BG_MEDIUM = COLORS['bg_medium']
+BG_LIGHT = COLORS['bg_light']
+LAVENDER = COLORS['lavender']
+LAVENDER_DARK = COLORS['lavender_dark']
+LAVENDER_LIGHT = COLORS['lavender_light']
+TEXT = COLORS['text']
+TEXT_DIM = COLORS['text_dim']
+SUCCESS = COLORS['success']
+WARNING = COLORS['warning']
+ERROR = COLORS['error']
+
 ctk.set_appearance_mode("dark")
 
 
+# Themed widget defaults live on the class and merge in one C-level dict
+# splat per construction, instead of several setdefault probes each
+
+
 class ThemedFrame(ctk.CTkFrame):
+    _DEFAULTS = {'fg_color': BG_MEDIUM, 'corner_radius': 10}
+
     def __init__(self, parent, **kwargs):
-        kwargs.setdefault('fg_color', COLORS['bg_medium'])
-        kwargs.setdefault('corner_radius', 10)
-        super().__init__(parent, **kwargs)
+        super().__init__(parent, **{**self._DEFAULTS, **kwargs})
 
 
 class ThemedScrollableFrame(ctk.CTkScrollableFrame):
+    _DEFAULTS = {'fg_color': BG_DARK, 'corner_radius': 10}
+
     def __init__(self, parent, **kwargs):
-        kwargs.setdefault('fg_color', COLORS['bg_dark'])
-        kwargs.setdefault('corner_radius', 10)
-        super().__init__(parent, **kwargs)
+        super().__init__(parent, **{**self._DEFAULTS, **kwargs})
+        # Labels that get updated at runtime are pooled by slot key, so a
+        # repeated build reuses the existing widget instead of recreating
+        self._label_pool: Dict[str, ctk.CTkLabel] = {}
+
+    def _label(self, key: str, parent, **kwargs) -> ctk.CTkLabel:
+        """Return the pooled label for a layout slot, creating it once"""
+        label = self._label_pool.get(key)
+        if label is None or not label.winfo_exists():
+            label = ctk.CTkLabel(parent, **kwargs)
+            self._label_pool[key] = label
+        return label
 
 
 class ThemedButton(ctk.CTkButton):
+    _DEFAULTS = {
+        'fg_color': LAVENDER,
+        'hover_color': LAVENDER_DARK,
+        'text_color': '#ffffff',
+        'corner_radius': 8,
+    }
+
     def __init__(self, parent, **kwargs):
-        kwargs.setdefault('fg_color', COLORS['lavender'])
-        kwargs.setdefault('hover_color', COLORS['lavender_dark'])
-        kwargs.setdefault('text_color', '#ffffff')
-        kwargs.setdefault('corner_radius', 8)
-        super().__init__(parent, **kwargs)
+        super().__init__(parent, **{**self._DEFAULTS, **kwargs})
 
 
 class ThemedEntry(ctk.CTkEntry):
+    _DEFAULTS = {
+        'fg_color': BG_LIGHT,
+        'border_color': LAVENDER,
+        'text_color': TEXT,
+    }
+
     def __init__(self, parent, **kwargs):
-        kwargs.setdefault('fg_color', COLORS['bg_light'])
-        kwargs.setdefault('border_color', COLORS['lavender'])
-        kwargs.setdefault('text_color', COLORS['text'])
-        super().__init__(parent, **kwargs)
+        super().__init__(parent, **{**self._DEFAULTS, **kwargs})
 
 
 class ThemedSwitch(ctk.CTkSwitch):
+    _DEFAULTS = {
+        'progress_color': LAVENDER,
+        'button_color': LAVENDER_LIGHT,
+        'button_hover_color': LAVENDER,
+        'text_color': TEXT,
+    }
+
     def __init__(self, parent, **kwargs):
-        kwargs.setdefault('progress_color', COLORS['lavender'])
-        kwargs.setdefault('button_color', COLORS['lavender_light'])
-        kwargs.setdefault('button_hover_color', COLORS['lavender'])
-        kwargs.setdefault('text_color', COLORS['text'])
-        super().__init__(parent, **kwargs)
+        super().__init__(parent, **{**self._DEFAULTS, **kwargs})
 
 
 class ThemedSlider(ctk.CTkSlider):
+    _DEFAULTS = {
+        'progress_color': LAVENDER,
+        'button_color': LAVENDER_LIGHT,
+        'button_hover_color': LAVENDER,
+    }
+
     def __init__(self, parent, **kwargs):
-        kwargs.setdefault('progress_color', COLORS['lavender'])
-        kwargs.setdefault('button_color', COLORS['lavender_light'])
-        kwargs.setdefault('button_hover_color', COLORS['lavender'])
-        super().__init__(parent, **kwargs)
+        super().__init__(parent, **{**self._DEFAULTS, **kwargs})
 
 
 class ThemedOptionMenu(ctk.CTkOptionMenu):
+    _DEFAULTS = {
+        'fg_color': LAVENDER,
+        'button_color': LAVENDER_DARK,
+        'button_hover_color': LAVENDER,
+        'dropdown_fg_color': BG_MEDIUM,
+        'dropdown_hover_color': LAVENDER_DARK,
+    }
+
     def __init__(self, parent, **kwargs):
-        kwargs.setdefault('fg_color', COLORS['lavender'])
-        kwargs.setdefault('button_color', COLORS['lavender_dark'])
-        kwargs.setdefault('button_hover_color', COLORS['lavender'])
-        kwargs.setdefault('dropdown_fg_color', COLORS['bg_medium'])
-        kwargs.setdefault('dropdown_hover_color', COLORS['lavender_dark'])
-        super().__init__(parent, **kwargs)
+        super().__init__(parent, **{**self._DEFAULTS, **kwargs})
 
 
 class LogPanel(ThemedFrame):
@@ -102,58 +185,102 @@ class LogPanel(ThemedFrame):
         
         self.log_text = ctk.CTkTextbox(
             self, height=120, font=("Consolas", 10),
-            fg_color=COLORS['bg_light'], text_color=COLORS['text'],
+            fg_color=BG_LIGHT, text_color=TEXT,
             state="disabled"
         )
         self.log_text.pack(padx=5, pady=5, fill="both", expand=True)
         
         ThemedButton(self, text="Clear", command=self.clear, width=60, height=24).pack(pady=2)
-    
+
+        # Messages land in a ring buffer (safe to append from any thread)
+        # and a periodic Tk-side drain bulk-inserts them, amortizing the
+        # four Tk calls a single log line used to cost over a whole batch
+        self._queue: deque = deque(maxlen=1000)
+        self.after(100, self._drain)
+
     def log(self, message: str):
-        self.log_text.configure(state="normal")
-        self.log_text.insert("end", message + "\n")
-        self.log_text.see("end")
-        self.log_text.configure(state="disabled")
-    
+        self._queue.append(message)
+
+    # Oldest lines are dropped past this point so the Text widget does not
+    # grow (and slow down) without bound over a long session
+    MAX_LINES = 2000
+
+    def _drain(self):
+        if self._queue:
+            parts = []
+            while self._queue:
+                parts.append(self._queue.popleft())
+            self.log_text.configure(state="normal")
+            self.log_text.insert("end", "\n".join(parts) + "\n")
+            lines = int(self.log_text.index('end-1c').split('.')[0])
+            if lines > self.MAX_LINES:
+                self.log_text.delete('1.0', f'{lines - self.MAX_LINES}.0')
+            self.log_text.see("end")
+            self.log_text.configure(state="disabled")
+        self.after(100, self._drain)
+
     def clear(self):
         self.log_text.configure(state="normal")
         self.log_text.delete("1.0", "end")
         self.log_text.configure(state="disabled")
 
 
+# Status colors indexed by BotState.value (auto() starts at 1; slot 0 is
+# the fallback) — no dict literal rebuilt per status update. One slot per
+# enum member: WAITING takes the dim fallback the baseline dict gave it
+_STATE_COLORS = (TEXT_DIM, ERROR, SUCCESS, WARNING, TEXT_DIM)
+
+
 class BotControlTab(ThemedScrollableFrame):
     def __init__(self, parent, app):
         super().__init__(parent)
         self.app = app
-        
+
+        # Last rendered text per label: configure() costs a Tk round-trip
+        # and a redraw even when the text is identical, so skip it
+        self._last_text: Dict[str, str] = {}
+
+        # Changed labels are staged here and applied in one after_idle
+        # batch, so a burst of updates costs at most one redraw cycle
+        self._pending: Dict[str, tuple] = {}
+        self._dirty = False
+
+        # Repeated same-state callbacks skip the redraw entirely
+        self._last_status_state: Optional[BotState] = None
+
         ctk.CTkLabel(self, text="Bot Control", font=("Segoe UI", 20, "bold"),
-                    text_color=COLORS['lavender']).pack(pady=10)
+                    text_color=LAVENDER).pack(pady=10)
         
         # Mode selection
         mode_frame = ThemedFrame(self)
         mode_frame.pack(pady=10, padx=20, fill="x")
         
-        ctk.CTkLabel(mode_frame, text="Mode:", text_color=COLORS['text']).pack(side="left", padx=10)
+        ctk.CTkLabel(mode_frame, text="Mode:", text_color=TEXT).pack(side="left", padx=10)
         self.mode_var = ctk.StringVar(value="Simple")
-        ThemedOptionMenu(mode_frame, values=["Simple", "Advanced (Enchant)"], 
+        ThemedOptionMenu(mode_frame, values=["Simple", "Advanced (Enchant)"],
                         variable=self.mode_var, width=180).pack(side="left", padx=10)
+
+        # Resolve the mode string to its enum when the selection changes,
+        # not on every start click
+        self._selected_mode = BotMode.SIMPLE
+        self.mode_var.trace_add('write', self._on_mode_change)
         
         # Bot keys config
         keys_frame = ThemedFrame(self)
         keys_frame.pack(pady=10, padx=20, fill="x")
         
         ctk.CTkLabel(keys_frame, text="Bot Action Keys", font=("Segoe UI", 12, "bold"),
-                    text_color=COLORS['lavender']).pack(pady=5, anchor="w", padx=10)
+                    text_color=LAVENDER).pack(pady=5, anchor="w", padx=10)
         
-        key_row = ThemedFrame(keys_frame, fg_color=COLORS['bg_light'])
+        key_row = ThemedFrame(keys_frame, fg_color=BG_LIGHT)
         key_row.pack(pady=5, padx=10, fill="x")
         
-        ctk.CTkLabel(key_row, text="Select Card:", text_color=COLORS['text'], width=100).pack(side="left", padx=5)
+        ctk.CTkLabel(key_row, text="Select Card:", text_color=TEXT, width=100).pack(side="left", padx=5)
         self.select_key_entry = ThemedEntry(key_row, width=80)
         self.select_key_entry.insert(0, config.bot_keys.select_card)
         self.select_key_entry.pack(side="left", padx=5)
         
-        ctk.CTkLabel(key_row, text="Confirm:", text_color=COLORS['text'], width=70).pack(side="left", padx=5)
+        ctk.CTkLabel(key_row, text="Confirm:", text_color=TEXT, width=70).pack(side="left", padx=5)
         self.confirm_key_entry = ThemedEntry(key_row, width=80)
         self.confirm_key_entry.insert(0, config.bot_keys.confirm_cast)
         self.confirm_key_entry.pack(side="left", padx=5)
@@ -164,9 +291,10 @@ class BotControlTab(ThemedScrollableFrame):
         status_frame = ThemedFrame(self)
         status_frame.pack(pady=10, padx=20, fill="x")
         
-        ctk.CTkLabel(status_frame, text="Status:", text_color=COLORS['text']).pack(side="left", padx=10)
-        self.status_label = ctk.CTkLabel(status_frame, text="STOPPED", text_color=COLORS['error'],
-                                         font=("Segoe UI", 14, "bold"))
+        ctk.CTkLabel(status_frame, text="Status:", text_color=TEXT).pack(side="left", padx=10)
+        self.status_label = self._label('status', status_frame, text="STOPPED",
+                                        text_color=ERROR,
+                                        font=("Segoe UI", 14, "bold"))
         self.status_label.pack(side="left", padx=10)
         
         # Buttons
@@ -174,16 +302,16 @@ class BotControlTab(ThemedScrollableFrame):
         btn_frame.pack(pady=10, padx=20, fill="x")
         
         self.start_btn = ThemedButton(btn_frame, text="Start", command=self.start_bot,
-                                      fg_color=COLORS['success'], hover_color='#5aa865', width=100)
+                                      fg_color=SUCCESS, hover_color='#5aa865', width=100)
         self.start_btn.pack(side="left", padx=5, expand=True)
         
         self.pause_btn = ThemedButton(btn_frame, text="Pause", command=self.toggle_pause,
-                                      fg_color=COLORS['warning'], hover_color='#cf9235',
+                                      fg_color=WARNING, hover_color='#cf9235',
                                       width=100, state="disabled")
         self.pause_btn.pack(side="left", padx=5, expand=True)
         
         self.stop_btn = ThemedButton(btn_frame, text="Stop", command=self.stop_bot,
-                                     fg_color=COLORS['error'], hover_color='#d45c5c',
+                                     fg_color=ERROR, hover_color='#d45c5c',
                                      width=100, state="disabled")
         self.stop_btn.pack(side="left", padx=5, expand=True)
         
@@ -193,41 +321,65 @@ class BotControlTab(ThemedScrollableFrame):
         
         self.movement_var = ctk.BooleanVar(value=True)
         ThemedSwitch(toggle_frame, text="Movement Enabled", variable=self.movement_var,
-                    command=lambda: setattr(bot_engine, 'movement_enabled', self.movement_var.get())
-                    ).pack(pady=5, padx=10, anchor="w")
-        
+                    command=self._on_movement_toggle).pack(pady=5, padx=10, anchor="w")
+
         self.mana_refill_var = ctk.BooleanVar(value=config.mana_refill.enabled)
         ThemedSwitch(toggle_frame, text="Mana Refill Enabled", variable=self.mana_refill_var,
-                    command=lambda: setattr(config.mana_refill, 'enabled', self.mana_refill_var.get())
-                    ).pack(pady=5, padx=10, anchor="w")
-        
+                    command=self._on_mana_refill_toggle).pack(pady=5, padx=10, anchor="w")
+
         self.debug_var = ctk.BooleanVar(value=True)
         ThemedSwitch(toggle_frame, text="Debug Logging", variable=self.debug_var,
-                    command=lambda: setattr(bot_engine, 'debug_mode', self.debug_var.get())
-                    ).pack(pady=5, padx=10, anchor="w")
+                    command=self._on_debug_toggle).pack(pady=5, padx=10, anchor="w")
         
         # Stats
         stats_frame = ThemedFrame(self)
         stats_frame.pack(pady=10, padx=20, fill="x")
         
-        self.cycles_label = ctk.CTkLabel(stats_frame, text="Cycles: 0", text_color=COLORS['text'])
+        self.cycles_label = self._label('cycles', stats_frame, text="Cycles: 0", text_color=TEXT)
         self.cycles_label.pack(side="left", padx=20)
-        
-        self.casts_label = ctk.CTkLabel(stats_frame, text="Casts: 0", text_color=COLORS['text'])
+
+        self.casts_label = self._label('casts', stats_frame, text="Casts: 0", text_color=TEXT)
         self.casts_label.pack(side="left", padx=20)
-        
-        self.idle_label = ctk.CTkLabel(stats_frame, text="Idle: 0s", text_color=COLORS['text'])
+
+        self.idle_label = self._label('idle', stats_frame, text="Idle: 0s", text_color=TEXT)
         self.idle_label.pack(side="left", padx=20)
     
+    # Direct-assignment toggle handlers: bound methods beat the old
+    # setattr lambdas, and a no-op write is skipped entirely
+    def _on_movement_toggle(self):
+        value = self.movement_var.get()
+        if bot_engine.movement_enabled != value:
+            bot_engine.movement_enabled = value
+
+    def _on_mana_refill_toggle(self):
+        value = self.mana_refill_var.get()
+        if config.mana_refill.enabled != value:
+            config.mana_refill.enabled = value
+            # The combo executor caches this flag keyed on config.version,
+            # which otherwise only moves on save; bump it so the switch
+            # takes effect on the next should_refill, not the next save
+            config.version += 1
+
+    def _on_debug_toggle(self):
+        value = self.debug_var.get()
+        if bot_engine.debug_mode != value:
+            bot_engine.debug_mode = value
+
     def save_bot_keys(self):
         config.bot_keys.select_card = self.select_key_entry.get()
         config.bot_keys.confirm_cast = self.confirm_key_entry.get()
-        config.save()
+        self.app.schedule_save()
         self.app.log("[+] Bot keys saved")
     
+    def _on_mode_change(self, *args):
+        self._selected_mode = (BotMode.SIMPLE if "Simple" in self.mode_var.get()
+                               else BotMode.ADVANCED)
+
     def start_bot(self):
-        mode = BotMode.SIMPLE if "Simple" in self.mode_var.get() else BotMode.ADVANCED
-        bot_engine.start(mode)
+        from .mana_detection import mana_detector
+        if not mana_detector.templates_ready.is_set():
+            self.app.log("[!] Mana templates still loading, starting anyway...")
+        bot_engine.start(self._selected_mode)
         self.start_btn.configure(state="disabled")
         self.pause_btn.configure(state="normal")
         self.stop_btn.configure(state="normal")
@@ -243,43 +395,81 @@ class BotControlTab(ThemedScrollableFrame):
         self.pause_btn.configure(text="Resume" if bot_engine.state == BotState.PAUSED else "Pause")
     
     def update_status(self, state: BotState):
-        colors = {BotState.RUNNING: COLORS['success'], BotState.PAUSED: COLORS['warning'], 
-                  BotState.STOPPED: COLORS['error']}
-        self.status_label.configure(text=state.name, text_color=colors.get(state, COLORS['text_dim']))
-        
+        if state == self._last_status_state:
+            return
+        self._last_status_state = state
+
+        self.status_label.configure(text=state.name,
+                                    text_color=_STATE_COLORS[state.value])
+
         if state == BotState.STOPPED:
             self.start_btn.configure(state="normal")
             self.pause_btn.configure(state="disabled", text="Pause")
             self.stop_btn.configure(state="disabled")
     
+    def _set(self, label, key: str, text: str):
+        if self._last_text.get(key) != text:
+            self._last_text[key] = text
+            self._pending[key] = (label, text)
+            if not self._dirty:
+                self._dirty = True
+                self.after_idle(self._flush)
+
+    def _flush(self):
+        pending, self._pending = self._pending, {}
+        self._dirty = False
+        for label, text in pending.values():
+            label.configure(text=text)
+
     def update_stats(self):
-        self.cycles_label.configure(text=f"Cycles: {bot_engine.cycle_count}")
-        self.casts_label.configure(text=f"Casts: {bot_engine.successful_casts}")
-        self.idle_label.configure(text=f"Idle: {mana_refill.get_idle_time():.0f}s")
+        self._set(self.cycles_label, 'cycles', f"Cycles: {bot_engine.cycle_count}")
+        self._set(self.casts_label, 'casts', f"Casts: {bot_engine.successful_casts}")
+        self._set(self.idle_label, 'idle', f"Idle: {mana_refill.get_idle_time():.0f}s")
+
+
+# Button masks for the state preview, hoisted with raw int values so the
+# per-tick scan is plain C-level int ANDs instead of enum dispatch
+_BTN_NAMES = (
+    (XboxButton.A.value, "A"), (XboxButton.B.value, "B"),
+    (XboxButton.X.value, "X"), (XboxButton.Y.value, "Y"),
+    (XboxButton.DPAD_UP.value, "Up"), (XboxButton.DPAD_DOWN.value, "Dn"),
+    (XboxButton.DPAD_LEFT.value, "Lt"), (XboxButton.DPAD_RIGHT.value, "Rt"),
+    (XboxButton.LEFT_SHOULDER.value, "LB"), (XboxButton.RIGHT_SHOULDER.value, "RB"),
+)
 
 
 class ControllerTab(ThemedScrollableFrame):
     def __init__(self, parent, app):
         super().__init__(parent)
         self.app = app
-        
+
+        # Skip label configure() (and the string formatting feeding it)
+        # when the controller state hasn't moved since the last tick
+        self._last_text: Dict[str, str] = {}
+        self._last_state_tuple = None
+
+        # Same batched-flush scheme as BotControlTab: stage changed labels
+        # and apply them in one after_idle pass
+        self._pending: Dict[str, tuple] = {}
+        self._dirty = False
+
         ctk.CTkLabel(self, text="Controller Emulation", font=("Segoe UI", 20, "bold"),
-                    text_color=COLORS['lavender']).pack(pady=10)
+                    text_color=LAVENDER).pack(pady=10)
         
         # Status
         status_frame = ThemedFrame(self)
         status_frame.pack(pady=10, padx=20, fill="x")
         
-        ctk.CTkLabel(status_frame, text="Status:", text_color=COLORS['text']).pack(side="left", padx=10)
-        self.status_label = ctk.CTkLabel(status_frame, text="DISCONNECTED", 
-                                         text_color=COLORS['error'], font=("Segoe UI", 12, "bold"))
+        ctk.CTkLabel(status_frame, text="Status:", text_color=TEXT).pack(side="left", padx=10)
+        self.status_label = self._label('status', status_frame, text="DISCONNECTED",
+                                        text_color=ERROR, font=("Segoe UI", 12, "bold"))
         self.status_label.pack(side="left", padx=10)
         
         try:
             import vgamepad
-            vg_status, vg_color = "Installed", COLORS['success']
+            vg_status, vg_color = "Installed", SUCCESS
         except ImportError:
-            vg_status, vg_color = "Not Installed", COLORS['error']
+            vg_status, vg_color = "Not Installed", ERROR
         
         ctk.CTkLabel(status_frame, text=f"(vgamepad: {vg_status})", 
                     text_color=vg_color, font=("Segoe UI", 10)).pack(side="right", padx=10)
@@ -289,11 +479,11 @@ class ControllerTab(ThemedScrollableFrame):
         btn_frame.pack(pady=10, padx=20, fill="x")
         
         self.connect_btn = ThemedButton(btn_frame, text="Connect", command=self.connect,
-                                        fg_color=COLORS['success'], hover_color='#5aa865', width=120)
+                                        fg_color=SUCCESS, hover_color='#5aa865', width=120)
         self.connect_btn.pack(side="left", padx=10, expand=True)
         
         self.disconnect_btn = ThemedButton(btn_frame, text="Disconnect", command=self.disconnect,
-                                           fg_color=COLORS['error'], hover_color='#d45c5c',
+                                           fg_color=ERROR, hover_color='#d45c5c',
                                            width=120, state="disabled")
         self.disconnect_btn.pack(side="left", padx=10, expand=True)
         
@@ -308,24 +498,24 @@ class ControllerTab(ThemedScrollableFrame):
         self.polling_switch.pack(pady=5, padx=10, anchor="w")
         
         ctk.CTkLabel(poll_frame, text="Enable for smooth movement (rapid steps mode)",
-                    font=("Segoe UI", 10), text_color=COLORS['text_dim']).pack(padx=10, anchor="w")
+                    font=("Segoe UI", 10), text_color=TEXT_DIM).pack(padx=10, anchor="w")
         
         # Movement settings
         move_frame = ThemedFrame(self)
         move_frame.pack(pady=10, padx=20, fill="x")
         
         ctk.CTkLabel(move_frame, text="Movement Settings", font=("Segoe UI", 12, "bold"),
-                    text_color=COLORS['lavender']).pack(pady=5, anchor="w", padx=10)
+                    text_color=LAVENDER).pack(pady=5, anchor="w", padx=10)
         
-        step_row = ThemedFrame(move_frame, fg_color=COLORS['bg_light'])
+        step_row = ThemedFrame(move_frame, fg_color=BG_LIGHT)
         step_row.pack(pady=5, padx=10, fill="x")
         
-        ctk.CTkLabel(step_row, text="Step Duration (s):", text_color=COLORS['text'], width=120).pack(side="left", padx=5)
+        ctk.CTkLabel(step_row, text="Step Duration (s):", text_color=TEXT, width=120).pack(side="left", padx=5)
         self.step_dur_entry = ThemedEntry(step_row, width=60)
         self.step_dur_entry.insert(0, str(controller.step_duration))
         self.step_dur_entry.pack(side="left", padx=5)
         
-        ctk.CTkLabel(step_row, text="Gap (s):", text_color=COLORS['text'], width=60).pack(side="left", padx=5)
+        ctk.CTkLabel(step_row, text="Gap (s):", text_color=TEXT, width=60).pack(side="left", padx=5)
         self.step_gap_entry = ThemedEntry(step_row, width=60)
         self.step_gap_entry.insert(0, str(controller.step_gap))
         self.step_gap_entry.pack(side="left", padx=5)
@@ -337,18 +527,18 @@ class ControllerTab(ThemedScrollableFrame):
         state_frame.pack(pady=10, padx=20, fill="x")
         
         ctk.CTkLabel(state_frame, text="Controller State", font=("Segoe UI", 12, "bold"),
-                    text_color=COLORS['lavender']).pack(pady=5)
+                    text_color=LAVENDER).pack(pady=5)
         
-        self.buttons_label = ctk.CTkLabel(state_frame, text="Buttons: None", 
-                                          font=("Consolas", 10), text_color=COLORS['text'])
+        self.buttons_label = self._label('buttons', state_frame, text="Buttons: None",
+                                         font=("Consolas", 10), text_color=TEXT)
         self.buttons_label.pack(pady=2)
-        
-        self.sticks_label = ctk.CTkLabel(state_frame, text="L: (0,0) | R: (0,0)", 
-                                         font=("Consolas", 10), text_color=COLORS['text'])
+
+        self.sticks_label = self._label('sticks', state_frame, text="L: (0,0) | R: (0,0)",
+                                        font=("Consolas", 10), text_color=TEXT)
         self.sticks_label.pack(pady=2)
-        
-        self.triggers_label = ctk.CTkLabel(state_frame, text="LT: 0 | RT: 0", 
-                                           font=("Consolas", 10), text_color=COLORS['text'])
+
+        self.triggers_label = self._label('triggers', state_frame, text="LT: 0 | RT: 0",
+                                          font=("Consolas", 10), text_color=TEXT)
         self.triggers_label.pack(pady=2)
         
         # Help
@@ -356,7 +546,7 @@ class ControllerTab(ThemedScrollableFrame):
         help_frame.pack(pady=10, padx=20, fill="x")
         
         ctk.CTkLabel(help_frame, text="Setup Requirements", font=("Segoe UI", 12, "bold"),
-                    text_color=COLORS['lavender']).pack(pady=5)
+                    text_color=LAVENDER).pack(pady=5)
         
         help_text = """1. Install ViGEmBus driver:
    https://github.com/ViGEm/ViGEmBus/releases
@@ -366,14 +556,15 @@ class ControllerTab(ThemedScrollableFrame):
 3. Restart computer after installing ViGEmBus"""
         
         ctk.CTkLabel(help_frame, text=help_text, font=("Consolas", 10), 
-                    justify="left", text_color=COLORS['text']).pack(padx=10, anchor="w")
+                    justify="left", text_color=TEXT).pack(padx=10, anchor="w")
     
     def connect(self):
         if controller.connect():
-            self.status_label.configure(text="CONNECTED", text_color=COLORS['success'])
+            self.status_label.configure(text="CONNECTED", text_color=SUCCESS)
             self.connect_btn.configure(state="disabled")
             self.disconnect_btn.configure(state="normal")
             self.polling_switch.configure(state="normal")
+            self.app.start_preview()
             self.app.log("[+] Controller connected")
         else:
             self.app.log("[X] Failed to connect controller")
@@ -382,10 +573,11 @@ class ControllerTab(ThemedScrollableFrame):
     def disconnect(self):
         self.polling_var.set(False)
         controller.disconnect()
-        self.status_label.configure(text="DISCONNECTED", text_color=COLORS['error'])
+        self.status_label.configure(text="DISCONNECTED", text_color=ERROR)
         self.connect_btn.configure(state="normal")
         self.disconnect_btn.configure(state="disabled")
         self.polling_switch.configure(state="disabled")
+        self.app.stop_preview()
         self.app.log("[+] Controller disconnected")
     
     def toggle_polling(self):
@@ -404,39 +596,57 @@ class ControllerTab(ThemedScrollableFrame):
         except ValueError:
             messagebox.showerror("Error", "Invalid number format")
     
+    def _set(self, label, key: str, text: str):
+        if self._last_text.get(key) != text:
+            self._last_text[key] = text
+            self._pending[key] = (label, text)
+            if not self._dirty:
+                self._dirty = True
+                self.after_idle(self._flush)
+
+    def _flush(self):
+        pending, self._pending = self._pending, {}
+        self._dirty = False
+        for label, text in pending.values():
+            label.configure(text=text)
+
     def update_preview(self):
         if not controller.is_enabled:
             return
-        
+
         state = controller.state
-        
-        btns = []
-        btn_names = [
-            (XboxButton.A, "A"), (XboxButton.B, "B"), (XboxButton.X, "X"), (XboxButton.Y, "Y"),
-            (XboxButton.DPAD_UP, "Up"), (XboxButton.DPAD_DOWN, "Dn"),
-            (XboxButton.DPAD_LEFT, "Lt"), (XboxButton.DPAD_RIGHT, "Rt"),
-            (XboxButton.LEFT_SHOULDER, "LB"), (XboxButton.RIGHT_SHOULDER, "RB"),
-        ]
-        for btn, name in btn_names:
-            if state.buttons & btn:
-                btns.append(name)
-        
-        self.buttons_label.configure(text=f"Buttons: {', '.join(btns) if btns else 'None'}")
-        self.sticks_label.configure(text=f"L: ({state.left_stick_x},{state.left_stick_y}) | R: ({state.right_stick_x},{state.right_stick_y})")
-        self.triggers_label.configure(text=f"LT: {state.left_trigger} | RT: {state.right_trigger}")
+
+        # Idle controllers are the common case; bail before formatting
+        state_tuple = (state.buttons,
+                       state.left_stick_x, state.left_stick_y,
+                       state.right_stick_x, state.right_stick_y,
+                       state.left_trigger, state.right_trigger)
+        if state_tuple == self._last_state_tuple:
+            return
+        self._last_state_tuple = state_tuple
+
+        mask = int(state.buttons)
+        btns = [n for m, n in _BTN_NAMES if mask & m] if mask else None
+
+        self._set(self.buttons_label, 'buttons', f"Buttons: {', '.join(btns) if btns else 'None'}")
+        self._set(self.sticks_label, 'sticks', f"L: ({state.left_stick_x},{state.left_stick_y}) | R: ({state.right_stick_x},{state.right_stick_y})")
+        self._set(self.triggers_label, 'triggers', f"LT: {state.left_trigger} | RT: {state.right_trigger}")
 
 
 class ControllerBindingsTab(ThemedScrollableFrame):
     def __init__(self, parent, app):
         super().__init__(parent)
         self.app = app
-        self._entries: Dict[str, ThemedEntry] = {}
+
+        # Entries bind two-way through StringVars that write straight to
+        # config.controller on edit; Save just persists to disk
+        self._vars: Dict[str, ctk.StringVar] = {}
         
         ctk.CTkLabel(self, text="Controller Bindings", font=("Segoe UI", 20, "bold"),
-                    text_color=COLORS['lavender']).pack(pady=10)
+                    text_color=LAVENDER).pack(pady=10)
         
         ctk.CTkLabel(self, text="Enter keyboard key names (e.g., 'space', 'lctrl', 'w', 'up')",
-                    font=("Segoe UI", 10), text_color=COLORS['text_dim']).pack(pady=5)
+                    font=("Segoe UI", 10), text_color=TEXT_DIM).pack(pady=5)
         
         bindings = config.controller
         
@@ -480,7 +690,7 @@ class ControllerBindingsTab(ThemedScrollableFrame):
         mouse_frame.pack(pady=10, padx=20, fill="x")
         
         ctk.CTkLabel(mouse_frame, text="Mouse Bindings", font=("Segoe UI", 12, "bold"),
-                    text_color=COLORS['lavender']).pack(pady=5)
+                    text_color=LAVENDER).pack(pady=5)
         
         self.mouse_left_var = ctk.BooleanVar(value=bindings.mouse_left_trigger)
         ThemedSwitch(mouse_frame, text="Left Click -> Trigger", 
@@ -491,34 +701,35 @@ class ControllerBindingsTab(ThemedScrollableFrame):
                     variable=self.mouse_right_var).pack(pady=2, padx=10, anchor="w")
         
         ThemedButton(self, text="Save Bindings", command=self.save_bindings,
-                    fg_color=COLORS['success'], hover_color='#5aa865').pack(pady=20)
+                    fg_color=SUCCESS, hover_color='#5aa865').pack(pady=20)
     
     def _create_section(self, title: str, items: list):
         frame = ThemedFrame(self)
         frame.pack(pady=5, padx=20, fill="x")
-        
+
+        # Labels and entries grid directly into the section frame — no
+        # ThemedFrame per row, which roughly halves the canvas widget
+        # count and drops a layer of frame-resize propagation
         ctk.CTkLabel(frame, text=title, font=("Segoe UI", 12, "bold"),
-                    text_color=COLORS['lavender']).pack(pady=5, anchor="w", padx=10)
-        
-        for label, key, default in items:
-            row = ThemedFrame(frame, fg_color=COLORS['bg_light'])
-            row.pack(pady=2, padx=10, fill="x")
-            
-            ctk.CTkLabel(row, text=label, width=120, anchor="w", text_color=COLORS['text']).pack(side="left")
-            entry = ThemedEntry(row, width=100)
-            entry.insert(0, default)
-            entry.pack(side="left", padx=5)
-            self._entries[key] = entry
-    
+                    text_color=LAVENDER).grid(row=0, column=0, columnspan=2,
+                                                        pady=5, padx=10, sticky="w")
+
+        for i, (label, key, default) in enumerate(items, start=1):
+            ctk.CTkLabel(frame, text=label, width=120, anchor="w",
+                        text_color=TEXT).grid(row=i, column=0, pady=2, padx=10, sticky="w")
+            var = ctk.StringVar(value=default)
+            var.trace_add('write', lambda *a, k=key, v=var: setattr(config.controller, k, v.get()))
+            entry = ThemedEntry(frame, width=100, textvariable=var)
+            entry.grid(row=i, column=1, pady=2, padx=5, sticky="w")
+            self._vars[key] = var
+
     def save_bindings(self):
         try:
-            for key, entry in self._entries.items():
-                setattr(config.controller, key, entry.get())
-            
+            # Key bindings are already live in config via the var traces
             config.controller.mouse_left_trigger = self.mouse_left_var.get()
             config.controller.mouse_right_trigger = self.mouse_right_var.get()
-            
-            config.save()
+
+            self.app.schedule_save()
             self.app.log("[+] Bindings saved")
             messagebox.showinfo("Saved", "Controller bindings saved!")
         except Exception as e:
@@ -529,19 +740,25 @@ class ComboEditorTab(ThemedScrollableFrame):
     def __init__(self, parent, app):
         super().__init__(parent)
         self.app = app
-        
+
+        # Serialization/parse memos: (id(combo list), rendered JSON) and
+        # (editor text, parsed combo) — redundant dumps/loads on repeated
+        # Save/Test clicks with unchanged text are skipped
+        self._combo_cache: Optional[Tuple[int, str]] = None
+        self._last_parsed: Optional[Tuple[str, list]] = None
+
         ctk.CTkLabel(self, text="Combo Editor", font=("Segoe UI", 20, "bold"),
-                    text_color=COLORS['lavender']).pack(pady=10)
+                    text_color=LAVENDER).pack(pady=10)
         
         ctk.CTkLabel(self, text="Edit the mana refill combo sequence (JSON format)",
-                    font=("Segoe UI", 10), text_color=COLORS['text_dim']).pack(pady=5)
+                    font=("Segoe UI", 10), text_color=TEXT_DIM).pack(pady=5)
         
         # Action reference
         ref_frame = ThemedFrame(self)
         ref_frame.pack(pady=10, padx=20, fill="x")
         
         ctk.CTkLabel(ref_frame, text="Available Actions", font=("Segoe UI", 12, "bold"),
-                    text_color=COLORS['lavender']).pack(pady=5, anchor="w", padx=10)
+                    text_color=LAVENDER).pack(pady=5, anchor="w", padx=10)
         
         ref_text = """button        - Press a button (value: A, B, X, Y, DPAD_UP, etc.)
 wait          - Wait for duration seconds
@@ -555,17 +772,17 @@ trigger_hold  - Hold trigger (value: left/right) until release
 trigger_release - Release trigger (value: left/right)"""
         
         ctk.CTkLabel(ref_frame, text=ref_text, font=("Consolas", 9), justify="left",
-                    text_color=COLORS['text']).pack(padx=10, anchor="w")
+                    text_color=TEXT).pack(padx=10, anchor="w")
         
         # Editor
         editor_frame = ThemedFrame(self)
         editor_frame.pack(pady=10, padx=20, fill="both", expand=True)
         
         ctk.CTkLabel(editor_frame, text="Combo Sequence (JSON)", font=("Segoe UI", 12, "bold"),
-                    text_color=COLORS['lavender']).pack(pady=5, anchor="w", padx=10)
+                    text_color=LAVENDER).pack(pady=5, anchor="w", padx=10)
         
         self.combo_text = ctk.CTkTextbox(editor_frame, height=300, font=("Consolas", 10),
-                                         fg_color=COLORS['bg_light'], text_color=COLORS['text'])
+                                         fg_color=BG_LIGHT, text_color=TEXT)
         self.combo_text.pack(padx=10, pady=10, fill="both", expand=True)
         
         self._load_combo()
@@ -575,33 +792,43 @@ trigger_release - Release trigger (value: left/right)"""
         btn_frame.pack(pady=10, padx=20, fill="x")
         
         ThemedButton(btn_frame, text="Save Combo", command=self.save_combo,
-                    fg_color=COLORS['success'], hover_color='#5aa865', width=120).pack(side="left", padx=10)
+                    fg_color=SUCCESS, hover_color='#5aa865', width=120).pack(side="left", padx=10)
         
         ThemedButton(btn_frame, text="Reset to Default", command=self.reset_combo,
-                    fg_color=COLORS['warning'], hover_color='#cf9235', width=120).pack(side="left", padx=10)
+                    fg_color=WARNING, hover_color='#cf9235', width=120).pack(side="left", padx=10)
         
         ThemedButton(btn_frame, text="Test Combo", command=self.test_combo,
-                    fg_color=COLORS['lavender'], width=120).pack(side="left", padx=10)
+                    fg_color=LAVENDER, width=120).pack(side="left", padx=10)
     
     def _load_combo(self):
         self.combo_text.delete("1.0", "end")
-        combo_json = json.dumps(config.mana_refill_combo, indent=2)
+        combo = config.mana_refill_combo
+        if self._combo_cache is not None and self._combo_cache[0] == id(combo):
+            combo_json = self._combo_cache[1]
+        else:
+            combo_json = _json_dumps(combo)
+            self._combo_cache = (id(combo), combo_json)
         self.combo_text.insert("1.0", combo_json)
-    
+
     def save_combo(self):
         try:
             combo_json = self.combo_text.get("1.0", "end").strip()
-            combo = json.loads(combo_json)
-            
-            if not isinstance(combo, list):
-                raise ValueError("Combo must be a list of steps")
-            
-            for i, step in enumerate(combo):
-                if 'action' not in step:
-                    raise ValueError(f"Step {i+1} missing 'action' field")
-            
+            if self._last_parsed is not None and self._last_parsed[0] == combo_json:
+                combo = self._last_parsed[1]
+            else:
+                combo = _json_loads(combo_json)
+
+                if not isinstance(combo, list):
+                    raise ValueError("Combo must be a list of steps")
+
+                for i, step in enumerate(combo):
+                    if 'action' not in step:
+                        raise ValueError(f"Step {i+1} missing 'action' field")
+                self._last_parsed = (combo_json, combo)
+
             config.mana_refill_combo = combo
-            config.save()
+            self._combo_cache = (id(combo), combo_json)
+            self.app.schedule_save()
             self.app.log("[+] Combo saved successfully")
             messagebox.showinfo("Saved", "Combo sequence saved!")
         except json.JSONDecodeError as e:
@@ -612,7 +839,7 @@ trigger_release - Release trigger (value: left/right)"""
     def reset_combo(self):
         if messagebox.askyesno("Reset", "Reset combo to default?"):
             config.mana_refill_combo = AppConfig().mana_refill_combo
-            config.save()
+            self.app.schedule_save()
             self._load_combo()
             self.app.log("[+] Combo reset to default")
     
@@ -634,7 +861,7 @@ class TimingSettingsTab(ThemedScrollableFrame):
         self._entries: Dict[str, ThemedEntry] = {}
         
         ctk.CTkLabel(self, text="Timing Settings", font=("Segoe UI", 20, "bold"),
-                    text_color=COLORS['lavender']).pack(pady=10)
+                    text_color=LAVENDER).pack(pady=10)
         
         self._create_section("Key Press Timing", [
             ("Key Duration (s):", "key_dur", str(config.timing.key_press_duration)),
@@ -657,38 +884,48 @@ class TimingSettingsTab(ThemedScrollableFrame):
         img_frame.pack(pady=10, padx=20, fill="x")
         
         ctk.CTkLabel(img_frame, text="Image Recognition", font=("Segoe UI", 12, "bold"),
-                    text_color=COLORS['lavender']).pack(pady=5, anchor="w", padx=10)
+                    text_color=LAVENDER).pack(pady=5, anchor="w", padx=10)
         
-        conf_row = ThemedFrame(img_frame, fg_color=COLORS['bg_light'])
+        conf_row = ThemedFrame(img_frame, fg_color=BG_LIGHT)
         conf_row.pack(pady=5, padx=10, fill="x")
         
-        ctk.CTkLabel(conf_row, text="Match Confidence:", width=150, text_color=COLORS['text']).pack(side="left")
+        ctk.CTkLabel(conf_row, text="Match Confidence:", width=150, text_color=TEXT).pack(side="left")
         self.conf_slider = ThemedSlider(conf_row, from_=0.5, to=1.0, number_of_steps=50)
         self.conf_slider.set(config.images.confidence)
         self.conf_slider.pack(side="left", padx=5, expand=True, fill="x")
-        self.conf_label = ctk.CTkLabel(conf_row, text=f"{config.images.confidence:.2f}", 
-                                       width=50, text_color=COLORS['text'])
+        self.conf_label = ctk.CTkLabel(conf_row, text=f"{config.images.confidence:.2f}",
+                                       width=50, text_color=TEXT)
         self.conf_label.pack(side="right")
-        self.conf_slider.configure(command=lambda v: self.conf_label.configure(text=f"{v:.2f}"))
+        self._last_conf = f"{config.images.confidence:.2f}"
+        self.conf_slider.configure(command=self._on_conf)
         
         ThemedButton(self, text="Save Settings", command=self.save_settings,
-                    fg_color=COLORS['success'], hover_color='#5aa865').pack(pady=20)
-    
+                    fg_color=SUCCESS, hover_color='#5aa865').pack(pady=20)
+
+    def _on_conf(self, value: float):
+        # The slider fires per drag-pixel; only reconfigure the label when
+        # the rounded display value actually moves
+        text = f"{value:.2f}"
+        if text != self._last_conf:
+            self._last_conf = text
+            self.conf_label.configure(text=text)
+
     def _create_section(self, title: str, items: list):
         frame = ThemedFrame(self)
         frame.pack(pady=5, padx=20, fill="x")
-        
+
+        # Rows grid straight into the section frame — no ThemedFrame per
+        # row, same collapse as the bindings tab
         ctk.CTkLabel(frame, text=title, font=("Segoe UI", 12, "bold"),
-                    text_color=COLORS['lavender']).pack(pady=5, anchor="w", padx=10)
-        
-        for label, key, default in items:
-            row = ThemedFrame(frame, fg_color=COLORS['bg_light'])
-            row.pack(pady=2, padx=10, fill="x")
-            
-            ctk.CTkLabel(row, text=label, width=180, anchor="w", text_color=COLORS['text']).pack(side="left")
-            entry = ThemedEntry(row, width=80)
+                    text_color=LAVENDER).grid(row=0, column=0, columnspan=2,
+                                              pady=5, padx=10, sticky="w")
+
+        for i, (label, key, default) in enumerate(items, start=1):
+            ctk.CTkLabel(frame, text=label, width=180, anchor="w",
+                        text_color=TEXT).grid(row=i, column=0, pady=2, padx=10, sticky="w")
+            entry = ThemedEntry(frame, width=80)
             entry.insert(0, default)
-            entry.pack(side="left", padx=5)
+            entry.grid(row=i, column=1, pady=2, padx=5, sticky="w")
             self._entries[key] = entry
     
     def save_settings(self):
@@ -702,7 +939,7 @@ class TimingSettingsTab(ThemedScrollableFrame):
             config.movement.hold_duration = float(self._entries["hold_dur"].get())
             config.images.confidence = self.conf_slider.get()
             
-            config.save()
+            self.app.schedule_save()
             self.app.log("[+] Timing settings saved")
             messagebox.showinfo("Saved", "Settings saved!")
         except Exception as e:
@@ -715,7 +952,7 @@ class ImagesTab(ThemedScrollableFrame):
         self.app = app
         
         ctk.CTkLabel(self, text="Image Templates", font=("Segoe UI", 20, "bold"),
-                    text_color=COLORS['lavender']).pack(pady=10)
+                    text_color=LAVENDER).pack(pady=10)
         
         # Instructions
         info_frame = ThemedFrame(self)
@@ -734,15 +971,17 @@ TIPS:
   - Lower confidence if not detecting"""
         
         ctk.CTkLabel(info_frame, text=info_text, font=("Consolas", 10), 
-                    justify="left", text_color=COLORS['text']).pack(padx=10, pady=10, anchor="w")
+                    justify="left", text_color=TEXT).pack(padx=10, pady=10, anchor="w")
         
         # Status
         status_frame = ThemedFrame(self)
         status_frame.pack(pady=10, padx=20, fill="x")
         
+        status_frame.grid_columnconfigure(2, weight=1)
         ctk.CTkLabel(status_frame, text="Image Status", font=("Segoe UI", 12, "bold"),
-                    text_color=COLORS['lavender']).pack(pady=5, anchor="w", padx=10)
-        
+                    text_color=LAVENDER).grid(row=0, column=0, columnspan=3,
+                                              pady=5, padx=10, sticky="w")
+
         self.status_labels = {}
         images = [
             ("Tempest (Spell)", config.images.tempest_image),
@@ -750,23 +989,22 @@ TIPS:
             ("Tempest Enchanted", config.images.tempest_enchanted_image),
             ("Mana Zero", config.images.mana_zero),
         ]
-        
-        for name, filename in images:
-            row = ThemedFrame(status_frame, fg_color=COLORS['bg_light'])
-            row.pack(pady=2, padx=10, fill="x")
-            
-            ctk.CTkLabel(row, text=f"{name}:", width=150, anchor="w", text_color=COLORS['text']).pack(side="left")
-            
-            exists = os.path.exists(os.path.join(config.images.folder, filename))
+
+        present = self._scan_images()
+        for i, (name, filename) in enumerate(images, start=1):
+            ctk.CTkLabel(status_frame, text=f"{name}:", width=150, anchor="w",
+                        text_color=TEXT).grid(row=i, column=0, pady=2, padx=10, sticky="w")
+
+            exists = filename in present
             status = "Found" if exists else "Missing"
-            color = COLORS['success'] if exists else COLORS['error']
-            
-            label = ctk.CTkLabel(row, text=status, text_color=color)
-            label.pack(side="left", padx=5)
-            
-            ctk.CTkLabel(row, text=f"({filename})", text_color=COLORS['text_dim'], 
-                        font=("Consolas", 9)).pack(side="right", padx=5)
-            
+            color = SUCCESS if exists else ERROR
+
+            label = ctk.CTkLabel(status_frame, text=status, text_color=color)
+            label.grid(row=i, column=1, pady=2, padx=5, sticky="w")
+
+            ctk.CTkLabel(status_frame, text=f"({filename})", text_color=TEXT_DIM,
+                        font=("Consolas", 9)).grid(row=i, column=2, pady=2, padx=10, sticky="e")
+
             self.status_labels[name] = (label, filename)
         
         # Buttons
@@ -777,11 +1015,19 @@ TIPS:
         ThemedButton(btn_frame, text="Open Folder", command=self.open_folder, width=100).pack(side="left", padx=10)
         ThemedButton(btn_frame, text="Test Detection", command=self.test_detection, width=120).pack(side="left", padx=10)
     
+    def _scan_images(self) -> set:
+        """One directory enumeration instead of a stat per template file"""
+        try:
+            return {entry.name for entry in os.scandir(config.images.folder)}
+        except FileNotFoundError:
+            return set()
+
     def refresh(self):
+        present = self._scan_images()
         for name, (label, filename) in self.status_labels.items():
-            exists = os.path.exists(os.path.join(config.images.folder, filename))
+            exists = filename in present
             label.configure(text="Found" if exists else "Missing",
-                          text_color=COLORS['success'] if exists else COLORS['error'])
+                          text_color=SUCCESS if exists else ERROR)
         self.app.log("[*] Image status refreshed")
     
     def open_folder(self):
@@ -793,8 +1039,8 @@ TIPS:
     
     def test_detection(self):
         """Test card detection on current screen"""
-        from .image_recognition import image_recognition, CardType
-        
+        image_recognition, CardType = _irec()
+
         self.app.log("[*] Testing card detection...")
         
         # Load templates
@@ -822,7 +1068,7 @@ class HotkeysTab(ThemedScrollableFrame):
         self._entries: Dict[str, ThemedEntry] = {}
         
         ctk.CTkLabel(self, text="Hotkeys", font=("Segoe UI", 20, "bold"),
-                    text_color=COLORS['lavender']).pack(pady=10)
+                    text_color=LAVENDER).pack(pady=10)
         
         frame = ThemedFrame(self)
         frame.pack(pady=10, padx=20, fill="x")
@@ -834,18 +1080,16 @@ class HotkeysTab(ThemedScrollableFrame):
             ("Toggle Controller:", "controller", config.hotkeys.toggle_controller),
         ]
         
-        for label, key, default in hotkeys:
-            row = ThemedFrame(frame, fg_color=COLORS['bg_light'])
-            row.pack(pady=2, padx=10, fill="x")
-            
-            ctk.CTkLabel(row, text=label, width=150, anchor="w", text_color=COLORS['text']).pack(side="left")
-            entry = ThemedEntry(row, width=100)
+        for i, (label, key, default) in enumerate(hotkeys):
+            ctk.CTkLabel(frame, text=label, width=150, anchor="w",
+                        text_color=TEXT).grid(row=i, column=0, pady=2, padx=10, sticky="w")
+            entry = ThemedEntry(frame, width=100)
             entry.insert(0, default)
-            entry.pack(side="left", padx=5)
+            entry.grid(row=i, column=1, pady=2, padx=5, sticky="w")
             self._entries[key] = entry
         
         ThemedButton(self, text="Save Hotkeys", command=self.save_hotkeys,
-                    fg_color=COLORS['success'], hover_color='#5aa865').pack(pady=20)
+                    fg_color=SUCCESS, hover_color='#5aa865').pack(pady=20)
     
     def save_hotkeys(self):
         try:
@@ -853,7 +1097,8 @@ class HotkeysTab(ThemedScrollableFrame):
             config.hotkeys.pause = self._entries["pause"].get()
             config.hotkeys.toggle_movement = self._entries["movement"].get()
             config.hotkeys.toggle_controller = self._entries["controller"].get()
-            config.save()
+            self.app.schedule_save()
+            self.app.refresh_hotkeys()
             self.app.log("[+] Hotkeys saved")
             messagebox.showinfo("Saved", "Hotkeys saved!")
         except Exception as e:
@@ -868,17 +1113,17 @@ class AboutTab(ThemedScrollableFrame):
         self.app = app
         
         ctk.CTkLabel(self, text="About", font=("Segoe UI", 20, "bold"),
-                    text_color=COLORS['lavender']).pack(pady=10)
+                    text_color=LAVENDER).pack(pady=10)
         
         # Version info
         version_frame = ThemedFrame(self)
         version_frame.pack(pady=10, padx=20, fill="x")
         
         ctk.CTkLabel(version_frame, text="Wizard101 Bot Suite", font=("Segoe UI", 16, "bold"),
-                    text_color=COLORS['text']).pack(pady=10)
+                    text_color=TEXT).pack(pady=10)
         
         self.version_label = ctk.CTkLabel(version_frame, text=f"Version: {updater.current_version}",
-                                          font=("Segoe UI", 12), text_color=COLORS['text_dim'])
+                                          font=("Segoe UI", 12), text_color=TEXT_DIM)
         self.version_label.pack(pady=5)
         
         # Update section
@@ -886,13 +1131,18 @@ class AboutTab(ThemedScrollableFrame):
         update_frame.pack(pady=10, padx=20, fill="x")
         
         ctk.CTkLabel(update_frame, text="Updates", font=("Segoe UI", 12, "bold"),
-                    text_color=COLORS['lavender']).pack(pady=5, anchor="w", padx=10)
+                    text_color=LAVENDER).pack(pady=5, anchor="w", padx=10)
         
         self.update_status = ctk.CTkLabel(update_frame, text="Click 'Check for Updates' to check",
-                                          font=("Segoe UI", 10), text_color=COLORS['text_dim'])
+                                          font=("Segoe UI", 10), text_color=TEXT_DIM)
         self.update_status.pack(pady=5, padx=10, anchor="w")
-        
-        btn_row = ThemedFrame(update_frame, fg_color=COLORS['bg_medium'])
+
+        # Shown only while a download is running
+        self.progress_bar = ctk.CTkProgressBar(update_frame, width=300)
+        self._last_progress_time = 0.0
+
+
+        btn_row = ThemedFrame(update_frame, fg_color=BG_MEDIUM)
         btn_row.pack(pady=10, padx=10, fill="x")
         
         self.check_btn = ThemedButton(btn_row, text="Check for Updates", command=self.check_updates,
@@ -900,7 +1150,7 @@ class AboutTab(ThemedScrollableFrame):
         self.check_btn.pack(side="left", padx=5)
         
         self.install_btn = ThemedButton(btn_row, text="Install Update", command=self.install_update,
-                                        fg_color=COLORS['success'], hover_color='#5aa865',
+                                        fg_color=SUCCESS, hover_color='#5aa865',
                                         width=150, state="disabled")
         self.install_btn.pack(side="left", padx=5)
         
@@ -909,72 +1159,96 @@ class AboutTab(ThemedScrollableFrame):
         github_frame.pack(pady=10, padx=20, fill="x")
         
         ctk.CTkLabel(github_frame, text="GitHub Repository", font=("Segoe UI", 12, "bold"),
-                    text_color=COLORS['lavender']).pack(pady=5, anchor="w", padx=10)
+                    text_color=LAVENDER).pack(pady=5, anchor="w", padx=10)
         
-        repo_url = f"https://github.com/{updater.github_owner}/{updater.github_repo}"
-        ctk.CTkLabel(github_frame, text=repo_url, font=("Consolas", 10),
-                    text_color=COLORS['lavender_light']).pack(pady=5, padx=10, anchor="w")
+        ctk.CTkLabel(github_frame, text=updater.repo_url, font=("Consolas", 10),
+                    text_color=LAVENDER_LIGHT).pack(pady=5, padx=10, anchor="w")
     
     def check_updates(self):
-        self.update_status.configure(text="Checking for updates...", text_color=COLORS['warning'])
+        if self.app._update_check_in_flight.is_set():
+            return
+        self.app._update_check_in_flight.set()
+        self.update_status.configure(text="Checking for updates...", text_color=WARNING)
         self.check_btn.configure(state="disabled")
-        
+
         def do_check():
             available, version = updater.check_for_updates()
-            
+
             def update_ui():
+                self.app._update_check_in_flight.clear()
                 self.check_btn.configure(state="normal")
                 if available:
                     self.update_status.configure(
                         text=f"Update available: v{version}",
-                        text_color=COLORS['success']
+                        text_color=SUCCESS
                     )
                     self.install_btn.configure(state="normal")
                     self.app.log(f"[+] Update available: v{updater.current_version} -> v{version}")
                 elif version:
                     self.update_status.configure(
                         text=f"Up to date (v{version})",
-                        text_color=COLORS['text']
+                        text_color=TEXT
                     )
                     self.app.log(f"[+] Already up to date: v{version}")
                 else:
                     self.update_status.configure(
                         text="Could not check for updates",
-                        text_color=COLORS['error']
+                        text_color=ERROR
                     )
                     self.app.log("[!] Could not check for updates")
             
-            self.app.after(0, update_ui)
-        
-        threading.Thread(target=do_check, daemon=True).start()
-    
+            self.app.post(update_ui)
+
+        self.app.run_in_background(do_check)
+
+    def _on_download_progress(self, downloaded: int, total: int):
+        """Called from the download thread; throttled, then marshalled to Tk"""
+        now = time.monotonic()
+        if now - self._last_progress_time < 0.1 and downloaded < total:
+            return
+        self._last_progress_time = now
+
+        def apply():
+            if total > 0:
+                self.progress_bar.set(downloaded / total)
+                self.update_status.configure(
+                    text=f"Downloading... {downloaded / 1048576:.1f} / {total / 1048576:.1f} MB")
+            else:
+                self.update_status.configure(
+                    text=f"Downloading... {downloaded / 1048576:.1f} MB")
+        self.app.post(apply)
+
     def install_update(self):
         if messagebox.askyesno("Install Update", "Download and install the latest update?"):
-            self.update_status.configure(text="Downloading update...", text_color=COLORS['warning'])
+            self.update_status.configure(text="Downloading update...", text_color=WARNING)
             self.install_btn.configure(state="disabled")
-            
+            self.progress_bar.set(0)
+            self.progress_bar.pack(pady=5, padx=10, anchor="w")
+            self._last_progress_time = 0.0
+
             def do_install():
-                success = updater.download_update()
-                
+                success = updater.download_update(progress_callback=self._on_download_progress)
+
                 def update_ui():
+                    self.progress_bar.pack_forget()
                     if success:
                         self.update_status.configure(
                             text="Update installed! Please restart.",
-                            text_color=COLORS['success']
+                            text_color=SUCCESS
                         )
                         self.app.log("[+] Update installed successfully!")
                         messagebox.showinfo("Success", "Update installed!\n\nPlease restart the application.")
                     else:
                         self.update_status.configure(
                             text="Update failed",
-                            text_color=COLORS['error']
+                            text_color=ERROR
                         )
                         self.install_btn.configure(state="normal")
                         self.app.log("[X] Update failed")
                 
-                self.app.after(0, update_ui)
-            
-            threading.Thread(target=do_install, daemon=True).start()
+                self.app.post(update_ui)
+
+            self.app.run_in_background(do_install)
 
 
 class WizardBotApp(ctk.CTk):
@@ -982,78 +1256,108 @@ class WizardBotApp(ctk.CTk):
     
     def __init__(self):
         super().__init__()
-        
+
+        # Hidden until construction finishes: the window would otherwise
+        # flash at Tk's default size and relayout once geometry() lands,
+        # plus once more per child added
+        self.withdraw()
+
         self.title("Wizard101 Bot Suite")
         self.geometry(f"{config.window.width}x{config.window.height}")
         self.minsize(config.window.min_width, config.window.min_height)
-        self.configure(fg_color=COLORS['bg_dark'])
+        self.configure(fg_color=BG_DARK)
         
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(0, weight=1)
         
         # Main container
-        main_frame = ctk.CTkFrame(self, fg_color=COLORS['bg_dark'])
+        main_frame = ctk.CTkFrame(self, fg_color=BG_DARK)
         main_frame.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
         main_frame.grid_columnconfigure(0, weight=1)
         main_frame.grid_rowconfigure(0, weight=1)
         
         # Tabview
-        self.tabview = ctk.CTkTabview(main_frame, fg_color=COLORS['bg_medium'],
-                                      segmented_button_fg_color=COLORS['bg_light'],
-                                      segmented_button_selected_color=COLORS['lavender'],
-                                      segmented_button_selected_hover_color=COLORS['lavender_dark'],
-                                      segmented_button_unselected_color=COLORS['bg_light'],
-                                      segmented_button_unselected_hover_color=COLORS['bg_medium'])
+        self.tabview = ctk.CTkTabview(main_frame, fg_color=BG_MEDIUM,
+                                      segmented_button_fg_color=BG_LIGHT,
+                                      segmented_button_selected_color=LAVENDER,
+                                      segmented_button_selected_hover_color=LAVENDER_DARK,
+                                      segmented_button_unselected_color=BG_LIGHT,
+                                      segmented_button_unselected_hover_color=BG_MEDIUM,
+                                      command=self._on_tab_change)
         self.tabview.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
-        
-        # Create tabs
-        tabs = ["Control", "Controller", "Bindings", "Combo", "Timing", "Images", "Hotkeys", "About"]
-        for tab in tabs:
+
+        # Panels are built lazily on first visit: every tab is canvas-drawn
+        # widget soup, and eagerly constructing all eight made startup pay
+        # for panels the user may never open. Only the default tab is
+        # built here; _ensure_panel constructs the rest on demand.
+        self._panel_factories = {
+            "Control": ("control_panel", BotControlTab),
+            "Controller": ("controller_panel", ControllerTab),
+            "Bindings": ("bindings_panel", ControllerBindingsTab),
+            "Combo": ("combo_panel", ComboEditorTab),
+            "Timing": ("timing_panel", TimingSettingsTab),
+            "Images": ("images_panel", ImagesTab),
+            "Hotkeys": ("hotkeys_panel", HotkeysTab),
+            "About": ("about_panel", AboutTab),
+        }
+        for tab, (attr, _) in self._panel_factories.items():
             self.tabview.add(tab)
             self.tabview.tab(tab).grid_columnconfigure(0, weight=1)
             self.tabview.tab(tab).grid_rowconfigure(0, weight=1)
-        
-        # Create panels
-        self.control_panel = BotControlTab(self.tabview.tab("Control"), self)
-        self.control_panel.grid(row=0, column=0, sticky="nsew")
-        
-        self.controller_panel = ControllerTab(self.tabview.tab("Controller"), self)
-        self.controller_panel.grid(row=0, column=0, sticky="nsew")
-        
-        self.bindings_panel = ControllerBindingsTab(self.tabview.tab("Bindings"), self)
-        self.bindings_panel.grid(row=0, column=0, sticky="nsew")
-        
-        self.combo_panel = ComboEditorTab(self.tabview.tab("Combo"), self)
-        self.combo_panel.grid(row=0, column=0, sticky="nsew")
-        
-        self.timing_panel = TimingSettingsTab(self.tabview.tab("Timing"), self)
-        self.timing_panel.grid(row=0, column=0, sticky="nsew")
-        
-        self.images_panel = ImagesTab(self.tabview.tab("Images"), self)
-        self.images_panel.grid(row=0, column=0, sticky="nsew")
-        
-        self.hotkeys_panel = HotkeysTab(self.tabview.tab("Hotkeys"), self)
-        self.hotkeys_panel.grid(row=0, column=0, sticky="nsew")
-        
-        self.about_panel = AboutTab(self.tabview.tab("About"), self)
-        self.about_panel.grid(row=0, column=0, sticky="nsew")
-        
+            setattr(self, attr, None)
+
+        self._ensure_panel("Control")
+
         # Log panel
         self.log_panel = LogPanel(main_frame)
         self.log_panel.grid(row=1, column=0, sticky="ew", padx=5, pady=5)
         
+        # Cross-thread UI funnel: bot/controller threads enqueue callables
+        # and a single Tk-thread drain applies them in batches, instead of
+        # every callback scheduling its own after(0) into the event loop
+        self._ui_queue: SimpleQueue = SimpleQueue()
+        self.after(16, self._drain_ui_queue)
+
+        # Dirty-driven stats repaints plus a slow idle tick; the preview
+        # only runs while the controller is connected
+        self._stats_scheduled = False
+        self._preview_handle = None
+
+        # One long-lived worker for short background jobs (update checks,
+        # downloads) instead of a fresh thread per click; queueing also
+        # serializes updater work so rapid clicks cannot race each other
+        self._bg_queue: SimpleQueue = SimpleQueue()
+        threading.Thread(target=self._bg_worker, name='ui-bg-worker',
+                         daemon=True).start()
+
+        # Debounce handle for config writes
+        self._save_after = None
+
+        # Set while an update check is on the wire; the startup check and
+        # the About-tab button share it so they never overlap
+        self._update_check_in_flight = threading.Event()
+
         # Callbacks
         bot_engine.set_log_callback(self.log)
         bot_engine.set_state_callback(self.on_state_change)
         mana_refill.set_log_callback(self.log)
         updater.set_log_callback(self.log)
         
-        # Hotkey thread
-        self._hotkey_thread = threading.Thread(target=self._hotkey_loop, daemon=True)
-        self._hotkey_thread.start()
-        
-        # Update loop
-        self._update_loop()
+        # Hotkeys: OS-level registration when the keyboard module is
+        # available (zero wakeups while idle), 50ms polling otherwise.
+        # Actions are pre-bound methods, so firing allocates no closures
+        self._hotkey_actions = {
+            'stop': self._on_stop_hotkey,
+            'pause': self._on_pause_hotkey,
+            'movement': self._on_movement_hotkey,
+            'controller': self._on_controller_hotkey,
+        }
+        self._hotkey_handles: list = []
+        self._start_hotkeys()
+        
+        # The idle-time readout advances once per second on its own; all
+        # other stat changes arrive through mark_stats_dirty
+        self._idle_tick()
         
         # Welcome message
         self.log(f"[*] Wizard101 Bot Suite v{updater.current_version}")
@@ -1065,21 +1369,71 @@ class WizardBotApp(ctk.CTk):
         except ImportError:
             self.log("[!] vgamepad not installed - pip install vgamepad")
         
-        mana_detector.load_templates()
-        
+        # Template loading (and the cv2/numpy import behind it) runs on
+        # the background worker so the window appears without waiting on
+        # image decode and disk I/O
+        self.run_in_background(self._load_templates_bg)
+
         # Check for updates on startup (background)
         self.after(2000, self._check_updates_startup)
-        
+
         self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # One settled layout pass, then show the finished window
+        self.update_idletasks()
+        self.deiconify()
     
+    def _ensure_panel(self, name: str):
+        """Build the panel for a tab on first visit; return it"""
+        attr, cls = self._panel_factories[name]
+        panel = getattr(self, attr)
+        if panel is None:
+            panel = cls(self.tabview.tab(name), self)
+            panel.grid(row=0, column=0, sticky="nsew")
+            setattr(self, attr, panel)
+        return panel
+
+    def _on_tab_change(self):
+        try:
+            self._ensure_panel(self.tabview.get())
+        except Exception as e:
+            print(f"[!] Tab build failed: {e}")
+
+    @staticmethod
+    def _load_templates_bg():
+        from .mana_detection import mana_detector
+        mana_detector.load_templates()
+
     def _check_updates_startup(self):
         """Check for updates in background on startup"""
+        if bot_engine.state != BotState.STOPPED:
+            # Already mid-run; don't compete with the bot for attention
+            return
+
+        # A check from the last hour answers from the on-disk cache, so
+        # most launches never touch the GitHub API at startup
+        cached = updater.cached_check()
+        if cached is not None:
+            available, version = cached
+            if available:
+                self._prompt_update(version)
+            return
+
+        if self._update_check_in_flight.is_set():
+            return
+        self._update_check_in_flight.set()
+
         def do_check():
             available, version = updater.check_for_updates()
-            if available:
-                self.after(0, lambda: self._prompt_update(version))
-        
-        threading.Thread(target=do_check, daemon=True).start()
+
+            def finish():
+                self._update_check_in_flight.clear()
+                if available:
+                    self._prompt_update(version)
+
+            self.post(finish)
+
+        self.run_in_background(do_check)
     
     def _prompt_update(self, version: str):
         """Prompt user about available update"""
@@ -1093,59 +1447,223 @@ class WizardBotApp(ctk.CTk):
         
         if result:
             self.tabview.set("About")
-            self.about_panel.install_update()
+            self._ensure_panel("About").install_update()
     
+    def post(self, fn):
+        """Queue a callable to run on the Tk thread; safe from any thread"""
+        self._ui_queue.put(fn)
+
+    def run_in_background(self, fn):
+        """Hand a short task to the shared background worker thread"""
+        self._bg_queue.put(fn)
+
+    def schedule_save(self):
+        """
+        Debounced config.save: rapid successive edits collapse into one
+        write, 250ms after the last, done off the UI thread
+        """
+        if self._save_after is not None:
+            self.after_cancel(self._save_after)
+        self._save_after = self.after(250, self._do_save)
+
+    def _do_save(self):
+        self._save_after = None
+        self.run_in_background(config.save)
+
+    def _bg_worker(self):
+        while True:
+            fn = self._bg_queue.get()
+            try:
+                fn()
+            except Exception as e:
+                print(f"[!] Background task error: {e}")
+
+    def _drain_ui_queue(self):
+        try:
+            while True:
+                fn = self._ui_queue.get_nowait()
+                try:
+                    fn()
+                except Exception as e:
+                    print(f"[!] UI callback error: {e}")
+        except Empty:
+            pass
+        self.after(16, self._drain_ui_queue)
+
     def log(self, message: str):
-        self.after(0, lambda: self.log_panel.log(message))
-    
+        # LogPanel.log is a plain deque append (atomic, safe from any
+        # thread) and its drain batches the widget work, so no per-message
+        # closure or UI-queue hop is needed here
+        self.log_panel.log(message)
+        # Engine activity always logs, so a log line doubles as the
+        # signal that the counters may have moved
+        self.mark_stats_dirty()
+
     def on_state_change(self, state: BotState):
-        self.after(0, lambda: self.control_panel.update_status(state))
+        self.post(lambda: self.control_panel.update_status(state))
+        self.mark_stats_dirty()
+
+    def mark_stats_dirty(self):
+        """Request a stats repaint; coalesces until the next idle cycle"""
+        if not self._stats_scheduled:
+            self._stats_scheduled = True
+            self.post(self._flush_stats)
+
+    def _flush_stats(self):
+        self._stats_scheduled = False
+        self.control_panel.update_stats()
     
+    # (action name, config.hotkeys attribute) — invariant, so the poll
+    # loop reads bindings with plain getattr instead of rebuilding a dict
+    # every 50ms tick
+    _HOTKEY_ATTRS = (
+        ('stop', 'stop'),
+        ('pause', 'pause'),
+        ('movement', 'toggle_movement'),
+        ('controller', 'toggle_controller'),
+    )
+
+    def _configured_hotkeys(self) -> Dict[str, str]:
+        return {name: getattr(config.hotkeys, attr)
+                for name, attr in self._HOTKEY_ATTRS}
+
+    def _fire_hotkey(self, name: str):
+        """Dispatch one triggered hotkey (called from any thread)"""
+        action = self._hotkey_actions.get(name)
+        if action is not None:
+            action()
+
+    def _on_stop_hotkey(self):
+        if bot_engine.state in [BotState.RUNNING, BotState.PAUSED]:
+            self.post(self.control_panel.stop_bot)
+
+    def _on_pause_hotkey(self):
+        if bot_engine.state in [BotState.RUNNING, BotState.PAUSED]:
+            self.post(self.control_panel.toggle_pause)
+
+    def _on_movement_hotkey(self):
+        bot_engine.toggle_movement()
+        self.post(self._sync_movement_switch)
+
+    def _sync_movement_switch(self):
+        self.control_panel.movement_var.set(bot_engine.movement_enabled)
+
+    def _on_controller_hotkey(self):
+        if controller.is_enabled:
+            self.post(self._controller_disconnect)
+        else:
+            self.post(self._controller_connect)
+
+    def _controller_connect(self):
+        self._ensure_panel("Controller").connect()
+
+    def _controller_disconnect(self):
+        self._ensure_panel("Controller").disconnect()
+
+    def _start_hotkeys(self):
+        """Register hotkeys event-driven; fall back to the poll thread"""
+        if KEYBOARD_AVAILABLE:
+            handles = []
+            try:
+                for name, key in self._configured_hotkeys().items():
+                    if not key:
+                        continue
+                    handles.append(keyboard.add_hotkey(
+                        key, self._fire_hotkey, args=(name,),
+                        trigger_on_release=True))
+                self._hotkey_handles = handles
+                return
+            except Exception as e:
+                # One bad key name shouldn't silently drop the rest —
+                # unwind and let the poller handle everything
+                print(f"[!] Hotkey registration failed ({e}), using polling")
+                for handle in handles:
+                    try:
+                        keyboard.remove_hotkey(handle)
+                    except Exception:
+                        pass
+                self._hotkey_handles = []
+
+        self._hotkey_thread = threading.Thread(target=self._hotkey_loop, daemon=True)
+        self._hotkey_thread.start()
+
+    def refresh_hotkeys(self):
+        """Re-register after bindings change (poller re-reads config itself)"""
+        if KEYBOARD_AVAILABLE and self._hotkey_handles:
+            for handle in self._hotkey_handles:
+                try:
+                    keyboard.remove_hotkey(handle)
+                except Exception:
+                    pass
+            self._hotkey_handles = []
+            self._start_hotkeys()
+
     def _hotkey_loop(self):
         key_states = {}
-        
+        hotkeys = config.hotkeys
+        err_count = 0
+
         while True:
             try:
-                hotkeys = {
-                    'stop': config.hotkeys.stop,
-                    'pause': config.hotkeys.pause,
-                    'movement': config.hotkeys.toggle_movement,
-                    'controller': config.hotkeys.toggle_controller,
-                }
-                
-                for name, key in hotkeys.items():
+                for name, attr in self._HOTKEY_ATTRS:
+                    key = getattr(hotkeys, attr)
                     if not key:
                         continue
-                    
+
                     pressed = input_handler.is_key_pressed(key)
                     was_pressed = key_states.get(name, False)
-                    
+
                     if was_pressed and not pressed:
-                        if name == 'stop' and bot_engine.state in [BotState.RUNNING, BotState.PAUSED]:
-                            self.after(0, self.control_panel.stop_bot)
-                        elif name == 'pause' and bot_engine.state in [BotState.RUNNING, BotState.PAUSED]:
-                            self.after(0, self.control_panel.toggle_pause)
-                        elif name == 'movement':
-                            bot_engine.toggle_movement()
-                            self.after(0, lambda: self.control_panel.movement_var.set(bot_engine.movement_enabled))
-                        elif name == 'controller':
-                            if controller.is_enabled:
-                                self.after(0, self.controller_panel.disconnect)
-                            else:
-                                self.after(0, self.controller_panel.connect)
-                    
+                        self._fire_hotkey(name)
+
                     key_states[name] = pressed
-                
+
+                err_count = 0
                 time.sleep(0.05)
-            except:
-                pass
+            except KeyboardInterrupt:
+                raise
+            except Exception as e:
+                # Back off exponentially on repeated failure (e.g. missing
+                # input backend) instead of spinning the 50ms loop at full
+                # speed doing nothing; only the first error is logged
+                if err_count == 0:
+                    print(f"[!] Hotkey loop error: {e}")
+                time.sleep(min(5.0, 0.05 * 2 ** err_count))
+                err_count += 1
     
-    def _update_loop(self):
+    def _idle_tick(self):
         self.control_panel.update_stats()
-        self.controller_panel.update_preview()
-        self.after(100, self._update_loop)
+        self.after(1000, self._idle_tick)
+
+    def start_preview(self):
+        """Begin preview polling; called when the controller connects"""
+        if self._preview_handle is None:
+            self._preview_handle = self.after(16, self._preview_loop)
+
+    def stop_preview(self):
+        if self._preview_handle is not None:
+            self.after_cancel(self._preview_handle)
+            self._preview_handle = None
+
+    def _preview_loop(self):
+        # Adaptive rate: 60Hz while the controller is actually doing
+        # something, 5Hz when idle — idle redraw polls are wasted work
+        interval = 200
+        panel = self.controller_panel
+        if panel is not None and controller.is_enabled:
+            panel.update_preview()
+            s = controller.state
+            if (s.buttons or s.left_stick_x or s.left_stick_y
+                    or s.right_stick_x or s.right_stick_y
+                    or s.left_trigger or s.right_trigger):
+                interval = 16
+        self._preview_handle = self.after(interval, self._preview_loop)
     
     def on_close(self):
+        # Final flush is synchronous; a pending debounced save is folded in
+        if self._save_after is not None:
+            self.after_cancel(self._save_after)
+            self._save_after = None
         config.window.width = self.winfo_width()
         config.window.height = self.winfo_height()
         config.save()
@@ -3,6 +3,8 @@ Auto-updater for Wizard101 Bot Suite
 Downloads updates from GitHub repository
 """
 
+import atexit
+import io
 import os
 import sys
 import json
@@ -10,9 +12,85 @@ import shutil
 import zipfile
 import tempfile
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from functools import lru_cache
 from typing import Optional, Callable, Tuple
 from urllib.request import urlopen, Request
-from urllib.error import URLError
+from urllib.error import URLError, HTTPError
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from packaging.version import Version
+    PACKAGING_AVAILABLE = True
+except ImportError:
+    PACKAGING_AVAILABLE = False
+
+
+@lru_cache(maxsize=16)
+def _version_key(v: str):
+    """PEP 440 parse of a version string, or None when unavailable/invalid"""
+    if PACKAGING_AVAILABLE:
+        try:
+            return Version(v)
+        except Exception:
+            return None
+    return None
+
+
+@lru_cache(maxsize=16)
+def _version_tuple(v: str) -> tuple:
+    try:
+        parts = tuple(int(x) for x in v.split('.'))
+    except Exception:
+        return (0,)
+    # Drop trailing zeros so "1.0" and "1.0.0" compare equal
+    while parts and parts[-1] == 0:
+        parts = parts[:-1]
+    return parts
+
+
+def _read_json_file(path: str):
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _write_json_file(path: str, obj):
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f)
+
+
+def _parse_json_bytes(raw: bytes):
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw.decode())
+
+
+def _extract_zip_member(zip_path: str, member: str, dest: str):
+    """Extract one zip member to dest (ProcessPool worker, so module-level)"""
+    with zipfile.ZipFile(zip_path, 'r') as z:
+        _stream_member(z, member, dest)
+
+
+def _stream_member(z: 'zipfile.ZipFile', member: str, dest: str):
+    """Stream one member to dest via a temp name + os.replace, so a crash
+    mid-update never leaves a half-written module behind"""
+    tmp = dest + '.new'
+    with z.open(member) as src, open(tmp, 'wb') as out:
+        shutil.copyfileobj(src, out, length=1024 * 1024)
+    os.replace(tmp, dest)
 
 # GitHub repository info
 GITHUB_OWNER = "YourUsername"  # Change this to your GitHub username
@@ -22,18 +100,33 @@ GITHUB_BRANCH = "main"
 # Version info
 CURRENT_VERSION = "1.0.0"
 VERSION_FILE = "version.json"
+UPDATE_CACHE_FILE = ".update_cache.json"
+
+# Archives below this size are held in RAM instead of a temp file,
+# saving one full disk write + read of the zip
+MAX_IN_MEMORY_ZIP = 64 * 1024 * 1024
 
 class AutoUpdater:
     """
     Auto-updater that checks GitHub for updates and downloads them.
     """
-    
+
+    # Shared worker pool: repeated "check for updates" clicks reuse threads
+    # instead of spawning one each, and callers get a cancellable Future
+    # (workers are only created on first submit)
+    _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='updater')
+
+
     def __init__(self):
         self.github_owner = GITHUB_OWNER
         self.github_repo = GITHUB_REPO
         self.github_branch = GITHUB_BRANCH
-        self.current_version = self._load_current_version()
-        
+        # Pre-built once; the About tab and log lines show this verbatim
+        self.repo_url = f"https://github.com/{self.github_owner}/{self.github_repo}"
+        # version.json is read lazily on first use so importing the module
+        # (which happens during app startup) doesn't touch the disk
+        self._current_version: Optional[str] = None
+
         self._log_callback: Optional[Callable[[str], None]] = None
         self._update_available = False
         self._latest_version = None
@@ -47,13 +140,22 @@ class AutoUpdater:
         if self._log_callback:
             self._log_callback(message)
     
+    @property
+    def current_version(self) -> str:
+        if self._current_version is None:
+            self._current_version = self._load_current_version()
+        return self._current_version
+
+    @current_version.setter
+    def current_version(self, value: str):
+        self._current_version = value
+
     def _load_current_version(self) -> str:
         """Load current version from version.json"""
         try:
             if os.path.exists(VERSION_FILE):
-                with open(VERSION_FILE, 'r') as f:
-                    data = json.load(f)
-                    return data.get('version', CURRENT_VERSION)
+                data = _read_json_file(VERSION_FILE)
+                return data.get('version', CURRENT_VERSION)
         except:
             pass
         return CURRENT_VERSION
@@ -61,11 +163,51 @@ class AutoUpdater:
     def _save_current_version(self, version: str):
         """Save current version to version.json"""
         try:
-            with open(VERSION_FILE, 'w') as f:
-                json.dump({'version': version}, f)
+            _write_json_file(VERSION_FILE, {'version': version})
         except Exception as e:
             self._log(f"[!] Failed to save version: {e}")
     
+    def _load_update_cache(self) -> dict:
+        """Load the cached ETag/version from the last update check"""
+        try:
+            if os.path.exists(UPDATE_CACHE_FILE):
+                return _read_json_file(UPDATE_CACHE_FILE)
+        except Exception:
+            pass
+        return {}
+
+    def _save_update_cache(self, etag: str, version: str):
+        try:
+            _write_json_file(UPDATE_CACHE_FILE, {'etag': etag, 'version': version,
+                                                 'checked_at': time.time()})
+        except Exception:
+            pass
+
+    def cached_check(self, max_age: float = 3600.0) -> Optional[Tuple[bool, str]]:
+        """
+        Answer an update check from the on-disk cache when the last real
+        check happened within `max_age` seconds. Returns (available,
+        version) like check_for_updates, or None when the cache is stale
+        and a live check is needed.
+        """
+        cache = self._load_update_cache()
+        version = cache.get('version')
+        if not version or time.time() - cache.get('checked_at', 0) > max_age:
+            return None
+        if self._compare_versions(version, self.current_version) > 0:
+            self._latest_version = version
+            self._update_available = True
+            return True, version
+        return False, self.current_version
+
+    def _github_headers(self) -> dict:
+        """Request headers, with token auth when GITHUB_TOKEN is set (5000/hr vs 60/hr)"""
+        headers = {'User-Agent': 'Wizard101BotSuite'}
+        token = os.environ.get('GITHUB_TOKEN')
+        if token:
+            headers['Authorization'] = f'Bearer {token}'
+        return headers
+
     def get_api_url(self) -> str:
         """Get GitHub API URL for releases"""
         return f"https://api.github.com/repos/{self.github_owner}/{self.github_repo}/releases/latest"
@@ -87,14 +229,34 @@ class AutoUpdater:
         self._log("[*] Checking for updates...")
         
         try:
-            # Try to get latest release info
-            version_url = self.get_raw_url(VERSION_FILE)
-            req = Request(version_url, headers={'User-Agent': 'Wizard101BotSuite'})
-            
-            with urlopen(req, timeout=10) as response:
-                data = json.loads(response.read().decode())
-                latest_version = data.get('version', CURRENT_VERSION)
-            
+            # Probe the releases API; it answers in one round-trip (no
+            # raw.githubusercontent hop), supports token auth, and hands us
+            # the zipball URL for the download step. The cached ETag makes an
+            # unchanged release come back as a bodyless 304 that GitHub does
+            # not count against the rate limit.
+            cache = self._load_update_cache()
+            req = Request(self.get_api_url(), headers=self._github_headers())
+            if cache.get('etag'):
+                req.add_header('If-None-Match', cache['etag'])
+
+            try:
+                with urlopen(req, timeout=10) as response:
+                    data = _parse_json_bytes(response.read())
+                    latest_version = data.get('tag_name', f"v{CURRENT_VERSION}").lstrip('v')
+                    self._download_url = data.get('zipball_url')
+                    etag = response.headers.get('ETag')
+                    if etag:
+                        self._save_update_cache(etag, latest_version)
+            except HTTPError as e:
+                if e.code == 304:
+                    # Not modified since last check: reuse the cached answer
+                    latest_version = cache.get('version', self.current_version)
+                elif e.code == 404:
+                    # No releases published yet; fall back to version.json
+                    latest_version = self._fetch_raw_version()
+                else:
+                    raise
+
             self._latest_version = latest_version
             
             if self._compare_versions(latest_version, self.current_version) > 0:
@@ -112,28 +274,111 @@ class AutoUpdater:
             self._log(f"[!] Update check error: {e}")
             return False, None
     
+    def _fetch_raw_version(self) -> str:
+        """Fetch version.json from the raw URL (pre-releases fallback)"""
+        req = Request(self.get_raw_url(VERSION_FILE),
+                      headers={'User-Agent': 'Wizard101BotSuite'})
+        with urlopen(req, timeout=10) as response:
+            data = _parse_json_bytes(response.read())
+            return data.get('version', CURRENT_VERSION)
+
     def _compare_versions(self, v1: str, v2: str) -> int:
         """
         Compare two version strings.
         Returns: 1 if v1 > v2, -1 if v1 < v2, 0 if equal
         """
-        try:
-            parts1 = [int(x) for x in v1.split('.')]
-            parts2 = [int(x) for x in v2.split('.')]
-            
-            for i in range(max(len(parts1), len(parts2))):
-                p1 = parts1[i] if i < len(parts1) else 0
-                p2 = parts2[i] if i < len(parts2) else 0
-                
-                if p1 > p2:
-                    return 1
-                elif p1 < p2:
-                    return -1
-            
-            return 0
-        except:
-            return 0
+        # packaging gives correct ordering for pre-release tags (1.0.0rc1);
+        # both parsers are memoized since polls re-compare the same strings
+        a, b = _version_key(v1), _version_key(v2)
+        if a is None or b is None:
+            a, b = _version_tuple(v1), _version_tuple(v2)
+        return (a > b) - (a < b)
     
+    def _probe_range_support(self, url: str) -> Optional[int]:
+        """
+        Return the total size when the server honors byte ranges, else None.
+        A 1-byte ranged GET doubles as the size probe: a 206 response carries
+        the full length in Content-Range.
+        """
+        try:
+            req = Request(url, headers={'User-Agent': 'Wizard101BotSuite',
+                                        'Range': 'bytes=0-0'})
+            with urlopen(req, timeout=10) as response:
+                if response.status != 206:
+                    return None
+                content_range = response.headers.get('Content-Range', '')
+                if '/' in content_range:
+                    return int(content_range.rsplit('/', 1)[1])
+        except Exception:
+            pass
+        return None
+
+    def _download_ranged(self, url: str, dest, total_size: int,
+                         progress_callback: Optional[Callable[[int, int], None]],
+                         workers: int = 8) -> int:
+        """
+        Download a file with parallel ranged requests. GitHub's CDN caps
+        per-connection bandwidth, so N slices on N connections finish much
+        sooner than one sequential GET for multi-MB archives.
+        dest is either a filesystem path or a preallocated bytearray.
+        """
+        slice_size = (total_size + workers - 1) // workers
+        buffer_size = max(8192, min(1024 * 1024, total_size // 100 or 1024 * 1024))
+        progress_lock = threading.Lock()
+        progress = {'downloaded': 0, 'last_reported': 0}
+
+        in_memory = isinstance(dest, bytearray)
+        view = memoryview(dest) if in_memory else None
+        if not in_memory:
+            # Pre-size the file so each worker can seek to its own offset
+            with open(dest, 'wb') as f:
+                f.truncate(total_size)
+
+        def note(nbytes: int):
+            report = None
+            with progress_lock:
+                progress['downloaded'] += nbytes
+                if progress['downloaded'] - progress['last_reported'] >= buffer_size:
+                    progress['last_reported'] = progress['downloaded']
+                    report = progress['downloaded']
+            if report is not None and progress_callback:
+                progress_callback(report, total_size)
+
+        def fetch(start: int, end: int):
+            req = Request(url, headers={'User-Agent': 'Wizard101BotSuite',
+                                        'Range': f'bytes={start}-{end}'})
+            with urlopen(req, timeout=60) as response:
+                if in_memory:
+                    pos = start
+                    while True:
+                        data = response.read(buffer_size)
+                        if not data:
+                            break
+                        view[pos:pos + len(data)] = data
+                        pos += len(data)
+                        note(len(data))
+                else:
+                    with open(dest, 'r+b') as f:
+                        f.seek(start)
+                        while True:
+                            data = response.read(buffer_size)
+                            if not data:
+                                break
+                            f.write(data)
+                            note(len(data))
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(fetch, start, min(start + slice_size, total_size) - 1)
+                for start in range(0, total_size, slice_size)
+            ]
+            for future in futures:
+                future.result()
+
+        if progress_callback:
+            progress_callback(progress['downloaded'], total_size)
+        return progress['downloaded']
+
     def download_update(self, progress_callback: Optional[Callable[[int, int], None]] = None) -> bool:
         """
         Download the latest version from GitHub.
@@ -146,94 +391,173 @@ class AutoUpdater:
         self._log("[*] Downloading update...")
         
         try:
-            zip_url = self.get_zip_url()
-            req = Request(zip_url, headers={'User-Agent': 'Wizard101BotSuite'})
-            
-            # Create temp directory
-            temp_dir = tempfile.mkdtemp()
-            zip_path = os.path.join(temp_dir, "update.zip")
-            
-            # Download
-            with urlopen(req, timeout=60) as response:
-                total_size = int(response.headers.get('content-length', 0))
-                downloaded = 0
-                
-                with open(zip_path, 'wb') as f:
-                    while True:
-                        chunk = response.read(8192)
-                        if not chunk:
-                            break
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        
-                        if progress_callback:
-                            progress_callback(downloaded, total_size)
+            # Prefer the release zipball reported by the API probe
+            zip_url = self._download_url or self.get_zip_url()
+
+            # Typical repo zips fit comfortably in RAM, so only oversized (or
+            # unsized) downloads touch a temp file at all
+            temp_dir = None
+            zip_source = None
+
+            # Split into parallel ranged requests when the server supports
+            # them (GitHub's codeload does); otherwise fall back to one GET
+            ranged_total = self._probe_range_support(zip_url)
+            if ranged_total and ranged_total > 4 * 1024 * 1024:
+                if ranged_total < MAX_IN_MEMORY_ZIP:
+                    buf = bytearray(ranged_total)
+                    downloaded = self._download_ranged(
+                        zip_url, buf, ranged_total, progress_callback)
+                    zip_source = io.BytesIO(buf)
+                else:
+                    temp_dir = tempfile.mkdtemp()
+                    zip_source = os.path.join(temp_dir, "update.zip")
+                    downloaded = self._download_ranged(
+                        zip_url, zip_source, ranged_total, progress_callback)
+            else:
+                req = Request(zip_url, headers={'User-Agent': 'Wizard101BotSuite'})
+                with urlopen(req, timeout=60) as response:
+                    total_size = int(response.headers.get('content-length', 0))
+
+                    # Adaptive read size: roughly 1% of the archive per read,
+                    # clamped to 8 KiB-1 MiB so tiny responses still use small
+                    # buffers while big zips don't do thousands of recv calls
+                    buffer_size = max(8192, min(1024 * 1024, total_size // 100 or 1024 * 1024))
+                    downloaded = 0
+                    last_reported = 0
+
+                    in_memory = 0 < total_size < MAX_IN_MEMORY_ZIP
+                    if in_memory:
+                        sink = io.BytesIO()
+                    else:
+                        temp_dir = tempfile.mkdtemp()
+                        zip_source = os.path.join(temp_dir, "update.zip")
+                        sink = open(zip_source, 'wb')
+
+                    try:
+                        while True:
+                            chunk = response.read(buffer_size)
+                            if not chunk:
+                                break
+                            sink.write(chunk)
+                            downloaded += len(chunk)
+
+                            # Throttled: at most ~100 GUI updates per download
+                            if progress_callback and downloaded - last_reported >= buffer_size:
+                                last_reported = downloaded
+                                progress_callback(downloaded, total_size)
+                    finally:
+                        if not in_memory:
+                            sink.close()
+
+                    if in_memory:
+                        sink.seek(0)
+                        zip_source = sink
+
+                    if progress_callback:
+                        progress_callback(downloaded, total_size)
             
             self._log(f"[+] Downloaded {downloaded} bytes")
-            
-            # Extract
-            self._log("[*] Extracting update...")
-            extract_dir = os.path.join(temp_dir, "extracted")
-            
-            with zipfile.ZipFile(zip_path, 'r') as z:
-                z.extractall(extract_dir)
-            
-            # Find the extracted folder (GitHub adds repo-branch suffix)
-            extracted_folders = os.listdir(extract_dir)
-            if not extracted_folders:
-                raise Exception("No files extracted")
-            
-            source_dir = os.path.join(extract_dir, extracted_folders[0])
-            
-            # Apply update
-            return self._apply_update(source_dir)
-            
+
+            # Apply straight from the archive
+            applied = self._apply_update(zip_source)
+            if temp_dir:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+            return applied
+
         except Exception as e:
             self._log(f"[X] Download failed: {e}")
             return False
-    
-    def _apply_update(self, source_dir: str) -> bool:
+
+    def _apply_update(self, zip_source) -> bool:
         """
-        Apply the downloaded update.
-        Copies new files over existing ones.
+        Stream the whitelisted items straight out of the zip into the install
+        directory. GitHub archives prefix every entry with repo-branch/, and
+        we only ship three top-level items, so extractall into a temp dir
+        would write everything to disk twice.
+        zip_source is a filesystem path or a seekable file object (BytesIO).
         """
         self._log("[*] Applying update...")
-        
+
         try:
             # Files/folders to update
-            items_to_update = [
+            items_to_update = (
                 "wizard101_bot",
                 "run.py",
                 "version.json",
-            ]
-            
+            )
+
             current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            
-            for item in items_to_update:
-                src = os.path.join(source_dir, item)
-                dst = os.path.join(current_dir, item)
-                
-                if os.path.exists(src):
-                    if os.path.isdir(src):
-                        # Remove existing directory
-                        if os.path.exists(dst):
-                            shutil.rmtree(dst)
-                        shutil.copytree(src, dst)
-                        self._log(f"    Updated folder: {item}")
-                    else:
-                        shutil.copy2(src, dst)
-                        self._log(f"    Updated file: {item}")
-            
+            updated = set()
+
+            with zipfile.ZipFile(zip_source, 'r') as z:
+                names = z.namelist()
+                if not names:
+                    raise Exception("Empty update archive")
+
+                # GitHub archives share a single repo-branch/ root; derive it
+                # once instead of splitting every entry
+                prefix = names[0].split('/', 1)[0] + '/'
+                plen = len(prefix)
+
+                file_jobs = []
+                for info in z.infolist():
+                    name = info.filename
+                    if not name.startswith(prefix) or len(name) <= plen:
+                        continue
+                    rel_path = name[plen:].rstrip('/')
+                    top = rel_path.split('/', 1)[0]
+                    if top not in items_to_update:
+                        continue
+
+                    # First sighting of an updated item: clear the old tree
+                    # so files deleted upstream don't linger. Zipballs list
+                    # the bare directory entry first, so this must fire for
+                    # it too; isdir keeps plain files (run.py) untouched
+                    if top not in updated:
+                        updated.add(top)
+                        existing = os.path.join(current_dir, top)
+                        if os.path.isdir(existing):
+                            shutil.rmtree(existing)
+
+                    dst = os.path.join(current_dir, *rel_path.split('/'))
+                    if info.is_dir():
+                        os.makedirs(dst, exist_ok=True)
+                        continue
+                    os.makedirs(os.path.dirname(dst), exist_ok=True)
+                    file_jobs.append((info.filename, dst))
+
+                # Deflate decompression is CPU-bound under the GIL. When the
+                # archive sits on disk (the oversized-download path) and has
+                # enough members to matter, fan the extraction out to worker
+                # processes, each opening the zip independently. In-memory
+                # archives stay sequential: pickling the whole buffer to each
+                # worker would cost more than the decompression saves.
+                if isinstance(zip_source, str) and len(file_jobs) >= 8:
+                    workers = max(1, (os.cpu_count() or 2) // 2)
+                    with ProcessPoolExecutor(max_workers=workers) as pool:
+                        futures = [
+                            pool.submit(_extract_zip_member, zip_source, member, dst)
+                            for member, dst in file_jobs
+                        ]
+                        for future in futures:
+                            future.result()
+                else:
+                    for member, dst in file_jobs:
+                        _stream_member(z, member, dst)
+
+            for item in sorted(updated):
+                self._log(f"    Updated: {item}")
+
             # Update version
             if self._latest_version:
                 self._save_current_version(self._latest_version)
                 self.current_version = self._latest_version
-            
+
             self._log("[+] Update applied successfully!")
             self._log("[!] Please restart the application.")
-            
+
             return True
-            
+
         except Exception as e:
             self._log(f"[X] Failed to apply update: {e}")
             return False
@@ -244,19 +568,23 @@ class AutoUpdater:
         
         Args:
             callback: Called with (update_applied, message)
+
+        Returns the Future so a pending check can be cancelled.
         """
         def _run():
             available, version = self.check_for_updates()
-            
+
             if available:
                 if callback:
                     callback(False, f"Update available: {version}")
             else:
                 if callback:
                     callback(False, f"Up to date: v{self.current_version}")
-        
-        thread = threading.Thread(target=_run, daemon=True)
-        thread.start()
+
+        return self._executor.submit(_run)
+
+
+atexit.register(AutoUpdater._executor.shutdown, wait=False)
 
 # Global instance
 updater = AutoUpdater()